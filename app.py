@@ -1 +1,123 @@
-import os
\ No newline at end of file
+import os
+import pandas as pd
+from flask import Flask, render_template, request, jsonify, make_response
+from mlProject.pipeline.prediction import PredictionPipeline
+from mlProject.components.model_pool import UnknownModelError
+from mlProject.utils import payloads
+
+
+app = Flask(__name__)
+prediction_pipeline = PredictionPipeline()
+
+
+@app.route("/", methods=["GET"])
+def home_page():
+    return render_template("index.html")
+
+
+@app.route("/train", methods=["GET"])
+def training():
+    os.system("python main.py")
+    return "Training Successful!"
+
+
+@app.route("/predict", methods=["POST"])
+@app.route("/predict/<model_name>", methods=["POST"])
+def predict(model_name=None):
+    """
+    Predicts on a JSON payload (one object of feature values or a list of them) or, for
+    large batches, on a binary payload selected by Content-Type: an `.npy` float matrix
+    with the columns in schema order (application/x-npy) or an Arrow IPC stream
+    (application/vnd.apache.arrow.stream). Predictions are returned as JSON unless the
+    Accept header asks for one of the binary formats.
+
+    `/predict/<model_name>` predicts with that model of the model pool (e.g. one per
+    dataset), loading it on first use; `/predict` uses the default model.
+    """
+    trace = prediction_pipeline.tracer.start_trace("POST /predict", request.headers.get("traceparent"),
+                                                   model_name=model_name or "default")
+    status_code = 500
+    try:
+        response = _predict(trace, model_name)
+        status_code = response.status_code
+    finally:
+        # An unexpected error still ends the trace (as a 500) before Flask handles it.
+        trace.end(**{"http.status_code": status_code})
+    if trace.sampled:
+        response.headers["X-Trace-Id"] = trace.trace_id
+    return response
+
+
+def _predict(trace, model_name):
+    accept = request.accept_mimetypes
+    # Checked before predicting, so a client that can only take Arrow gets a 406 instead of a 500.
+    if accept.best == payloads.ARROW_CONTENT_TYPE and not payloads.arrow_available():
+        return make_response(jsonify({"error": "Arrow responses require pyarrow on the server."}), 406)
+
+    content_type = request.mimetype
+    if content_type in (payloads.NPY_CONTENT_TYPE, payloads.ARROW_CONTENT_TYPE):
+        decode = payloads.decode_npy if content_type == payloads.NPY_CONTENT_TYPE else payloads.decode_arrow
+        with trace.span("payload_decode", content_type=content_type):
+            try:
+                data = decode(request.get_data(cache=False), prediction_pipeline.feature_columns)
+            except ValueError as e:
+                return make_response(jsonify({"error": str(e)}), 400)
+            except ImportError as e:
+                return make_response(jsonify({"error": str(e)}), 415)
+    else:
+        with trace.span("json_parse"):
+            payload = request.get_json(silent=True)
+            if payload is None:
+                return make_response(jsonify({"error": "Request body must be JSON."}), 400)
+            rows = payload if isinstance(payload, list) else [payload]
+            if not rows:
+                return make_response(jsonify({"error": "The request has no rows."}), 400)
+            data = pd.DataFrame(rows)
+
+    try:
+        predictions, model_version = prediction_pipeline.predict(data, trace, model_name)
+    except UnknownModelError as e:
+        return make_response(jsonify({"error": str(e)}), 404)
+    except KeyError as e:
+        return make_response(jsonify({"error": f"Missing feature columns: {e}"}), 400)
+    except RuntimeError as e:
+        return make_response(jsonify({"error": str(e)}), 503)
+
+    with trace.span("serialization"):
+        if accept.best in (payloads.NPY_CONTENT_TYPE, payloads.ARROW_CONTENT_TYPE):
+            if accept.best == payloads.NPY_CONTENT_TYPE:
+                response = make_response(payloads.encode_npy(predictions))
+            else:
+                response = make_response(payloads.encode_arrow(predictions, model_version))
+            response.mimetype = accept.best
+            response.headers["X-Model-Version"] = str(model_version)
+            return response
+        return jsonify({"predictions": predictions.ravel().tolist(), "model_version": model_version})
+
+
+@app.route("/cache/stats", methods=["GET"])
+def cache_stats():
+    if prediction_pipeline.prediction_cache is None:
+        return jsonify({"enabled": False})
+    return jsonify({"enabled": True, **prediction_pipeline.prediction_cache.stats()})
+
+
+@app.route("/models/stats", methods=["GET"])
+def model_pool_stats():
+    """
+    Loaded models of the model pool, with per-model hit rates and load latency.
+    """
+    return jsonify(prediction_pipeline.model_pool.stats())
+
+
+@app.route("/trace/histogram", methods=["GET"])
+def trace_histogram():
+    """
+    Per-span latency histogram of the sampled /predict requests.
+    """
+    return jsonify({"sample_rate": prediction_pipeline.tracer.config.sample_rate,
+                    "spans": prediction_pipeline.tracer.histogram()})
+
+
+if __name__ == "__main__":
+    app.run(host="0.0.0.0", port=8080)
@@ -0,0 +1,44 @@
+import argparse
+import dataclasses
+import json
+import logging
+from mlProject.utils.logging_utils import setup_logging
+from mlProject.config.configuration import ConfigurationManager
+from mlProject.components.batch_scorer import BatchScorer
+
+
+STAGE_NAME = "Batch Scoring"
+
+
+# Guarded: worker processes started with "spawn" re-import this module.
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score a large CSV or Parquet file with the trained model, chunk by chunk.")
+    parser.add_argument("input", help="CSV (optionally compressed) or Parquet file with the schema feature columns.")
+    parser.add_argument("output", help="File the predictions are written to; .parquet writes Parquet, anything else CSV.")
+    parser.add_argument("--model-path", help="Model file to score with (overrides batch_scoring.model_path).")
+    parser.add_argument("--chunk-size", type=int, help="Rows per chunk.")
+    parser.add_argument("--workers", type=int, help="Number of worker processes.")
+    parser.add_argument("--passthrough", nargs="*", metavar="COLUMN", help="Input columns copied to the output, e.g. a row ID.")
+    args = parser.parse_args()
+
+    setup_logging("batch_scoring.log")
+
+    try:
+        logging.info(f">>>>>> {STAGE_NAME} started <<<<<<")
+        batch_scoring_config = ConfigurationManager().get_batch_scoring_config()
+        overrides = {
+            "model_path": args.model_path,
+            "chunk_size": args.chunk_size,
+            "max_workers": args.workers,
+            "passthrough_columns": args.passthrough,
+        }
+        batch_scoring_config = dataclasses.replace(
+            batch_scoring_config, **{key: value for key, value in overrides.items() if value is not None}
+        )
+
+        report = BatchScorer(config=batch_scoring_config).run(args.input, args.output)
+        print(json.dumps(report, indent=4))
+        logging.info(f">>>>>> {STAGE_NAME} completed <<<<<<\n\nx==========x")
+    except Exception as e:
+        logging.exception(e)
+        raise e
@@ -0,0 +1,93 @@
+"""
+Compare joblib compression codecs for the trained model: file size, save time,
+load time and (for uncompressed files) memory-mapped load time.
+
+By default the model at artifacts/model_trainer/model.joblib is used. Pass
+--random-forest to benchmark an array-heavy RandomForestRegressor fitted on
+random data instead, which is where codec and mmap choices matter most.
+
+Usage:
+    python benchmarks/joblib_persistence_benchmark.py [--random-forest] [--output artifacts/benchmarks/joblib.json]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import statistics
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from mlProject.utils.common import save_joblib, load_joblib, get_joblib_compression  # noqa: E402
+
+
+CODECS = [("none", 0), ("zlib", 1), ("zlib", 3), ("gzip", 3), ("bz2", 3), ("lzma", 3), ("lz4", 3)]
+
+
+def build_random_forest():
+    import numpy as np
+    from sklearn.ensemble import RandomForestRegressor
+
+    rng = np.random.default_rng(42)
+    X = rng.normal(size=(50_000, 11))
+    y = X @ rng.normal(size=11) + rng.normal(scale=0.5, size=50_000)
+    return RandomForestRegressor(n_estimators=100, max_depth=12, n_jobs=-1, random_state=42).fit(X, y)
+
+
+def time_it(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def benchmark(model, repeat: int) -> list:
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for codec, level in CODECS:
+            if codec == "lz4":
+                try:
+                    import lz4  # noqa: F401
+                except ImportError:
+                    print("lz4 is not installed; skipping.")
+                    continue
+
+            path = Path(tmp_dir) / f"model_{codec}_{level}.joblib"
+            compress = get_joblib_compression(codec, level)
+            result = {
+                "codec": codec,
+                "level": level if codec != "none" else None,
+                "save_ms": time_it(lambda: save_joblib(path, model, compress=compress), repeat),
+                "size_kb": os.path.getsize(path) / 1024,
+                "load_ms": time_it(lambda: load_joblib(path), repeat),
+            }
+            if codec == "none":
+                result["load_mmap_ms"] = time_it(lambda: load_joblib(path, mmap_mode="r"), repeat)
+            results.append(result)
+            print(f"{codec:>5} {str(result['level'] or ''):>2}  size {result['size_kb']:10.1f} KB   "
+                  f"save {result['save_ms']:8.1f} ms   load {result['load_ms']:8.1f} ms"
+                  + (f"   mmap load {result['load_mmap_ms']:8.1f} ms" if "load_mmap_ms" in result else ""))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark joblib codecs for model persistence.")
+    parser.add_argument("--model", default="artifacts/model_trainer/model.joblib", help="Model file to benchmark.")
+    parser.add_argument("--random-forest", action="store_true", help="Benchmark a synthetic random forest instead.")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per measurement (median is reported).")
+    parser.add_argument("--output", default="artifacts/benchmarks/joblib_persistence.json", help="Where to write the JSON report.")
+    args = parser.parse_args()
+
+    model = build_random_forest() if args.random_forest else load_joblib(Path(args.model))
+    results = benchmark(model, args.repeat)
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({"model": "random_forest" if args.random_forest else args.model,
+                                  "results": results}, indent=4), encoding="utf-8")
+    print(f"Report written to {output}")
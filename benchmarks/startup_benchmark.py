@@ -0,0 +1,90 @@
+"""
+Measure cold-start cost of the project's entry points.
+
+Each target is run in a fresh interpreter under `python -X importtime`, several
+times. The report gives the median wall time, the total import time and the
+slowest modules by self time, and is written as JSON so runs can be compared.
+
+Usage:
+    python benchmarks/startup_benchmark.py [--repeat 5] [--output artifacts/benchmarks/startup.json]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+TARGETS = {
+    "main.py --help": [str(ROOT_DIR / "main.py"), "--help"],
+    "import mlProject.pipeline": ["-c", "import mlProject.pipeline"],
+    "import stage_04_model_trainer": ["-c", "import mlProject.pipeline.stage_04_model_trainer"],
+    "import serving (mlProject.pipeline.prediction)": ["-c", "import mlProject.pipeline.prediction"],
+}
+
+
+def parse_importtime(stderr: str) -> tuple:
+    """
+    Parses `-X importtime` output.
+
+    Returns:
+        tuple: (total import time in ms, list of (module, self ms, cumulative ms)).
+    """
+    modules = []
+    total_us = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.append((name.strip(), int(self_us) / 1000, int(cumulative_us) / 1000))
+        # Top-level imports are the ones without indentation; their cumulative times add up to the total.
+        if not name[1:].startswith(" "):
+            total_us += int(cumulative_us)
+    return total_us / 1000, modules
+
+
+def benchmark(command: list, repeat: int) -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT_DIR / "src"), env.get("PYTHONPATH")]))
+
+    wall_times, import_times, runs = [], [], []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = subprocess.run([sys.executable, "-X", "importtime", *command],
+                                cwd=ROOT_DIR, env=env, capture_output=True, text=True)
+        wall_times.append((time.perf_counter() - started) * 1000)
+        if result.returncode != 0:
+            raise RuntimeError(f"{command} failed:\n{result.stderr[-2000:]}")
+        total_ms, modules = parse_importtime(result.stderr)
+        import_times.append(total_ms)
+        runs.append(modules)
+
+    slowest = sorted(runs[-1], key=lambda module: module[1], reverse=True)[:15]
+    return {
+        "wall_ms_median": statistics.median(wall_times),
+        "import_ms_median": statistics.median(import_times),
+        "modules_imported": len(runs[-1]),
+        "slowest_modules_self_ms": [{"module": name, "self_ms": self_ms, "cumulative_ms": cumulative_ms}
+                                    for name, self_ms, cumulative_ms in slowest],
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark import time of the pipeline and serving entry points.")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreter runs per target.")
+    parser.add_argument("--output", default="artifacts/benchmarks/startup.json", help="Where to write the JSON report.")
+    args = parser.parse_args()
+
+    report = {name: benchmark(command, args.repeat) for name, command in TARGETS.items()}
+    for name, result in report.items():
+        print(f"{name:<50} wall {result['wall_ms_median']:8.1f} ms   imports {result['import_ms_median']:8.1f} ms")
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({"python": sys.version, "targets": report}, indent=4), encoding="utf-8")
+    print(f"Report written to {output}")
@@ -1,62 +1,80 @@
-from mlProject.utils.logging_utils import setup_logging
-from mlProject.pipeline.stage_01_ingestion import DataIngestionTrainingPipeline
-from mlProject.pipeline.stage_02_data_validation import DataValidationTrainingPipeline
-from mlProject.pipeline.stage_03_data_transformation import DataTransformationTrainingPipeline
-from mlProject.pipeline.stage_04_model_trainer import ModelTrainerTrainingPipeline
+import argparse
 import logging
+from mlProject.utils.logging_utils import setup_logging
+from mlProject.entity.artifact_entity import ArtifactContext
+import mlProject.pipeline as pipeline
+
+
+# stage key -> (STAGE_NAME, log file, pipeline class). Pipeline modules are imported
+# lazily, so a single-stage run or `--help` does not pay for pandas/sklearn up front.
+STAGES = {
+    "ingestion": ("Data Ingestion Stage", "stage1_ingestion.log", "DataIngestionTrainingPipeline"),
+    "validation": ("Data Validation Stage", "stage2_data_validation.log", "DataValidationTrainingPipeline"),
+    "transformation": ("Data Transformation Stage", "stage3_data_transformation.log", "DataTransformationTrainingPipeline"),
+    "training": ("Model Trainer stage", "stage4_model_training.log", "ModelTrainerTrainingPipeline"),
+    "evaluation": ("Model Evaluation stage", "stage5_model_evaluation.log", "ModelEvaluationTrainingPipeline"),
+    # Not part of the default run; select them with `--stage sweep` / `--stage cv`.
+    "sweep": ("Hyperparameter Sweep stage", "stage_hyperparameter_sweep.log", "HyperparameterSweepTrainingPipeline"),
+    "cv": ("Cross Validation stage", "stage_cross_validation.log", "CrossValidationTrainingPipeline"),
+    # Replaces ingestion, validation and transformation with `--streaming`.
+    "streaming": ("Streaming Ingestion Stage", "stage_streaming_ingestion.log", "StreamingTrainingPipeline"),
+}
 
+DEFAULT_STAGES = ["ingestion", "validation", "transformation", "training", "evaluation"]
+STREAMED_STAGES = ["ingestion", "validation", "transformation"]
 
-# ----------- Data Ingestion Stage -----------
-STAGE_NAME = "Data Ingestion Stage"
-setup_logging("stage1_ingestion.log")  # GLOBAL logging for this stage
-
-try:
-    logging.info(f">>>>> {STAGE_NAME} started <<<<<<")
-    pipeline = DataIngestionTrainingPipeline()
-    pipeline.main()
-    logging.info(f">>>>> {STAGE_NAME} completed <<<<<<\n\nX============X")
-except Exception as e:
-    logging.error(f"Error in {STAGE_NAME}: {e}")
-    raise e
-
-
-# ----------- Data Validation Stage -----------
-STAGE_NAME = "Data Validation Stage"
-setup_logging("stage2_data_validation.log")  # GLOBAL logging for this stage
-
-try:
-    logging.info(f">>>>> {STAGE_NAME} started <<<<<<")
-    obj = DataValidationTrainingPipeline()
-    obj.main()
-    logging.info(f">>>>> {STAGE_NAME} completed <<<<<<\n\nx==========x")
-except Exception as e:
-    logging.error(f"Error in {STAGE_NAME}: {e}")
-    raise e
-
-
-# ----------- Data Validation Stage -----------
-
-STAGE_NAME = "Data Transformation Stage"
-setup_logging("stage3_data_transformation.log")  # GLOBAL logging for this stage
-
-try:
-    logging.info(f">>>>>> {STAGE_NAME} started <<<<<<")
-    obj = DataTransformationTrainingPipeline()
-    obj.main()
-    logging.info(f">>>>>> {STAGE_NAME} completed <<<<<<\n\nx==========x")
-except Exception as e:
-    logging.exception(e)
-    raise e
-
-# ---------------Model Training --------------------------------
-STAGE_NAME = "Model Trainer stage"
-setup_logging("stage4_model_training.log")
-try:
-   logging.info(f">>>>>> {STAGE_NAME} started <<<<<<") 
-   data_ingestion = ModelTrainerTrainingPipeline()
-   data_ingestion.main()
-   logging.info(f">>>>>> {STAGE_NAME} completed <<<<<<\n\nx==========x")
-except Exception as e:
+
+def run_stage(stage: str, context: ArtifactContext = None):
+    STAGE_NAME, log_filename, pipeline_class = STAGES[stage]
+    setup_logging(log_filename)  # GLOBAL logging for this stage
+
+    try:
+        logging.info(f">>>>>> {STAGE_NAME} started <<<<<<")
+        # Ingestion only downloads and extracts; every later stage reads data and takes the context.
+        kwargs = {} if stage == "ingestion" else {"context": context}
+        obj = getattr(pipeline, pipeline_class)(**kwargs)
+        obj.main()
+        logging.info(f">>>>>> {STAGE_NAME} completed <<<<<<\n\nx==========x")
+    except Exception as e:
         logging.exception(e)
         raise e
 
+
+def run_datasets(datasets: list):
+    STAGE_NAME = "Multi-Dataset Training stage"
+    setup_logging("stage_multi_dataset_training.log")
+
+    try:
+        logging.info(f">>>>>> {STAGE_NAME} started <<<<<<")
+        obj = pipeline.MultiDatasetTrainingPipeline(datasets=datasets)
+        obj.main()
+        logging.info(f">>>>>> {STAGE_NAME} completed <<<<<<\n\nx==========x")
+    except Exception as e:
+        logging.exception(e)
+        raise e
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the training pipeline.")
+    parser.add_argument("--stage", choices=list(STAGES), action="append",
+                        help="Run only this stage (repeatable). Defaults to every training stage, in order.")
+    parser.add_argument("--datasets", nargs="*", metavar="NAME",
+                        help="Run ingestion, then validation/transformation/training for each named dataset "
+                             "(all configured datasets if no names are given) in parallel.")
+    parser.add_argument("--streaming", action="store_true",
+                        help="Run ingestion, validation and the train/test split as one pipelined pass over "
+                             "blocks of the data file, then the remaining stages.")
+    args = parser.parse_args()
+
+    if args.datasets is not None:
+        run_stage("ingestion")
+        run_datasets(args.datasets)
+    else:
+        # One context for the whole run: each stage hands its DataFrames and the validation
+        # status to the next in memory, while still writing them to disk.
+        context = ArtifactContext()
+        stages = args.stage or DEFAULT_STAGES
+        if args.streaming:
+            stages = ["streaming"] + [stage for stage in stages if stage not in STREAMED_STAGES + ["streaming"]]
+        for stage in stages:
+            run_stage(stage, context)
@@ -0,0 +1,50 @@
+import argparse
+import dataclasses
+import json
+import logging
+from mlProject.utils.logging_utils import setup_logging
+from mlProject.config.configuration import ConfigurationManager
+from mlProject.components.load_tester import LoadTester
+
+
+STAGE_NAME = "Load Test"
+
+
+# Guarded: importing the module (e.g. during test collection) must not parse sys.argv.
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the prediction service and report latency percentiles.")
+    parser.add_argument("--in-process", action="store_true", help="Drive app.py through a Flask test client instead of over HTTP.")
+    parser.add_argument("--url", help="URL of the /predict endpoint (overrides load_test.target_url).")
+    parser.add_argument("--concurrency", type=int, help="Number of concurrent workers.")
+    parser.add_argument("--rate", type=float, help="Requests per second for an open-loop run; 0 runs closed-loop.")
+    parser.add_argument("--duration", type=float, help="Length of the run in seconds.")
+    parser.add_argument("--batch-size", type=int, help="Rows per request.")
+    parser.add_argument("--label", default="", help="Name stored in the report, e.g. the model version under test.")
+    args = parser.parse_args()
+
+    setup_logging("load_test.log")
+
+    try:
+        logging.info(f">>>>>> {STAGE_NAME} started <<<<<<")
+        load_test_config = ConfigurationManager().get_load_test_config()
+        overrides = {
+            "target_url": args.url,
+            "concurrency": args.concurrency,
+            "rate": args.rate,
+            "duration": args.duration,
+            "batch_size": args.batch_size,
+        }
+        load_test_config = dataclasses.replace(
+            load_test_config, **{key: value for key, value in overrides.items() if value is not None}
+        )
+
+        app = None
+        if args.in_process:
+            from app import app
+
+        report = LoadTester(config=load_test_config, app=app).run(label=args.label)
+        print(json.dumps(report, indent=4))
+        logging.info(f">>>>>> {STAGE_NAME} completed <<<<<<\n\nx==========x")
+    except Exception as e:
+        logging.exception(e)
+        raise e
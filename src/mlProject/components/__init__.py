@@ -0,0 +1,38 @@
+"""
+Components are exported lazily (PEP 562) so that importing one component does not
+pull in the heavy dependencies (pandas, sklearn, joblib) of all the others.
+"""
+import importlib
+
+_LAZY_EXPORTS = {
+    "DataIngestion": "mlProject.components.data_ingestion",
+    "IncrementalIngestion": "mlProject.components.incremental_ingestion",
+    "StreamingPipeline": "mlProject.components.streaming_pipeline",
+    "DataValidation": "mlProject.components.data_validation",
+    "DataTransformation": "mlProject.components.data_transformation",
+    "ModelTrainer": "mlProject.components.model_trainer",
+    "ModelEvaluation": "mlProject.components.model_evaluation",
+    "GramCrossValidator": "mlProject.components.cross_validation",
+    "SuccessiveHalvingSweep": "mlProject.components.hyperparameter_sweep",
+    "ModelServer": "mlProject.components.model_server",
+    "ModelPool": "mlProject.components.model_pool",
+    "PredictionCache": "mlProject.components.prediction_cache",
+    "Tracer": "mlProject.components.tracer",
+    "LoadTester": "mlProject.components.load_tester",
+    "BatchScorer": "mlProject.components.batch_scorer",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,226 @@
+import os
+import time
+import logging
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from mlProject.entity.config_entity import BatchScoringConfig
+from mlProject.utils.common import save_json, load_joblib
+from mlProject.utils.logging_utils import get_worker_log_queue, setup_worker_logging, get_run_id
+from mlProject.utils.resources import allocate_cores, init_worker_threads
+
+
+PARQUET_SUFFIXES = (".parquet", ".pq")
+
+# Filled once per worker process by `_init_worker`, so the model is not re-sent with every chunk.
+_worker_state = {}
+
+
+def _is_parquet(path) -> bool:
+    return Path(path).suffix.lower() in PARQUET_SUFFIXES
+
+
+def _import_pyarrow_parquet():
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Reading or writing Parquet files requires pyarrow: pip install pyarrow") from e
+    return pq
+
+
+def _init_worker(model_path: str, feature_columns: list, log_queue, run_id: str, threads: int = 1):
+    setup_worker_logging(log_queue, stage="Batch Scoring", run_id=run_id)
+    init_worker_threads(threads)
+    _worker_state["model"] = load_joblib(Path(model_path), verify_checksum=True)
+    _worker_state["feature_columns"] = feature_columns
+
+
+def _score_chunk(features: np.ndarray) -> np.ndarray:
+    # Rebuild the frame around the array so the model sees the feature names it was fitted with.
+    frame = pd.DataFrame(features, columns=_worker_state["feature_columns"], copy=False)
+    return np.asarray(_worker_state["model"].predict(frame))
+
+
+class BatchScorer:
+    """
+    A class that scores large CSV or Parquet files with the trained model without
+    loading them into memory.
+
+    Process:
+        1. Checks the input header against the feature columns of schema.yaml.
+        2. Reads the input in chunks of `chunk_size` rows, only the feature and passthrough columns.
+        3. Sends each chunk's features to a process pool whose workers load the model once.
+        4. Writes predictions as soon as the oldest chunk is done, so the output keeps the input
+           order and at most `max_pending_chunks` chunks are held in memory.
+
+    The output is written to a temporary file and moved into place when every chunk has been
+    scored, so a failed run never leaves a partial output behind.
+
+    Attributes:
+        config (BatchScoringConfig): Model path, schema columns and chunking/parallelism settings.
+    """
+
+    def __init__(self, config: BatchScoringConfig):
+        self.config = config
+
+    def _validate_columns(self, input_path: Path):
+        if _is_parquet(input_path):
+            columns = _import_pyarrow_parquet().ParquetFile(input_path).schema_arrow.names
+        else:
+            columns = pd.read_csv(input_path, nrows=0).columns
+
+        required = list(self.config.feature_columns) + list(self.config.passthrough_columns)
+        missing = [column for column in required if column not in columns]
+        if missing:
+            raise ValueError(f"Input file {input_path} is missing columns {missing}.")
+
+    def _read_chunks(self, input_path: Path):
+        columns = list(self.config.feature_columns) + list(self.config.passthrough_columns)
+        if _is_parquet(input_path):
+            parquet_file = _import_pyarrow_parquet().ParquetFile(input_path)
+            for batch in parquet_file.iter_batches(batch_size=self.config.chunk_size, columns=columns):
+                yield batch.to_pandas()
+        else:
+            # Features are parsed straight into the model's dtype; a non-numeric value fails here.
+            dtypes = {column: self.config.feature_dtype for column in self.config.feature_columns}
+            first_row = 0
+            with pd.read_csv(input_path, usecols=columns, dtype=dtypes, chunksize=self.config.chunk_size) as reader:
+                while True:
+                    try:
+                        chunk = next(reader)
+                    except StopIteration:
+                        return
+                    except ValueError as e:
+                        raise ValueError(f"Non-numeric feature values in rows "
+                                         f"{first_row}-{first_row + self.config.chunk_size - 1}: {e}") from e
+                    first_row += len(chunk)
+                    yield chunk
+
+    def _features(self, chunk: pd.DataFrame, first_row: int) -> np.ndarray:
+        try:
+            features = chunk[self.config.feature_columns].to_numpy(dtype=self.config.feature_dtype)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Non-numeric feature values in rows {first_row}-{first_row + len(chunk) - 1}: {e}") from e
+
+        invalid_rows = np.flatnonzero(~np.isfinite(features).all(axis=1))
+        if len(invalid_rows):
+            raise ValueError(f"Missing or infinite feature values in {len(invalid_rows)} rows, "
+                             f"first at row {first_row + int(invalid_rows[0])}.")
+        return features
+
+    def _write_chunk(self, writer: dict, output_path: Path, chunk: pd.DataFrame, is_parquet: bool):
+        if is_parquet:
+            import pyarrow as pa
+
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer.get("parquet") is None:
+                writer["parquet"] = _import_pyarrow_parquet().ParquetWriter(output_path, table.schema)
+            writer["parquet"].write_table(table)
+        else:
+            if writer.get("csv") is None:
+                writer["csv"] = open(output_path, "w", encoding="utf-8", newline="")
+                chunk.to_csv(writer["csv"], index=False)
+            else:
+                chunk.to_csv(writer["csv"], index=False, header=False)
+
+    def run(self, input_path: Path, output_path: Path) -> dict:
+        """
+        Scores `input_path` and writes the predictions to `output_path`, one row per input row.
+
+        The output holds the passthrough columns followed by a `prediction` column; its format
+        (CSV or Parquet) follows the file extension. A report is written under `root_dir`.
+
+        Args:
+            input_path (Path): CSV (optionally compressed) or Parquet file to score.
+            output_path (Path): File the predictions are written to.
+
+        Raises:
+            ValueError: If a feature column is missing or a chunk holds non-numeric or missing values.
+
+        Returns:
+            dict: Row and chunk counts, duration and throughput of the run.
+        """
+        input_path, output_path = Path(input_path), Path(output_path)
+        self._validate_columns(input_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+        # Decided by the real output path: the temporary file's suffix is always .tmp.
+        is_parquet = _is_parquet(output_path)
+        if is_parquet:
+            _import_pyarrow_parquet()
+
+        allocation = allocate_cores("Batch scoring", self.config.max_workers, total_cores=self.config.total_cores)
+        logging.info(f"Scoring {input_path} -> {output_path} in chunks of {self.config.chunk_size} rows "
+                     f"over {allocation.workers} worker processes.")
+
+        rows = chunks = 0
+        writer = {}
+        pending = deque()
+        started = last_report = time.perf_counter()
+
+        def write_oldest():
+            nonlocal rows, chunks, last_report
+            future, passthrough = pending.popleft()
+            passthrough["prediction"] = future.result()
+            self._write_chunk(writer, tmp_path, passthrough, is_parquet)
+            rows += len(passthrough)
+            chunks += 1
+
+            now = time.perf_counter()
+            if now - last_report >= self.config.report_interval:
+                logging.info(f"Scored {rows} rows in {chunks} chunks ({rows / (now - started):.0f} rows/s).")
+                last_report = now
+
+        try:
+            with ProcessPoolExecutor(max_workers=allocation.workers,
+                                     initializer=_init_worker,
+                                     initargs=(str(self.config.model_path), list(self.config.feature_columns),
+                                               get_worker_log_queue(), get_run_id(),
+                                               allocation.threads_per_worker)) as executor:
+                first_row = 0
+                for chunk in self._read_chunks(input_path):
+                    features = self._features(chunk, first_row)
+                    passthrough = chunk[list(self.config.passthrough_columns)].reset_index(drop=True)
+                    pending.append((executor.submit(_score_chunk, features), passthrough))
+                    first_row += len(chunk)
+                    while len(pending) >= self.config.max_pending_chunks:
+                        write_oldest()
+                while pending:
+                    write_oldest()
+
+            if not writer:
+                # Empty input: still write the header so the output is a valid file.
+                self._write_chunk(writer, tmp_path, pd.DataFrame(
+                    {**{column: [] for column in self.config.passthrough_columns}, "prediction": []}), is_parquet)
+        except BaseException:
+            for pending_future, _ in pending:
+                pending_future.cancel()
+            for handle in writer.values():
+                handle.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        for handle in writer.values():
+            handle.close()
+        os.replace(tmp_path, output_path)
+
+        elapsed = time.perf_counter() - started
+        report = {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "input_path": str(input_path),
+            "output_path": str(output_path),
+            "model_path": str(self.config.model_path),
+            "rows": rows,
+            "chunks": chunks,
+            "chunk_size": self.config.chunk_size,
+            "max_workers": allocation.workers,
+            "threads_per_worker": allocation.threads_per_worker,
+            "duration_seconds": elapsed,
+            "rows_per_second": rows / elapsed if elapsed else None,
+        }
+        save_json(Path(os.path.join(self.config.root_dir, f"{output_path.stem}_report.json")), report)
+        logging.info(f"Scored {rows} rows in {chunks} chunks in {elapsed:.1f}s ({report['rows_per_second']:.0f} rows/s).")
+        return report
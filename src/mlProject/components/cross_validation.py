@@ -0,0 +1,133 @@
+import os
+import time
+import logging
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import enet_path
+from mlProject.entity.config_entity import CrossValidationConfig
+from mlProject.entity.artifact_entity import ArtifactContext
+from mlProject.utils.common import save_json
+from mlProject.utils.metrics import regression_metrics
+from mlProject.utils.resources import allocate_cores, limit_threads
+
+
+class GramCrossValidator:
+    """
+    A class that runs k-fold cross-validation of the ElasticNet model using shared
+    Gram matrices.
+
+    Process:
+        1. One pass over the data computes, per fold, X_k^T X_k, X_k^T y_k and the column sums.
+           Together these cost the same as a single X^T X.
+        2. The statistics of a fold's training part are the totals minus that fold's
+           contribution, so no fold recomputes a Gram matrix from its rows.
+        3. The training Gram and X^T y are centered analytically (G - n * mean_x mean_x^T,
+           Xy - n * mean_x * mean_y) and handed to the coordinate-descent solver (`enet_path`),
+           which then never reads the training rows, so no fold copies them. The fit has no
+           intercept; it is recovered as mean_y - mean_x @ coef. This gives the same
+           solution as ElasticNet(fit_intercept=True) on the fold.
+        4. Folds are fitted concurrently in threads: numpy and the coordinate-descent
+           solver release the GIL, and threads share the data without copying it.
+
+    Attributes:
+        config (CrossValidationConfig): Fold count, parallelism, paths and ElasticNet hyperparameters.
+        context (ArtifactContext): Artifacts shared with the other stages of the run.
+    """
+
+    def __init__(self, config: CrossValidationConfig, context: ArtifactContext = None):
+        self.config = config
+        self.context = context or ArtifactContext()
+
+    def _fold_statistics(self, X: np.ndarray, y: np.ndarray, fold_ids: np.ndarray) -> list:
+        statistics = []
+        for fold in range(self.config.n_splits):
+            X_fold, y_fold = X[fold_ids == fold], y[fold_ids == fold]
+            statistics.append({
+                "n": len(y_fold),
+                "sum_x": X_fold.sum(axis=0),
+                "sum_y": y_fold.sum(),
+                "gram": X_fold.T @ X_fold,
+                "xy": X_fold.T @ y_fold,
+            })
+        return statistics
+
+    def _fit_fold(self, fold: int, X: np.ndarray, y: np.ndarray, fold_ids: np.ndarray,
+                  fold_statistics: list, totals: dict) -> dict:
+        started = time.perf_counter()
+        held_out = fold_statistics[fold]
+        n_train = totals["n"] - held_out["n"]
+        mean_x = (totals["sum_x"] - held_out["sum_x"]) / n_train
+        mean_y = (totals["sum_y"] - held_out["sum_y"]) / n_train
+        gram = (totals["gram"] - held_out["gram"]) - n_train * np.outer(mean_x, mean_x)
+        xy = (totals["xy"] - held_out["xy"]) - n_train * mean_x * mean_y
+
+        train_mask = fold_ids != fold
+        # With the Gram matrix and X^T y given, the solver only reads the shape of X (for the
+        # penalty scaling) and the centered targets (for the duality gap): a zero-byte view
+        # stands in for the training rows.
+        X_shape = np.broadcast_to(np.float64(0.0), (n_train, X.shape[1]))
+        _, coefs, _, n_iters = enet_path(X_shape, y[train_mask] - mean_y, l1_ratio=self.config.l1_ratio,
+                                         alphas=[self.config.alpha], precompute=gram, Xy=xy, check_input=False,
+                                         random_state=42, return_n_iter=True)
+        coef = coefs[:, 0]
+        intercept = mean_y - mean_x @ coef
+
+        predictions = X[~train_mask] @ coef + intercept
+        return {
+            "fold": fold,
+            "train_rows": int(n_train),
+            "test_rows": int(held_out["n"]),
+            **regression_metrics(y[~train_mask], predictions),
+            "n_iter": int(n_iters[0]),
+            "fit_seconds": time.perf_counter() - started,
+        }
+
+    def run(self) -> dict:
+        """
+        Cross-validates the model on the training split and writes `cv_metrics.json`.
+
+        Returns:
+            dict: Per-fold metrics and the mean and standard deviation of RMSE, MAE and R2.
+        """
+        data = self.context.load_csv(self.config.train_data_path)
+        X = data.drop(columns=[self.config.target_column]).to_numpy(dtype=np.float64)
+        y = data[self.config.target_column].to_numpy(dtype=np.float64)
+
+        rng = np.random.default_rng(self.config.random_state)
+        fold_ids = rng.permutation(np.arange(len(y)) % self.config.n_splits)
+
+        started = time.perf_counter()
+        fold_statistics = self._fold_statistics(X, y, fold_ids)
+        totals = {key: sum(stats[key] for stats in fold_statistics) for key in fold_statistics[0]}
+        logging.info(f"Computed Gram statistics for {self.config.n_splits} folds "
+                     f"({X.shape[0]} rows x {X.shape[1]} features) in {time.perf_counter() - started:.3f}s.")
+
+        allocation = allocate_cores("Cross validation", self.config.max_workers, n_tasks=self.config.n_splits,
+                                    total_cores=self.config.total_cores)
+        # The BLAS limit is process-wide, so concurrent folds share the budget instead of each taking every core.
+        with limit_threads(allocation.threads_per_worker), \
+                ThreadPoolExecutor(max_workers=allocation.workers) as executor:
+            folds = list(executor.map(
+                lambda fold: self._fit_fold(fold, X, y, fold_ids, fold_statistics, totals),
+                range(self.config.n_splits)
+            ))
+
+        report = {
+            "model": "ElasticNet",
+            "params": {"alpha": self.config.alpha, "l1_ratio": self.config.l1_ratio},
+            "n_splits": self.config.n_splits,
+            "folds": folds,
+            "duration_seconds": time.perf_counter() - started,
+        }
+        for metric in ("rmse", "mae", "r2"):
+            values = np.array([fold[metric] for fold in folds])
+            report[f"{metric}_mean"] = float(values.mean())
+            report[f"{metric}_std"] = float(values.std(ddof=1)) if len(values) > 1 else 0.0
+
+        save_json(Path(os.path.join(self.config.root_dir, "cv_metrics.json")), report)
+        logging.info(f"{self.config.n_splits}-fold CV: rmse={report['rmse_mean']:.4f} +/- {report['rmse_std']:.4f}, "
+                     f"mae={report['mae_mean']:.4f} +/- {report['mae_std']:.4f}, "
+                     f"r2={report['r2_mean']:.4f} +/- {report['r2_std']:.4f}")
+        return report
@@ -70,3 +70,58 @@ class DataIngestion:
         with zipfile.ZipFile(self.config.local_data_dir, 'r') as zip_ref:
             zip_ref.extractall(unzip_path)
             logging.info(f"Data extracted successfully to {unzip_path}.")
+
+    def iter_extracted_blocks(self, member: str, block_size: int):
+        """
+        Extracts the zip file like `extract_zip_file`, but yields the data file `member` in
+        blocks of complete lines while it is being written, so that the rows can be parsed
+        before the extraction has finished.
+
+        The file is written under a temporary name and renamed when complete; if the
+        consumer stops early, the partial file is removed.
+
+        Args:
+            member (str): Name of the data file inside the archive.
+            block_size (int): Bytes decompressed per read.
+
+        Yields:
+            bytes: Consecutive blocks of whole lines; the first starts with the header line.
+
+        Raises:
+            FileNotFoundError: If the zip file to extract doesn't exist.
+        """
+        unzip_path = self.config.unzip_dir
+        os.makedirs(unzip_path, exist_ok=True)
+
+        if not os.path.exists(self.config.local_data_dir):
+            raise FileNotFoundError(f"Zip file not found at {self.config.local_data_dir}. Please download it first.")
+
+        target_path = os.path.join(unzip_path, member)
+        tmp_path = f"{target_path}.part"
+        with zipfile.ZipFile(self.config.local_data_dir, 'r') as zip_ref:
+            for name in zip_ref.namelist():
+                if name != member:
+                    zip_ref.extract(name, unzip_path)
+
+            try:
+                with zip_ref.open(member) as source, open(tmp_path, "wb") as destination:
+                    remainder = b""
+                    while True:
+                        block = source.read(block_size)
+                        if not block:
+                            break
+                        destination.write(block)
+                        block = remainder + block
+                        end = block.rfind(b"\n") + 1
+                        remainder = block[end:]
+                        if end:
+                            yield block[:end]
+                    if remainder:
+                        yield remainder
+            except BaseException:
+                # Includes GeneratorExit, when the consumer aborts.
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+
+        os.replace(tmp_path, target_path)
+        logging.info(f"Data extracted successfully to {unzip_path}.")
@@ -1,24 +1,36 @@
 import os
+import json
+from pathlib import Path
 from mlProject.utils.logging_utils import setup_logging
 import logging
 from sklearn.model_selection import train_test_split
 import pandas as pd
 from mlProject.entity.config_entity import DataTransformationConfig
+from mlProject.entity.artifact_entity import ArtifactContext
+from mlProject.components.incremental_ingestion import IncrementalIngestion
+from mlProject.utils.deduplication import RowHashSet, drop_duplicate_rows
 
 
 class DataTransformation:
-    def __init__(self, config: DataTransformationConfig):
+    def __init__(self, config: DataTransformationConfig, context: ArtifactContext = None):
         self.config = config
+        self.context = context or ArtifactContext()
 
 
     def train_test_spliting(self):
-        data = pd.read_csv(self.config.data_path)
+        # dtypes is set in compact mode (float32 features, int8 target).
+        data = self.context.load_csv(self.config.data_path, dtype=self.config.dtypes)
+
+        # Deduplicate before splitting, so that no row ends up in both train and test.
+        if self.config.deduplicate:
+            data, dropped = drop_duplicate_rows(data, dtypes=self.config.all_schema)
+            logging.info(f"Dropped {dropped} duplicate rows; {len(data)} rows remain")
 
         # Split the data into training and test sets. (0.75, 0.25) split.
         train, test = train_test_split(data)
 
-        train.to_csv(os.path.join(self.config.root_dir, "train.csv"),index = False)
-        test.to_csv(os.path.join(self.config.root_dir, "test.csv"),index = False)
+        self.context.save_csv(train, os.path.join(self.config.root_dir, "train.csv"))
+        self.context.save_csv(test, os.path.join(self.config.root_dir, "test.csv"))
 
         logging.info("Splited data into training and test sets")
         logging.info(train.shape)
@@ -26,4 +38,126 @@ class DataTransformation:
 
         print(train.shape)
         print(test.shape)
+
+    @property
+    def journal_path(self) -> str:
+        return os.path.join(self.config.root_dir, "append_journal.json")
+
+    def append_batch(self, ingestion: IncrementalIngestion):
+        """
+        Appends the batch at `data_path` (incremental mode) to the store and the train/test
+        splits, then commits the ingestion watermark.
+
+        The appends are staged: before the first one, a journal records the size of each
+        file and which hash partitions are replaced (the old ones are kept as `.bak` files).
+        Committing the watermark is the single commit point. If the run fails before it, the
+        next run truncates the files back and restores the partitions before appending the
+        batch again, so a retried batch is never stored twice.
+
+        Args:
+            ingestion (IncrementalIngestion): The ingestion that collected the batch.
+        """
+        self._recover(ingestion)
+        if not ingestion.pending_watermark_file.exists():
+            logging.info("No collected batch is pending; store and splits are unchanged")
+            return
+
+        batch = self.context.load_csv(self.config.data_path, dtype=self.config.dtypes)
+        if batch.empty:
+            logging.info("No new rows since the last run; store and splits are unchanged")
+            ingestion.commit_watermark()
+            return
+
+        stored = None
+        if self.config.deduplicate:
+            # Hashes of every stored row, so a resent record is dropped even if it arrived days ago.
+            # Only the partitions the batch's hashes fall into are read. Rows are hashed in the
+            # schema dtypes, so a batch whose float column held only whole numbers still matches.
+            stored = RowHashSet.load(os.path.join(self.config.root_dir, "store_hashes"), self.config.hash_partitions)
+            batch, dropped = drop_duplicate_rows(batch, seen=stored, dtypes=self.config.all_schema)
+            logging.info(f"Dropped {dropped} rows of the batch already in it or in the store")
+            if batch.empty:
+                ingestion.commit_watermark()
+                return
+
+        train, test = self.split_chunk(batch)
+        appends = [(batch, self.config.store_path),
+                   (train, os.path.join(self.config.root_dir, "train.csv")),
+                   (test, os.path.join(self.config.root_dir, "test.csv"))]
+        partitions = {}
+        if stored is not None:
+            partitions = {partition_id: os.path.exists(RowHashSet.partition_path(stored.directory, partition_id))
+                          for partition_id in stored.changed_partitions()}
+        journal = {
+            "batch_id": ingestion.pending_batch_id(),
+            "sizes": {str(path): os.path.getsize(path) if os.path.exists(path) else None for _, path in appends},
+            "hashes_dir": str(stored.directory) if stored is not None else None,
+            # Partition id -> whether its file existed before.
+            "partitions": partitions,
+        }
+        tmp_path = f"{self.journal_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(journal, f)
+        os.replace(tmp_path, self.journal_path)
+
+        for frame, path in appends:
+            self._append_csv(frame, path)
+        if stored is not None:
+            for partition_id, existed in partitions.items():
+                path = RowHashSet.partition_path(stored.directory, partition_id)
+                if existed:
+                    Path(f"{path}.bak").unlink(missing_ok=True)
+                    os.link(path, f"{path}.bak")
+            stored.save()
+
+        ingestion.commit_watermark()
+        self._finish(journal)
+        logging.info(f"Appended a batch of {len(batch)} rows ({len(train)} train, {len(test)} test)")
+
+    def _recover(self, ingestion: IncrementalIngestion):
+        """Completes or rolls back a batch whose append was interrupted, according to the watermark."""
+        if not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path, encoding="utf-8") as f:
+            journal = json.load(f)
+
+        if journal["batch_id"] is not None and journal["batch_id"] == ingestion.committed_batch_id():
+            logging.info(f"The append of batch {journal['batch_id']} was committed; removing its journal")
+            self._finish(journal)
+            return
+
+        logging.warning(f"Rolling back the interrupted append of batch {journal['batch_id']}")
+        for path, size in journal["sizes"].items():
+            if size is None:
+                Path(path).unlink(missing_ok=True)
+            elif os.path.exists(path):
+                with open(path, "r+b") as f:
+                    f.truncate(size)
+        for partition_id, existed in journal["partitions"].items():
+            path = RowHashSet.partition_path(journal["hashes_dir"], int(partition_id))
+            if os.path.exists(f"{path}.bak"):
+                os.replace(f"{path}.bak", path)
+            elif not existed:
+                Path(path).unlink(missing_ok=True)
+        os.remove(self.journal_path)
+
+    def _finish(self, journal: dict):
+        for partition_id in journal["partitions"]:
+            Path(f"{RowHashSet.partition_path(journal['hashes_dir'], int(partition_id))}.bak").unlink(missing_ok=True)
+        os.remove(self.journal_path)
+
+    @staticmethod
+    def split_chunk(chunk: pd.DataFrame) -> tuple:
+        """Splits a batch or chunk of rows (0.75, 0.25) into (train, test)."""
+        # A single row cannot be split; it goes to the training set.
+        return train_test_split(chunk) if len(chunk) > 1 else (chunk, chunk.iloc[:0])
+
+    @staticmethod
+    def _append_csv(frame: pd.DataFrame, path):
+        if os.path.exists(path):
+            # Write the columns in the file's order; a batch missing one fails here instead of shifting values.
+            frame = frame[list(pd.read_csv(path, nrows=0).columns)]
+            frame.to_csv(path, mode="a", header=False, index=False)
+        else:
+            frame.to_csv(path, index=False)
         
\ No newline at end of file
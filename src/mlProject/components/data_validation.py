@@ -1,21 +1,57 @@
+import os
 import pandas as pd
+from pathlib import Path
 from mlProject.utils.logging_utils import setup_logging
 import logging
 from mlProject.entity.config_entity import DataValidationConfig
+from mlProject.entity.artifact_entity import ArtifactContext
+from mlProject.utils.common import save_json
+from mlProject.utils.deduplication import row_hashes
+
+
+def conform_dtypes(data: pd.DataFrame, schema: dict) -> tuple:
+    """
+    Checks the dtypes of `data` against the schema and casts it to them.
+
+    A column the schema types as float64 may also have been parsed as int64, since a file,
+    batch or chunk can hold only whole numbers in a float column; it is cast. Any other
+    difference is a mismatch. An empty frame has no values to type-check and always matches.
+
+    Args:
+        data (pd.DataFrame): Rows parsed without dtypes, with the schema columns.
+        schema (dict): Column name -> expected dtype, as in schema.yaml.
+
+    Returns:
+        tuple: (data cast to the schema dtypes, or None if a dtype does not match; list of mismatches).
+    """
+    schema = dict(schema)
+    if data.empty:
+        return data.astype(schema), []
+
+    mismatches = []
+    for column, expected in schema.items():
+        found = str(data[column].dtype)
+        if found != expected and not (expected == "float64" and found == "int64"):
+            mismatches.append(f"Dtype mismatch in {column!r}: expected {expected}, found {found}")
+    if mismatches:
+        return None, mismatches
+    return data.astype(schema), []
 
 
 class DataValidation:
     """
     A class to handle data validation by checking:
     1. If the dataset's column names exactly match the defined schema (including order).
-    2. If the dataset's data types match the expected data types defined in the schema.
+    2. If the dataset's data types match the expected data types defined in the schema
+       (see `conform_dtypes`).
 
     Attributes:
         config (DataValidationConfig): Configuration object containing schema definitions, 
                                        file paths, and validation status file location.
+        context (ArtifactContext): Keeps the loaded data and the status for the following stages.
     """
 
-    def __init__(self, config: DataValidationConfig):
+    def __init__(self, config: DataValidationConfig, context: ArtifactContext = None):
         """
         Initializes the DataValidation object with the given configuration.
 
@@ -24,14 +60,17 @@ class DataValidation:
                 - all_schema (dict): Expected column names and their corresponding data types.
                 - unzip_data_dir (str): Path to the extracted CSV file.
                 - STATUS_FILE (str): Path to write the validation status.
+            context (ArtifactContext, optional): Artifacts shared with the other stages of the run.
         """
         self.config = config
+        self.context = context or ArtifactContext()
 
     def validate_data(self) -> bool:
         """
         Validates the ingested dataset by:
         - Comparing column names and their order with the expected schema.
-        - Ensuring data types of each column match the schema exactly.
+        - Ensuring data types of each column match the schema (a float64 column may hold
+          only whole numbers and be parsed as int64; see `conform_dtypes`).
 
         Process:
             1. Reads the CSV file from the specified path.
@@ -39,9 +78,11 @@ class DataValidation:
             3. Compares them with the provided schema.
             4. Logs detailed mismatches if any.
             5. Writes the overall validation status (True/False) to a status file.
+            6. Counts exact duplicate rows and writes them, with the status, to
+               `validation_report.json` next to the status file.
 
         Returns:
-            bool: True if both columns and data types match the schema exactly, False otherwise.
+            bool: True if both columns and data types match the schema, False otherwise.
 
         Raises:
             Exception: If any error occurs during file reading, validation, or status writing.
@@ -52,36 +93,71 @@ class DataValidation:
         """
         try:
             # Load the dataset
-            data = pd.read_csv(self.config.unzip_data_dir)
+            data = self.context.load_csv(self.config.unzip_data_dir)
             all_columns = list(data.columns)
-            dtypes_list_str = data.dtypes.astype(str).tolist()
 
             # Schema details
             schema_columns = list(self.config.all_schema.keys())
-            schema_dtypes = list(self.config.all_schema.values())
 
-            # Check for exact column and dtype match
+            # Check for exact column match; dtypes are only comparable when the columns are.
             column_name_match = all_columns == schema_columns
-            dtype_match = dtypes_list_str == schema_dtypes
+            dtype_mismatches = conform_dtypes(data, self.config.all_schema)[1] if column_name_match else []
+            dtype_match = not dtype_mismatches
 
             validation_status = column_name_match and dtype_match
 
             # Detailed logging for mismatches
             if not column_name_match:
                 logging.info(f"Column mismatch:\nExpected: {schema_columns}\nFound: {all_columns}")
-            if not dtype_match:
-                logging.info(f"Dtype mismatch:\nExpected: {schema_dtypes}\nFound: {dtypes_list_str}")
+            for mismatch in dtype_mismatches:
+                logging.info(mismatch)
 
             if validation_status:
                 logging.info("All columns and data types match the expected schema successfully.")
 
-            # Write the validation status
-            with open(self.config.STATUS_FILE, "w") as f:
-                f.write(f"Validation status: {validation_status}")
-                logging.info(f"Validation status written to {self.config.STATUS_FILE}")
+            duplicate_rows = int(pd.Series(row_hashes(data)).duplicated().sum())
+            self.write_validation_status(validation_status, len(data), duplicate_rows)
 
             return validation_status
 
         except Exception as e:
             logging.error(f"Error during data validation: {e}")
             raise e
+
+    def validate_chunk(self, chunk: pd.DataFrame) -> tuple:
+        """
+        Validates one chunk of the dataset against the schema, for streaming validation.
+
+        Column names and order must match exactly; dtypes are checked and cast with
+        `conform_dtypes`, like in `validate_data`, so the chunks add up to what a full read
+        of the file gives.
+
+        Args:
+            chunk (pd.DataFrame): Rows of the dataset, parsed without dtypes.
+
+        Returns:
+            tuple: (chunk cast to the schema dtypes, or None if invalid; list of mismatches).
+        """
+        schema_columns = list(self.config.all_schema.keys())
+        if list(chunk.columns) != schema_columns:
+            return None, [f"Column mismatch: expected {schema_columns}, found {list(chunk.columns)}"]
+
+        return conform_dtypes(chunk, self.config.all_schema)
+
+    def write_validation_status(self, validation_status: bool, rows: int, duplicate_rows: int):
+        """
+        Writes the validation status to STATUS_FILE (and the shared context), and the
+        status with the row and duplicate counts to `validation_report.json`.
+        """
+        with open(self.config.STATUS_FILE, "w") as f:
+            f.write(f"Validation status: {validation_status}")
+            logging.info(f"Validation status written to {self.config.STATUS_FILE}")
+        self.context.set_validation_status(self.config.STATUS_FILE, validation_status)
+
+        logging.info(f"{duplicate_rows} of {rows} rows are exact duplicates of an earlier row")
+        save_json(Path(os.path.join(self.config.root_dir, "validation_report.json")), {
+            "validation_status": validation_status,
+            "rows": rows,
+            "duplicate_rows": duplicate_rows,
+            "duplicate_fraction": duplicate_rows / rows if rows else 0.0,
+        })
@@ -0,0 +1,177 @@
+import os
+import math
+import time
+import logging
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from mlProject.entity.config_entity import HyperparameterSweepConfig
+from mlProject.entity.artifact_entity import ArtifactContext
+from mlProject.utils.common import save_json, save_jsonl
+from mlProject.utils.logging_utils import get_worker_log_queue, setup_worker_logging, get_run_id
+from mlProject.utils.metrics import regression_metrics
+from mlProject.utils.resources import allocate_cores, init_worker_threads
+
+
+# Regressors only: candidates are ranked by RMSE, which means nothing for class labels.
+ESTIMATORS = {
+    "ElasticNet": ("sklearn.linear_model", "ElasticNet"),
+    "HistGradientBoostingRegressor": ("sklearn.ensemble", "HistGradientBoostingRegressor"),
+    "RandomForestRegressor": ("sklearn.ensemble", "RandomForestRegressor"),
+}
+
+# Filled once per worker process by `_init_worker`, so the data is not re-sent with every trial.
+_worker_data = {}
+
+
+def _build_estimator(name: str, params: dict, n_jobs: int = 1):
+    import importlib
+
+    module_name, class_name = ESTIMATORS[name]
+    estimator_class = getattr(importlib.import_module(module_name), class_name)
+    estimator = estimator_class(**params)
+    if "random_state" in estimator.get_params():
+        estimator.set_params(random_state=42)
+    if "n_jobs" in estimator.get_params():
+        # The process pool already runs trials in parallel; each gets its worker's share of the cores.
+        estimator.set_params(n_jobs=n_jobs)
+    return estimator
+
+
+def _init_worker(data: pd.DataFrame, target_column: str, validation_fraction: float, random_state: int,
+                 log_queue, run_id: str, threads: int = 1):
+    setup_worker_logging(log_queue, stage="Hyperparameter Sweep", run_id=run_id)
+    init_worker_threads(threads)
+    _worker_data["n_jobs"] = threads
+    shuffled = data.sample(frac=1.0, random_state=random_state).reset_index(drop=True)
+    n_validation = int(len(shuffled) * validation_fraction)
+    validation, fit = shuffled.iloc[:n_validation], shuffled.iloc[n_validation:]
+
+    # Rung subsamples are prefixes of one shuffled fit set, so larger budgets contain smaller ones.
+    _worker_data["fit_x"] = fit.drop(columns=[target_column])
+    _worker_data["fit_y"] = fit[target_column]
+    _worker_data["validation_x"] = validation.drop(columns=[target_column])
+    _worker_data["validation_y"] = validation[target_column]
+
+
+def _run_trial(trial: dict) -> dict:
+    n_rows = max(2, int(len(_worker_data["fit_x"]) * trial["resource_fraction"]))
+    estimator = _build_estimator(trial["estimator"], trial["params"], n_jobs=_worker_data.get("n_jobs", 1))
+
+    started = time.perf_counter()
+    estimator.fit(_worker_data["fit_x"].iloc[:n_rows], _worker_data["fit_y"].iloc[:n_rows])
+    fit_seconds = time.perf_counter() - started
+
+    predictions = estimator.predict(_worker_data["validation_x"])
+    return {
+        **trial,
+        "n_rows": n_rows,
+        **regression_metrics(_worker_data["validation_y"], predictions),
+        "fit_seconds": fit_seconds,
+        "pid": os.getpid(),
+    }
+
+
+class SuccessiveHalvingSweep:
+    """
+    A class that searches the hyperparameters of the estimators in params.yaml with
+    successive halving.
+
+    Process:
+        1. Draws `n_candidates` configurations (estimator + sampled parameters) from the search space.
+        2. Fits every candidate on a small fraction of the training rows and scores it
+           (RMSE) on a held-out validation fraction.
+        3. Keeps the best 1/eta candidates and gives them eta times more rows; repeats
+           until one candidate is left or the full training data is used.
+
+    Trials of a rung run in parallel over a process pool that loads the data once per
+    worker. Every trial is appended to `trials.jsonl`; the winner goes to `best_params.json`.
+    Only the regressors in ESTIMATORS can be searched, so all candidates share one metric.
+
+    Attributes:
+        config (HyperparameterSweepConfig): Search space, halving schedule and paths.
+        context (ArtifactContext): Artifacts shared with the other stages of the run.
+    """
+
+    def __init__(self, config: HyperparameterSweepConfig, context: ArtifactContext = None):
+        unsupported = sorted(set(config.search_space) - set(ESTIMATORS))
+        if unsupported:
+            raise ValueError(f"The sweep only searches the regressors {sorted(ESTIMATORS)}; "
+                             f"remove {unsupported} from Sweep.search_space in params.yaml.")
+        self.config = config
+        self.context = context or ArtifactContext()
+
+    def sample_candidates(self) -> list:
+        """
+        Draws candidate configurations, spread evenly over the estimators of the search space.
+
+        Returns:
+            list: One dict per candidate with `candidate_id`, `estimator` and `params`.
+        """
+        rng = np.random.default_rng(self.config.random_state)
+        estimators = list(self.config.search_space)
+        candidates = []
+        for candidate_id in range(self.config.n_candidates):
+            estimator = estimators[candidate_id % len(estimators)]
+            params = dict(self.config.base_params.get(estimator, {}))
+            for name, space in self.config.search_space[estimator].items():
+                low, high = space["low"], space["high"]
+                if space.get("log"):
+                    value = float(np.exp(rng.uniform(np.log(low), np.log(high))))
+                else:
+                    value = float(rng.uniform(low, high))
+                params[name] = int(round(value)) if space.get("int") else value
+            candidates.append({"candidate_id": candidate_id, "estimator": estimator, "params": params})
+        return candidates
+
+    def run(self) -> dict:
+        """
+        Runs the sweep.
+
+        Returns:
+            dict: The best trial (estimator, parameters and validation metrics at the largest budget).
+        """
+        candidates = self.sample_candidates()
+        # Parsed once here and pickled to the workers, instead of each worker parsing the CSV.
+        data = self.context.load_csv(self.config.train_data_path)
+        trials_path = Path(os.path.join(self.config.root_dir, "trials.jsonl"))
+        trials_path.unlink(missing_ok=True)
+
+        n_rungs = max(1, math.ceil(math.log(1 / self.config.min_resource_fraction, self.config.eta)) + 1)
+        logging.info(f"Successive halving: {len(candidates)} candidates, eta={self.config.eta}, "
+                     f"{n_rungs} rungs starting at {self.config.min_resource_fraction:.0%} of the data.")
+
+        allocation = allocate_cores("Hyperparameter sweep", self.config.max_workers, n_tasks=len(candidates),
+                                    total_cores=self.config.total_cores)
+        with ProcessPoolExecutor(max_workers=allocation.workers,
+                                 initializer=_init_worker,
+                                 initargs=(data, self.config.target_column, self.config.validation_fraction,
+                                           self.config.random_state, get_worker_log_queue(), get_run_id(),
+                                           allocation.threads_per_worker)) as executor:
+            rung = 0
+            while True:
+                fraction = min(1.0, self.config.min_resource_fraction * self.config.eta ** rung)
+                trials = [{**candidate, "rung": rung, "resource_fraction": fraction} for candidate in candidates]
+
+                started = time.perf_counter()
+                results = list(executor.map(_run_trial, trials))
+                save_jsonl(trials_path, results, append=True)
+
+                results.sort(key=lambda result: result["rmse"])
+                logging.info(f"Rung {rung}: {len(results)} candidates on {fraction:.0%} of the data "
+                             f"in {time.perf_counter() - started:.1f}s; best rmse={results[0]['rmse']:.4f} "
+                             f"({results[0]['estimator']} {results[0]['params']})")
+
+                if len(results) == 1 or fraction >= 1.0:
+                    best = results[0]
+                    break
+
+                n_keep = max(1, len(results) // self.config.eta)
+                promoted = {result["candidate_id"] for result in results[:n_keep]}
+                candidates = [candidate for candidate in candidates if candidate["candidate_id"] in promoted]
+                rung += 1
+
+        save_json(Path(os.path.join(self.config.root_dir, "best_params.json")), best)
+        logging.info(f"Best configuration: {best['estimator']} {best['params']} (rmse={best['rmse']:.4f}).")
+        return best
@@ -0,0 +1,170 @@
+import io
+import os
+import hashlib
+import glob
+import uuid
+import logging
+from datetime import datetime
+from pathlib import Path
+import pandas as pd
+from mlProject.entity.config_entity import IncrementalIngestionConfig
+from mlProject.components.data_validation import conform_dtypes
+from mlProject.utils.common import save_json, load_json
+
+
+class IncrementalIngestion:
+    """
+    A class that ingests only the data that arrived since the last run.
+
+    New data lands as CSV files in `landing_dir`: new files, or rows appended to files
+    already seen. A watermark records, per file, the byte offset up to which its rows
+    have been processed (plus its size, modification time and a digest of its first
+    bytes), so each run reads only the bytes past the watermark. A file that was
+    rewritten rather than appended to is recognised by its changed head and ingested
+    again from the start.
+
+    Process:
+        1. `collect_new_batches` reads the new complete lines of every landing file into
+           `delta_path` and writes the advanced watermark, with a new batch ID, as *pending*.
+        2. Validation checks the delta; transformation appends it to the store and to the
+           train/test splits.
+        3. `commit_watermark` then makes the pending watermark current. A batch that fails
+           on the way is therefore read again by the next run; the transformation rolls back
+           what it had appended of it (see DataTransformation.append_batch).
+
+    Attributes:
+        config (IncrementalIngestionConfig): Landing directory, watermark, delta and store paths.
+    """
+
+    # Bytes at the start of a file whose digest tells an append from a rewrite.
+    HEAD_BYTES = 64 * 1024
+
+    def __init__(self, config: IncrementalIngestionConfig):
+        self.config = config
+
+    @property
+    def pending_watermark_file(self) -> Path:
+        return Path(f"{self.config.watermark_file}.pending")
+
+    def load_watermark(self) -> dict:
+        """
+        Returns the committed watermark.
+
+        Returns:
+            dict: `files` (file name -> offset, size, mtime_ns and header line) and the run history counters.
+        """
+        if not os.path.exists(self.config.watermark_file):
+            return {"files": {}, "batches": 0, "rows": 0}
+        return load_json(Path(self.config.watermark_file), as_box=False)
+
+    def pending_batch_id(self) -> str:
+        """Returns the ID of the collected batch that is not committed yet, or None."""
+        if not self.pending_watermark_file.exists():
+            return None
+        return load_json(self.pending_watermark_file, as_box=False).get("batch_id")
+
+    def committed_batch_id(self) -> str:
+        """Returns the ID of the last committed batch, or None."""
+        return self.load_watermark().get("batch_id")
+
+    def _read_new_rows(self, path: str, mark: dict) -> tuple:
+        """Reads the complete lines of `path` past the watermark; returns (frame or None, new mark)."""
+        stat = os.stat(path)
+        offset = mark.get("offset", 0)
+        if stat.st_size < offset:
+            logging.warning(f"{path} shrank below its watermark ({stat.st_size} < {offset} bytes); "
+                            f"it was replaced, so it is ingested again from the start.")
+            offset = 0
+        elif offset and stat.st_mtime_ns != mark.get("mtime_ns") and "head_sha256" in mark:
+            # An append leaves the bytes already ingested as they were; a rewrite that grew past
+            # the watermark would otherwise be read from a stale offset.
+            if self._head_digest(path, min(offset, self.HEAD_BYTES)) != mark["head_sha256"]:
+                logging.warning(f"{path} was rewritten since it was last read (its first bytes changed); "
+                                f"it is ingested again from the start.")
+                offset = 0
+        if stat.st_size == offset:
+            return None, mark
+
+        with open(path, "rb") as f:
+            f.seek(offset)
+            chunk = f.read(stat.st_size - offset)
+
+        # A trailing line without a newline may still be being written; leave it for the next run.
+        end = chunk.rfind(b"\n") + 1
+        if end == 0:
+            return None, mark
+        chunk = chunk[:end]
+
+        header = mark.get("header") if offset else None
+        if header is None:
+            header, _, _ = chunk.partition(b"\n")
+            header = header.decode("utf-8").rstrip("\r")
+        else:
+            chunk = header.encode("utf-8") + b"\n" + chunk
+
+        frame = pd.read_csv(io.BytesIO(chunk))
+        if self.config.all_schema and list(frame.columns) == list(self.config.all_schema):
+            # A batch holding only whole numbers in a float column parses it as int64; cast it, so
+            # the delta has the schema dtypes. Anything else is left for validation to report.
+            conformed, _ = conform_dtypes(frame, self.config.all_schema)
+            if conformed is not None:
+                frame = conformed
+        new_offset = offset + end
+        new_mark = {"offset": new_offset, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "header": header,
+                    "head_sha256": self._head_digest(path, min(new_offset, self.HEAD_BYTES))}
+        return frame, new_mark
+
+    @staticmethod
+    def _head_digest(path: str, length: int) -> str:
+        """SHA-256 of the first `length` bytes of `path`."""
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read(length)).hexdigest()
+
+    def collect_new_batches(self) -> int:
+        """
+        Writes the rows that arrived since the committed watermark to `delta_path`.
+
+        The delta is always written, with only the header if nothing new arrived, so the
+        following stages see an empty batch instead of a stale one.
+
+        Returns:
+            int: Number of new rows.
+        """
+        os.makedirs(self.config.landing_dir, exist_ok=True)
+        watermark = self.load_watermark()
+        marks = dict(watermark["files"])
+
+        paths = sorted(glob.glob(os.path.join(self.config.landing_dir, self.config.pattern)),
+                       key=lambda path: (os.stat(path).st_mtime_ns, path))
+        frames = []
+        for path in paths:
+            name = os.path.basename(path)
+            frame, marks[name] = self._read_new_rows(path, marks.get(name, {}))
+            if frame is not None:
+                logging.info(f"{name}: {len(frame)} new rows")
+                frames.append(frame)
+
+        if frames:
+            delta = pd.concat(frames, ignore_index=True)
+        else:
+            header = next((mark["header"] for mark in marks.values() if mark.get("header")), None)
+            delta = pd.DataFrame(columns=header.split(",") if header else [])
+
+        Path(self.config.delta_path).parent.mkdir(parents=True, exist_ok=True)
+        delta.to_csv(self.config.delta_path, index=False)
+        save_json(self.pending_watermark_file, {
+            "batch_id": uuid.uuid4().hex,
+            "files": marks,
+            "batches": watermark["batches"] + (1 if frames else 0),
+            "rows": watermark["rows"] + len(delta),
+            "updated_at": datetime.now().isoformat(timespec="seconds"),
+        })
+        logging.info(f"Collected {len(delta)} new rows from {len(frames)} of {len(paths)} landing files "
+                     f"into {self.config.delta_path}.")
+        return len(delta)
+
+    def commit_watermark(self):
+        """Makes the pending watermark current, once the delta has been appended to the store."""
+        if self.pending_watermark_file.exists():
+            os.replace(self.pending_watermark_file, self.config.watermark_file)
+            logging.info(f"Watermark committed to {self.config.watermark_file}")
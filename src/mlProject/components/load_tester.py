@@ -0,0 +1,192 @@
+import os
+import json
+import time
+import random
+import logging
+import threading
+import http.client
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+from mlProject.entity.config_entity import LoadTestConfig
+from mlProject.utils.common import save_json
+
+
+class LoadTester:
+    """
+    A class that load tests the prediction service from a single machine.
+
+    Request bodies are built from real feature rows of the held-out test set. The
+    service is driven either in-process through a Flask test client or over HTTP,
+    in one of two modes:
+    1. Closed loop (`rate` = 0): `concurrency` workers send requests back to back.
+    2. Open loop (`rate` > 0): requests are issued on a fixed schedule regardless of
+       how fast the service answers; latency is measured from the scheduled send time,
+       so queueing delay is not hidden.
+
+    Attributes:
+        config (LoadTestConfig): Configuration of the run.
+        app (flask.Flask): The app to drive in-process, or None to send HTTP requests to `target_url`.
+    """
+
+    def __init__(self, config: LoadTestConfig, app=None):
+        """
+        Initializes the LoadTester.
+
+        Args:
+            config (LoadTestConfig): Configuration of the run.
+            app (flask.Flask, optional): Drive this app in-process instead of over HTTP.
+        """
+        self.config = config
+        self.app = app
+
+    def _load_payloads(self) -> list:
+        data = pd.read_csv(self.config.data_path).drop(columns=[self.config.target_column], errors="ignore")
+        rows = data.to_dict(orient="records")
+        random.Random(42).shuffle(rows)
+
+        batch_size = self.config.batch_size
+        if batch_size == 1:
+            return [json.dumps(row).encode("utf-8") for row in rows]
+        return [json.dumps(rows[i:i + batch_size]).encode("utf-8") for i in range(0, len(rows), batch_size)]
+
+    def _make_sender(self):
+        """Returns a function that posts one request body and returns the HTTP status code."""
+        if self.app is not None:
+            client = self.app.test_client()
+
+            def send(body: bytes) -> int:
+                return client.post("/predict", data=body, content_type="application/json").status_code
+
+            return send
+
+        url = urlsplit(self.config.target_url)
+        headers = {"Content-Type": "application/json"}
+        connection = http.client.HTTPConnection(url.hostname, url.port or 80, timeout=30)
+
+        def send(body: bytes) -> int:
+            nonlocal connection
+            try:
+                connection.request("POST", url.path or "/", body=body, headers=headers)
+                response = connection.getresponse()
+                response.read()
+                return response.status
+            except (http.client.HTTPException, OSError):
+                # Drop the broken keep-alive connection; the next request reconnects.
+                connection.close()
+                connection = http.client.HTTPConnection(url.hostname, url.port or 80, timeout=30)
+                raise
+
+        return send
+
+    @staticmethod
+    def _timed_send(send, body: bytes, started_at: float) -> tuple:
+        try:
+            ok = send(body) == 200
+        except Exception:
+            ok = False
+        return time.perf_counter() - started_at, ok
+
+    def _run_closed_loop(self, payloads: list) -> list:
+        deadline = time.perf_counter() + self.config.duration
+        results = [[] for _ in range(self.config.concurrency)]
+
+        def worker(worker_id: int):
+            send = self._make_sender()
+            i = worker_id * len(payloads) // self.config.concurrency
+            while time.perf_counter() < deadline:
+                results[worker_id].append(self._timed_send(send, payloads[i % len(payloads)], time.perf_counter()))
+                i += 1
+
+        threads = [threading.Thread(target=worker, args=(worker_id,)) for worker_id in range(self.config.concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return [result for worker_results in results for result in worker_results]
+
+    def _run_open_loop(self, payloads: list) -> list:
+        local = threading.local()
+
+        def timed_send(body: bytes, scheduled_at: float) -> tuple:
+            if not hasattr(local, "send"):
+                local.send = self._make_sender()
+            return self._timed_send(local.send, body, scheduled_at)
+
+        interval = 1.0 / self.config.rate
+        futures = []
+        with ThreadPoolExecutor(max_workers=self.config.concurrency) as executor:
+            start = time.perf_counter()
+            i = 0
+            while i * interval < self.config.duration:
+                scheduled_at = start + i * interval
+                delay = scheduled_at - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                futures.append(executor.submit(timed_send, payloads[i % len(payloads)], scheduled_at))
+                i += 1
+
+        return [future.result() for future in futures]
+
+    def run(self, label: str = "") -> dict:
+        """
+        Runs the load test and writes the report as JSON under `root_dir`.
+
+        Args:
+            label (str, optional): A name for the run (e.g. the model version), stored in the report
+                                   and used in the file name.
+
+        Returns:
+            dict: Throughput and p50/p95/p99/max latency of the run.
+        """
+        payloads = self._load_payloads()
+        mode = "open_loop" if self.config.rate else "closed_loop"
+        target = "in-process" if self.app is not None else self.config.target_url
+        logging.info(f"Starting {mode} load test against {target} for {self.config.duration}s "
+                     f"(concurrency={self.config.concurrency}, rate={self.config.rate}, batch_size={self.config.batch_size}).")
+
+        started = time.perf_counter()
+        if self.config.rate:
+            results = self._run_open_loop(payloads)
+        else:
+            results = self._run_closed_loop(payloads)
+        elapsed = time.perf_counter() - started
+
+        latencies_ms = np.array([latency for latency, ok in results if ok]) * 1000
+        errors = sum(1 for _, ok in results if not ok)
+        successful = len(latencies_ms)
+
+        def percentile(q: float) -> float:
+            return float(np.percentile(latencies_ms, q)) if successful else None
+
+        report = {
+            "label": label,
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "mode": mode,
+            "target": target,
+            "concurrency": self.config.concurrency,
+            "rate": self.config.rate,
+            "batch_size": self.config.batch_size,
+            "duration_seconds": elapsed,
+            "requests": len(results),
+            "errors": errors,
+            "throughput_rps": successful / elapsed,
+            "rows_per_second": successful * self.config.batch_size / elapsed,
+            "latency_ms": {
+                "mean": float(latencies_ms.mean()) if successful else None,
+                "p50": percentile(50),
+                "p95": percentile(95),
+                "p99": percentile(99),
+                "max": float(latencies_ms.max()) if successful else None,
+            },
+        }
+
+        file_name = f"load_test_{label + '_' if label else ''}{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+        save_json(Path(os.path.join(self.config.root_dir, file_name)), report)
+        logging.info(f"Load test finished: {report['throughput_rps']:.1f} req/s, "
+                     f"p50={report['latency_ms']['p50']} ms, p99={report['latency_ms']['p99']} ms, errors={errors}.")
+        return report
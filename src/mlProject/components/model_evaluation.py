@@ -0,0 +1,167 @@
+import time
+import logging
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from sklearn.base import is_classifier
+from mlProject.entity.config_entity import ModelEvaluationConfig
+from mlProject.entity.artifact_entity import ArtifactContext
+from mlProject.utils.common import save_json, load_joblib
+from mlProject.utils.logging_utils import get_worker_log_queue, setup_worker_logging, get_run_id
+from mlProject.utils.metrics import classification_metrics, model_metrics, regression_metrics, task_type
+from mlProject.utils.resources import allocate_cores, init_worker_threads
+
+
+# Filled once per worker process by `_init_worker`, so the model and the test set are not re-sent with every task.
+_worker_state = {}
+
+
+def _score(model, features: np.ndarray, feature_columns: list, y: np.ndarray) -> float:
+    # Wrapping the array (without copying it) keeps the feature names the model was fitted with.
+    predictions = np.asarray(model.predict(pd.DataFrame(features, columns=feature_columns, copy=False))).ravel()
+    if is_classifier(model):
+        return classification_metrics(y, predictions)["accuracy"]
+    return regression_metrics(y, predictions)["r2"]
+
+
+def _init_worker(model_path: str, features: np.ndarray, y: np.ndarray, feature_columns: list,
+                 log_queue, run_id: str, threads: int = 1):
+    setup_worker_logging(log_queue, stage="Model Evaluation", run_id=run_id)
+    init_worker_threads(threads)
+    model = load_joblib(Path(model_path), mmap_mode="r")
+    _worker_state["model"] = model
+    _worker_state["features"] = features
+    # The one writable copy of the worker: a column is permuted into it, scored and restored.
+    # Column-major, so a column is contiguous.
+    _worker_state["buffer"] = np.array(features, order="F", copy=True)
+    _worker_state["y"] = y
+    _worker_state["feature_columns"] = feature_columns
+
+
+def _permutation_scores(task: tuple) -> tuple:
+    """Scores the model with column `feature` shuffled, once per repeat; returns (feature, repeats, scores)."""
+    feature, repeats, random_state = task
+    features, buffer = _worker_state["features"], _worker_state["buffer"]
+    column = features[:, feature]
+
+    scores = []
+    for repeat in repeats:
+        # Seeded per (feature, repeat), so results do not depend on how tasks are spread over workers.
+        permutation = np.random.default_rng([random_state, feature, repeat]).permutation(len(column))
+        buffer[:, feature] = column[permutation]
+        scores.append(_score(_worker_state["model"], buffer, _worker_state["feature_columns"], _worker_state["y"]))
+    buffer[:, feature] = column
+    return feature, list(repeats), scores
+
+
+class ModelEvaluation:
+    """
+    A class that evaluates the trained model on the test split.
+
+    Process:
+        1. Computes the test metrics (RMSE, MAE and R2; accuracy for classifiers).
+        2. Computes permutation feature importance: the drop in test score (R2, or accuracy)
+           when one feature column is shuffled, over `n_repeats` shuffles per feature.
+
+    The (feature, repeats) tasks run on a process pool. Each worker receives the model path
+    and the test set once, through its initializer, and keeps a single writable copy of the
+    features: a task writes the permuted column into it, scores, and writes the original
+    column back, so no permutation copies the test set.
+
+    Attributes:
+        config (ModelEvaluationConfig): Paths, repeats and parallelism settings.
+        context (ArtifactContext): Artifacts shared with the other stages of the run.
+    """
+
+    def __init__(self, config: ModelEvaluationConfig, context: ArtifactContext = None):
+        self.config = config
+        self.context = context or ArtifactContext()
+
+    def _load_test_data(self) -> tuple:
+        test_x = self.context.load_csv(self.config.test_data_path, dtype=self.config.dtypes).copy(deep=False)
+        test_y = test_x.pop(self.config.target_column)
+        return test_x, test_y
+
+    def save_metrics(self, model, test_x: pd.DataFrame, test_y: pd.Series) -> dict:
+        """
+        Writes the test metrics of the model to `metric_file_name`, with its task type:
+        classifier metrics (accuracy) are not comparable with regressor ones.
+        """
+        metrics = model_metrics(model, test_y.to_numpy(), model.predict(test_x))
+
+        save_json(Path(self.config.metric_file_name), {"task": task_type(model), **metrics})
+        logging.info(f"Test metrics ({task_type(model)}): "
+                     + ", ".join(f"{name}={value:.4f}" for name, value in metrics.items()))
+        return metrics
+
+    def permutation_importance(self, model, test_x: pd.DataFrame, test_y: pd.Series) -> dict:
+        """
+        Computes permutation feature importance and writes it to `importance_file_name`.
+
+        Returns:
+            dict: The scoring, baseline score and, per feature (most important first), the
+                mean, standard deviation and per-repeat drops in score.
+        """
+        feature_columns = list(test_x.columns)
+        features = test_x.to_numpy()
+        y = test_y.to_numpy() if is_classifier(model) else test_y.to_numpy(dtype=np.float64)
+        n_features, n_repeats = len(feature_columns), self.config.n_repeats
+
+        allocation = allocate_cores("Permutation importance", self.config.max_workers,
+                                    n_tasks=n_features * n_repeats, total_cores=self.config.total_cores)
+        # Repeats are split into blocks only when there are fewer features than workers.
+        n_blocks = min(n_repeats, -(-allocation.workers // n_features))
+        tasks = [(feature, repeats.tolist(), self.config.random_state)
+                 for feature in range(n_features)
+                 for repeats in np.array_split(np.arange(n_repeats), n_blocks)]
+
+        started = time.perf_counter()
+        importances = np.empty((n_features, n_repeats))
+        baseline = _score(model, features, feature_columns, y)
+        with ProcessPoolExecutor(max_workers=allocation.workers,
+                                 initializer=_init_worker,
+                                 initargs=(str(self.config.model_path), features, y, feature_columns,
+                                           get_worker_log_queue(), get_run_id(),
+                                           allocation.threads_per_worker)) as executor:
+            for feature, repeats, scores in executor.map(_permutation_scores, tasks):
+                importances[feature, repeats] = baseline - np.asarray(scores)
+        duration = time.perf_counter() - started
+
+        order = np.argsort(-importances.mean(axis=1), kind="stable")
+        report = {
+            "scoring": "accuracy" if is_classifier(model) else "r2",
+            "baseline_score": baseline,
+            "n_repeats": n_repeats,
+            "test_rows": len(features),
+            "max_workers": allocation.workers,
+            "duration_seconds": duration,
+            "features": [
+                {
+                    "feature": feature_columns[feature],
+                    "importance_mean": float(importances[feature].mean()),
+                    "importance_std": float(importances[feature].std()),
+                    "importances": importances[feature].tolist(),
+                }
+                for feature in order
+            ],
+        }
+
+        save_json(Path(self.config.importance_file_name), report)
+        top = ", ".join(f"{entry['feature']} {entry['importance_mean']:.4f}" for entry in report["features"][:3])
+        logging.info(f"Permutation importance of {n_features} features x {n_repeats} repeats on {len(features)} rows "
+                     f"in {duration:.2f}s; top: {top}")
+        return report
+
+    def evaluate(self) -> dict:
+        """
+        Evaluates the model at `model_path` on the test split.
+
+        Returns:
+            dict: The test metrics and the permutation importance report.
+        """
+        model = load_joblib(Path(self.config.model_path), verify_checksum=True)
+        test_x, test_y = self._load_test_data()
+        metrics = self.save_metrics(model, test_x, test_y)
+        importance = self.permutation_importance(model, test_x, test_y)
+        return {"metrics": metrics, "permutation_importance": importance}
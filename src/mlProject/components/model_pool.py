@@ -0,0 +1,207 @@
+import os
+import re
+import time
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+import pandas as pd
+from mlProject.entity.config_entity import ModelPoolConfig
+from mlProject.components.model_server import ServedModel
+from mlProject.utils.common import load_joblib
+
+
+# A model name is one path component: it cannot point outside model_root.
+_MODEL_NAME_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
+
+
+class UnknownModelError(LookupError):
+    """Raised for a model name that is invalid or has no model file."""
+
+
+class _PoolEntry:
+    """A loaded model, its file size and when its file was last checked for a newer version."""
+
+    def __init__(self, served: ServedModel, size_bytes: int, checked_at: float):
+        self.served = served
+        self.size_bytes = size_bytes
+        self.checked_at = checked_at
+
+
+class ModelPool:
+    """
+    A class that serves many named models from one process, loading each on first use.
+
+    The model `name` lives at `model_root/<name>/<model_file>`. Loaded models are kept in
+    least-recently-used order; loading one more evicts the oldest until at most
+    `max_models` are loaded and their files add up to at most `max_memory_mb`. An evicted
+    model is loaded again on its next request.
+
+    Concurrent requests for a model that is not loaded share a single load: the first one
+    loads it and the others wait for its result. A loaded model's file is checked again
+    after `poll_interval` seconds and reloaded (as a new version) if it changed.
+
+    Attributes:
+        config (ModelPoolConfig): Model locations, pool budget and loading settings.
+    """
+
+    def __init__(self, config: ModelPoolConfig):
+        self.config = config
+        self._models = OrderedDict()
+        self._loading = {}
+        self._versions = {}
+        self._stats = {}
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def model_path(self, name: str) -> Path:
+        """Returns the model file of `name`; raises UnknownModelError for a name that is not a plain directory name."""
+        if not _MODEL_NAME_PATTERN.match(name):
+            raise UnknownModelError(f"Invalid model name {name!r}.")
+        return Path(os.path.join(self.config.model_root, name, self.config.model_file))
+
+    def _model_stats(self, name: str) -> dict:
+        if name not in self._stats:
+            self._stats[name] = {"hits": 0, "loads": 0, "coalesced": 0, "evictions": 0,
+                                 "last_load_seconds": None, "total_load_seconds": 0.0}
+        return self._stats[name]
+
+    def _warm_up(self, model):
+        sample = pd.DataFrame([[0.0] * len(self.config.feature_columns)], columns=self.config.feature_columns)
+        model.predict(sample)
+
+    def _load(self, name: str, entry: _PoolEntry) -> _PoolEntry:
+        """Loads `name` unless its file is unchanged since `entry` was loaded. Runs outside the pool lock."""
+        path = self.model_path(name)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            if entry is not None:
+                # The file was removed; keep serving the loaded model, like ModelServer does.
+                return _PoolEntry(entry.served, entry.size_bytes, time.monotonic())
+            raise UnknownModelError(f"No model named {name!r} at {path}.") from None
+
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+        if entry is not None and entry.served.fingerprint == fingerprint:
+            return _PoolEntry(entry.served, entry.size_bytes, time.monotonic())
+
+        started = time.perf_counter()
+        try:
+            model = load_joblib(path, mmap_mode=self.config.mmap_mode, verify_checksum=True)
+            if self.config.warmup:
+                self._warm_up(model)
+        except Exception as e:
+            if entry is None:
+                raise
+            logging.error(f"Failed to reload model {name!r} from {path}, keeping version {entry.served.version}: {e}")
+            return _PoolEntry(entry.served, entry.size_bytes, time.monotonic())
+        load_seconds = time.perf_counter() - started
+
+        with self._lock:
+            # The version changes with the file, not when an evicted model is loaded again.
+            last_fingerprint, last_version = self._versions.get(name, (None, 0))
+            version = last_version if fingerprint == last_fingerprint else last_version + 1
+            self._versions[name] = (fingerprint, version)
+            stats = self._model_stats(name)
+            stats["loads"] += 1
+            stats["last_load_seconds"] = load_seconds
+            stats["total_load_seconds"] += load_seconds
+        logging.info(f"Model {name!r} loaded from {path} in {load_seconds:.3f}s (version {version}).")
+        return _PoolEntry(ServedModel(model=model, version=version, fingerprint=fingerprint),
+                          stat.st_size, time.monotonic())
+
+    def _evict(self, keep: str):
+        """Evicts least recently used models until the pool is within budget. Called with the lock held."""
+        max_bytes = self.config.max_memory_mb * 1024 * 1024
+        while len(self._models) > 1:
+            total_bytes = sum(entry.size_bytes for entry in self._models.values())
+            if len(self._models) <= self.config.max_models and total_bytes <= max_bytes:
+                return
+            name = next(iter(self._models))
+            if name == keep:
+                self._models.move_to_end(name)
+                continue
+            del self._models[name]
+            self._model_stats(name)["evictions"] += 1
+            self._evictions += 1
+            logging.info(f"Evicted model {name!r} from the pool ({len(self._models)} models loaded).")
+
+    def get(self, name: str) -> ServedModel:
+        """
+        Returns the served snapshot of model `name`, loading it if needed.
+
+        Args:
+            name (str): Model name, a directory under `model_root`.
+
+        Raises:
+            UnknownModelError: If the name is invalid or there is no model file for it.
+            Exception: If the first load of the model fails (e.g. a checksum mismatch).
+
+        Returns:
+            ServedModel: The model, its version (counting loads of changed files) and file fingerprint.
+        """
+        with self._lock:
+            entry = self._models.get(name)
+            if entry is not None and time.monotonic() - entry.checked_at < self.config.poll_interval:
+                self._models.move_to_end(name)
+                self._model_stats(name)["hits"] += 1
+                return entry.served
+
+            loading = self._loading.get(name)
+            leader = loading is None
+            if leader:
+                loading = self._loading[name] = Future()
+        if not leader:
+            # Another request is already loading this model; share its result.
+            served = loading.result()
+            with self._lock:
+                self._model_stats(name)["coalesced"] += 1
+            return served
+
+        try:
+            new_entry = self._load(name, entry)
+        except BaseException as e:
+            with self._lock:
+                del self._loading[name]
+            loading.set_exception(e)
+            raise
+
+        with self._lock:
+            if entry is not None and new_entry.served is entry.served:
+                self._model_stats(name)["hits"] += 1
+            self._models[name] = new_entry
+            self._models.move_to_end(name)
+            self._evict(keep=name)
+            del self._loading[name]
+        loading.set_result(new_entry.served)
+        return new_entry.served
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: Pool size and budget, and per model whether it is loaded, its version and
+                file size, hits, loads, requests that waited on another request's load, evictions,
+                hit rate and load latency.
+        """
+        with self._lock:
+            models = {}
+            for name, stats in self._stats.items():
+                entry = self._models.get(name)
+                requests = stats["hits"] + stats["loads"] + stats["coalesced"]
+                models[name] = {
+                    "loaded": entry is not None,
+                    "version": entry.served.version if entry is not None else None,
+                    "size_bytes": entry.size_bytes if entry is not None else None,
+                    **stats,
+                    "hit_rate": stats["hits"] / requests if requests else 0.0,
+                    "mean_load_seconds": stats["total_load_seconds"] / stats["loads"] if stats["loads"] else None,
+                }
+            return {
+                "loaded_models": len(self._models),
+                "max_models": self.config.max_models,
+                "loaded_bytes": sum(entry.size_bytes for entry in self._models.values()),
+                "max_memory_mb": self.config.max_memory_mb,
+                "evictions": self._evictions,
+                "models": models,
+            }
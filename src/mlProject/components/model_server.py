@@ -0,0 +1,128 @@
+import os
+import logging
+import threading
+from typing import Any, NamedTuple, Optional, Tuple
+from pathlib import Path
+import pandas as pd
+from mlProject.entity.config_entity import ModelServingConfig
+from mlProject.utils.common import load_joblib
+
+
+class ServedModel(NamedTuple):
+    """
+    An immutable snapshot of the model currently being served.
+
+    Attributes:
+        model (Any): The fitted estimator.
+        version (int): Incremented every time a new model is swapped in.
+        fingerprint (tuple): (mtime_ns, size) of the model file the estimator was loaded from.
+    """
+    model: Any
+    version: int
+    fingerprint: Optional[Tuple[int, int]]
+
+
+class ModelServer:
+    """
+    A class that holds the model used for serving and hot-reloads it when a newer
+    model file is written, without restarting the process.
+
+    A new model is loaded and warmed up in the background while the current one keeps
+    serving. It then replaces the current snapshot with a single reference assignment,
+    so requests that already hold the old snapshot finish on the old model.
+
+    Attributes:
+        config (ModelServingConfig): Configuration containing the model path, feature
+                                     columns, mmap mode and polling interval.
+    """
+
+    def __init__(self, config: ModelServingConfig):
+        """
+        Initializes the ModelServer with the given configuration. No model is loaded yet.
+
+        Args:
+            config (ModelServingConfig): Configuration for model serving.
+        """
+        self.config = config
+        self._current = ServedModel(model=None, version=0, fingerprint=None)
+        self._reload_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._watcher = None
+
+    @property
+    def current(self) -> ServedModel:
+        """The served snapshot. Read it once per request and use that snapshot throughout."""
+        return self._current
+
+    @property
+    def model(self) -> Any:
+        return self._current.model
+
+    @property
+    def version(self) -> int:
+        return self._current.version
+
+    def _get_fingerprint(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.config.model_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _warm_up(self, model: Any):
+        """Runs one prediction so lazy initialisation happens before the model takes traffic."""
+        sample = pd.DataFrame([[0.0] * len(self.config.feature_columns)], columns=self.config.feature_columns)
+        model.predict(sample)
+
+    def reload_if_changed(self) -> bool:
+        """
+        Loads the model file if it changed since the last load and swaps it in.
+
+        The file is checked against its `.sha256` checksum before loading. A model that
+        fails the check, fails to load or fails to warm up is discarded and the current
+        model keeps serving; the next poll retries.
+
+        Returns:
+            bool: True if a new model was swapped in, False otherwise.
+        """
+        with self._reload_lock:
+            fingerprint = self._get_fingerprint()
+            if fingerprint is None:
+                if self._current.model is None:
+                    logging.warning(f"No model found at {self.config.model_path}.")
+                return False
+            if fingerprint == self._current.fingerprint:
+                return False
+
+            try:
+                model = load_joblib(Path(self.config.model_path), mmap_mode=self.config.mmap_mode, verify_checksum=True)
+                if self.config.warmup:
+                    self._warm_up(model)
+            except Exception as e:
+                logging.error(f"Failed to load model from {self.config.model_path}, keeping the current model: {e}")
+                return False
+
+            # A single reference assignment is atomic; in-flight requests keep their snapshot.
+            self._current = ServedModel(model=model, version=self._current.version + 1, fingerprint=fingerprint)
+            logging.info(f"Model loaded from {self.config.model_path} (version {self._current.version}).")
+            return True
+
+    def _watch(self):
+        while not self._stop_event.wait(self.config.poll_interval):
+            self.reload_if_changed()
+
+    def start_watching(self):
+        """Starts a daemon thread that polls the model file and hot-reloads it when it changes."""
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self._stop_event.clear()
+        self._watcher = threading.Thread(target=self._watch, name="model-watcher", daemon=True)
+        self._watcher.start()
+        logging.info(f"Watching {self.config.model_path} every {self.config.poll_interval}s for new models.")
+
+    def stop_watching(self):
+        """Stops the watcher thread, if running."""
+        self._stop_event.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
@@ -1,30 +1,206 @@
 import pandas as pd
+import numpy as np
 import os
+import time
 import logging
+from sklearn.base import clone
+from sklearn.ensemble import HistGradientBoostingClassifier, HistGradientBoostingRegressor
 from sklearn.linear_model import ElasticNet
-import joblib
+from pathlib import Path
 from mlProject.entity.config_entity import ModelTrainerConfig
+from mlProject.entity.artifact_entity import ArtifactContext
+from mlProject.utils.common import save_joblib, load_joblib, get_joblib_compression, save_json
+from mlProject.utils.metrics import regression_metrics, task_type
+from mlProject.utils.resources import allocate_cores, limit_threads
+
+
+# `model_trainer.estimator` -> estimator class; its hyperparameters are the params.yaml section of the same name.
+ESTIMATORS = {
+    "ElasticNet": ElasticNet,
+    "HistGradientBoostingRegressor": HistGradientBoostingRegressor,
+    "HistGradientBoostingClassifier": HistGradientBoostingClassifier,
+}
+
+# Estimators whose fit can start from a previous model's coefficients.
+WARM_START_ESTIMATORS = ("ElasticNet",)
+
+# Single-row predictions timed for the latency figures of the training report.
+LATENCY_SAMPLES = 50
 
 
 
 class ModelTrainer:
-    def __init__(self, config: ModelTrainerConfig):
+    def __init__(self, config: ModelTrainerConfig, context: ArtifactContext = None):
         self.config = config
+        self.context = context or ArtifactContext()
 
     
     def train(self):
-        train_data = pd.read_csv(self.config.train_data_path)
-        test_data = pd.read_csv(self.config.test_data_path)
+        # In compact mode the data is read as float32/int8 and stays that way through the fit.
+        # A shallow copy keeps the shared frame intact; pop() then avoids copying the features with drop().
+        train_x = self.context.load_csv(self.config.train_data_path, dtype=self.config.dtypes).copy(deep=False)
+        train_y = train_x.pop(self.config.target_column)
+
+
+        lr = self.build_estimator()
+        model_path = Path(os.path.join(self.config.root_dir, self.config.model_name))
+
+        if not self.config.warm_start:
+            previous, reason = None, "disabled"
+        elif self.config.estimator not in WARM_START_ESTIMATORS:
+            previous, reason = None, f"not supported for {self.config.estimator}"
+        else:
+            previous, reason = self.load_warm_start_model(model_path, lr, train_x)
+        if previous is not None:
+            # Coordinate descent starts from the previous coefficients instead of zeros.
+            lr.coef_ = previous.coef_.astype(np.result_type(*train_x.dtypes), copy=True)
+
+        allocation = allocate_cores("Model training", 1, total_cores=self.config.total_cores)
+        started = time.perf_counter()
+        with limit_threads(allocation.threads_per_worker):
+            lr.fit(train_x, train_y)
+        fit_seconds = time.perf_counter() - started
+
+        compress = get_joblib_compression(self.config.compression_codec, self.config.compression_level)
+        save_joblib(model_path, lr, compress=compress)
+
+        previous_n_iter = int(previous.n_iter_) if previous is not None else None
+        if previous is not None:
+            logging.info(f"Warm-started fit converged in {lr.n_iter_} iterations ({fit_seconds:.3f}s); "
+                         f"the previous model's fit took {previous_n_iter}.")
+        elif getattr(lr, "do_early_stopping_", False):
+            logging.info(f"{self.config.estimator} fit stopped early after {lr.n_iter_} of {lr.max_iter} "
+                         f"iterations ({fit_seconds:.3f}s).")
+        else:
+            logging.info(f"Cold-started fit ({reason}) converged in {lr.n_iter_} iterations ({fit_seconds:.3f}s).")
+
+        with limit_threads(allocation.threads_per_worker):
+            serving_cost = self.measure_serving_cost(lr, model_path)
+        save_json(Path(os.path.join(self.config.root_dir, "training_report.json")), {
+            "estimator": self.config.estimator,
+            "task": task_type(lr),
+            "warm_start": previous is not None,
+            "cold_start_reason": None if previous is not None else reason,
+            "n_iter": int(lr.n_iter_),
+            "previous_n_iter": previous_n_iter,
+            "fit_seconds": fit_seconds,
+            "fit_threads": allocation.threads_per_worker,
+            "train_rows": len(train_x),
+            **serving_cost,
+        })
+
+        if self.config.dtypes and self.config.precision_report and task_type(lr) == "regression":
+            self.report_precision_loss(lr, train_x, train_y)
+
+    def build_estimator(self):
+        """
+        Creates the configured estimator (`model_trainer.estimator`) with its params.yaml
+        hyperparameters and a fixed random_state.
+        """
+        if self.config.estimator not in ESTIMATORS:
+            raise ValueError(f"Unknown estimator {self.config.estimator!r}; expected one of {list(ESTIMATORS)}.")
+        if self.config.estimator == "ElasticNet":
+            return ElasticNet(alpha=self.config.alpha, l1_ratio=self.config.l1_ratio, random_state=42,
+                              warm_start=self.config.warm_start)
+        return ESTIMATORS[self.config.estimator](random_state=42, **(self.config.estimator_params or {}))
+
+    def measure_serving_cost(self, model, model_path: Path) -> dict:
+        """
+        Measures what the fitted model costs to serve. Its test metrics are left to the
+        model evaluation stage.
+
+        Returns:
+            dict: The model file size, and prediction latency on the test rows, batched and for single rows.
+        """
+        test_x = self.context.load_csv(self.config.test_data_path, dtype=self.config.dtypes).copy(deep=False)
+        test_x.pop(self.config.target_column)
+
+        started = time.perf_counter()
+        model.predict(test_x)
+        batch_seconds = time.perf_counter() - started
+
+        single_row_ms = []
+        for row in range(min(LATENCY_SAMPLES, len(test_x))):
+            started = time.perf_counter()
+            model.predict(test_x.iloc[row:row + 1])
+            single_row_ms.append((time.perf_counter() - started) * 1000)
+
+        serving_cost = {
+            "test_rows": len(test_x),
+            "model_size_bytes": os.path.getsize(model_path),
+            "batch_predict_us_per_row": batch_seconds * 1e6 / len(test_x) if len(test_x) else None,
+            "single_row_predict_ms_p50": float(np.median(single_row_ms)) if single_row_ms else None,
+        }
+        logging.info(f"{self.config.estimator}: model {serving_cost['model_size_bytes'] / 1024:.1f} KiB, "
+                     f"{serving_cost['batch_predict_us_per_row'] or 0:.2f} us/row batched, "
+                     f"{serving_cost['single_row_predict_ms_p50'] or 0:.3f} ms per single row "
+                     f"on {len(test_x)} test rows.")
+        return serving_cost
+
+    def load_warm_start_model(self, model_path: Path, estimator, train_x: pd.DataFrame) -> tuple:
+        """
+        Loads the previous model if a new fit can start from it.
+
+        It can when it is the same estimator class with the same hyperparameters, fitted on
+        the same feature columns in the same order.
+
+        Returns:
+            tuple: (previous model, None), or (None, the reason it cannot be used).
+        """
+        if not model_path.exists():
+            return None, "no previous model"
+        try:
+            previous = load_joblib(model_path, verify_checksum=True)
+        except Exception as e:
+            logging.warning(f"Could not load the previous model {model_path} for warm start: {e}")
+            return None, "previous model unreadable"
 
+        if type(previous) is not type(estimator):
+            return None, f"previous model is a {type(previous).__name__}"
+        ignored = {"warm_start"}
+        if ({key: value for key, value in previous.get_params().items() if key not in ignored}
+                != {key: value for key, value in estimator.get_params().items() if key not in ignored}):
+            return None, "hyperparameters changed"
+        if list(getattr(previous, "feature_names_in_", [])) != list(train_x.columns):
+            return None, "feature columns changed"
+        return previous, None
 
-        train_x = train_data.drop([self.config.target_column], axis=1)
-        test_x = test_data.drop([self.config.target_column], axis=1)
-        train_y = train_data[[self.config.target_column]]
-        test_y = test_data[[self.config.target_column]]
+    def report_precision_loss(self, model, train_x: pd.DataFrame, train_y: pd.Series) -> dict:
+        """
+        Compares the compact (float32) model with a float64 reference (the same estimator) fitted on the same rows.
 
+        Writes `precision_report.json` with the test metrics of both models, their
+        difference, the largest float32 rounding error per feature and the memory of
+        the training features in each precision.
+        """
+        full_test = pd.read_csv(self.config.test_data_path)
+        test_y = full_test.pop(self.config.target_column).to_numpy(dtype=np.float64)
+        compact_test = full_test.astype({column: dtype for column, dtype in self.config.dtypes.items()
+                                         if column in full_test.columns})
 
-        lr = ElasticNet(alpha=self.config.alpha, l1_ratio=self.config.l1_ratio, random_state=42)
-        lr.fit(train_x, train_y)
+        reference_x = train_x.astype(np.float64)
+        reference = clone(model)
+        if "warm_start" in reference.get_params():
+            reference.set_params(warm_start=False)
+        reference.fit(reference_x, train_y.astype(np.float64))
 
-        joblib.dump(lr, os.path.join(self.config.root_dir, self.config.model_name))
+        compact_metrics = regression_metrics(test_y, model.predict(compact_test))
+        reference_metrics = regression_metrics(test_y, reference.predict(full_test))
+        report = {
+            "compact": compact_metrics,
+            "float64_reference": reference_metrics,
+            "difference": {name: compact_metrics[name] - reference_metrics[name] for name in compact_metrics},
+            "max_feature_rounding_error": {
+                column: float(np.max(np.abs(full_test[column].to_numpy() - compact_test[column].to_numpy(dtype=np.float64))))
+                for column in full_test.columns
+            },
+            "train_features_bytes": {
+                "compact": int(train_x.memory_usage(index=False).sum()),
+                "float64": int(reference_x.memory_usage(index=False).sum()),
+            },
+        }
 
+        save_json(Path(os.path.join(self.config.root_dir, "precision_report.json")), report)
+        logging.info(f"Compact-mode precision report: rmse {compact_metrics['rmse']:.6f} vs "
+                     f"{reference_metrics['rmse']:.6f} (float64), difference {report['difference']['rmse']:+.2e}.")
+        return report
@@ -0,0 +1,126 @@
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, List
+import numpy as np
+from mlProject.entity.config_entity import PredictionCacheConfig
+
+
+class PredictionCache:
+    """
+    A bounded LRU/TTL cache of predictions keyed on normalized feature vectors.
+
+    Feature rows (already in schema column order) are rounded to the configured
+    precision and their raw float64 bytes are used as the key, so a repeated row
+    costs one hash lookup instead of a model call. The cache remembers the model
+    version its entries came from and clears itself when a different version is used.
+
+    Attributes:
+        config (PredictionCacheConfig): Size cap, TTL and rounding precision of the cache.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that had to be computed by the model.
+    """
+
+    def __init__(self, config: PredictionCacheConfig):
+        """
+        Initializes an empty PredictionCache.
+
+        Args:
+            config (PredictionCacheConfig): Configuration for the cache.
+        """
+        self.config = config
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._model_version = None
+        self._lock = threading.Lock()
+
+    def make_keys(self, features: np.ndarray) -> List[bytes]:
+        """
+        Builds one cache key per feature row.
+
+        Args:
+            features (np.ndarray): 2-D array of feature rows ordered by schema.yaml.
+
+        Returns:
+            List[bytes]: The rounded float64 bytes of each row.
+        """
+        rounded = np.round(np.asarray(features, dtype=np.float64), self.config.precision)
+        # Adding 0.0 turns -0.0 into 0.0 so both hash the same.
+        rounded = np.ascontiguousarray(rounded + 0.0)
+        return [row.tobytes() for row in rounded]
+
+    def _check_version(self, model_version: int):
+        if model_version != self._model_version:
+            if self._entries:
+                logging.info(f"Model version changed to {model_version}; clearing {len(self._entries)} cached predictions.")
+            self._entries.clear()
+            self._model_version = model_version
+
+    def get_many(self, keys: List[bytes], model_version: int) -> List[Any]:
+        """
+        Looks up cached predictions.
+
+        Args:
+            keys (List[bytes]): Keys built by `make_keys`.
+            model_version (int): Version of the model that would answer misses.
+
+        Returns:
+            List[Any]: The cached prediction for each key, or None where it is missing or expired.
+        """
+        now = time.monotonic()
+        results = []
+        with self._lock:
+            self._check_version(model_version)
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and (entry[1] is None or entry[1] > now):
+                    self._entries.move_to_end(key)
+                    results.append(entry[0])
+                    self.hits += 1
+                else:
+                    if entry is not None:
+                        del self._entries[key]
+                    results.append(None)
+                    self.misses += 1
+        return results
+
+    def put_many(self, keys: List[bytes], predictions: Any, model_version: int):
+        """
+        Stores predictions, evicting the least recently used entries beyond `max_size`.
+
+        Args:
+            keys (List[bytes]): Keys built by `make_keys`.
+            predictions (Any): One prediction per key.
+            model_version (int): Version of the model that produced the predictions.
+        """
+        expires_at = time.monotonic() + self.config.ttl_seconds if self.config.ttl_seconds else None
+        with self._lock:
+            self._check_version(model_version)
+            for key, prediction in zip(keys, predictions):
+                self._entries[key] = (prediction, expires_at)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.config.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drops every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: Hit/miss counters, hit rate and current size of the cache.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+                "max_size": self.config.max_size,
+                "model_version": self._model_version,
+            }
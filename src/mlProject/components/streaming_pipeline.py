@@ -0,0 +1,191 @@
+import io
+import os
+import time
+import queue
+import logging
+import threading
+from contextlib import closing
+from pathlib import Path
+import pandas as pd
+from mlProject.entity.config_entity import StreamingConfig
+from mlProject.components.data_ingestion import DataIngestion
+from mlProject.components.data_validation import DataValidation
+from mlProject.components.data_transformation import DataTransformation
+from mlProject.utils.deduplication import RowHashSet, row_hashes
+
+
+# Put on a queue after the last block or chunk.
+_END = object()
+
+
+class SchemaValidationError(Exception):
+    """Raised in the validation step of a streaming run to abort the other steps."""
+
+
+class StreamingPipeline:
+    """
+    A class that runs extraction, validation and the train/test split as one pipelined
+    pass over the data file, instead of three stages that each read all of it.
+
+    Process (three steps running concurrently, linked by bounded queues):
+        1. Extract: decompresses the data file from the archive, writes it to disk and
+           hands on blocks of complete lines.
+        2. Validate: parses each block, checks it against the schema and hashes its rows
+           to count duplicates across the whole file.
+        3. Split: drops duplicate rows (with `deduplication.enabled`), splits each chunk
+           (0.75, 0.25) and appends it to train.csv and test.csv.
+
+    A full queue blocks the step feeding it, so at most about 2 x `queue_size` + 3 blocks
+    are in memory. An invalid chunk stops all three steps at once; the validation status
+    is written either way, and the splits are only replaced after a complete, valid run.
+
+    Attributes:
+        config (StreamingConfig): Data file name, block size and queue size.
+        data_ingestion (DataIngestion): Extracts the archive.
+        data_validation (DataValidation): Validates the chunks and writes the status.
+        data_transformation (DataTransformation): Deduplication, dtypes and split output.
+    """
+
+    def __init__(self, config: StreamingConfig, data_ingestion: DataIngestion,
+                 data_validation: DataValidation, data_transformation: DataTransformation):
+        self.config = config
+        self.data_ingestion = data_ingestion
+        self.data_validation = data_validation
+        self.data_transformation = data_transformation
+        self._abort = threading.Event()
+
+    def _put(self, target: queue.Queue, item) -> bool:
+        """Blocks while `target` is full; returns False, without putting, once the run is aborted."""
+        while not self._abort.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, source: queue.Queue):
+        """Blocks until an item arrives; returns `_END` once the run is aborted."""
+        while True:
+            try:
+                return source.get(timeout=0.1)
+            except queue.Empty:
+                if self._abort.is_set():
+                    return _END
+
+    def _run_step(self, step, errors: list, *args):
+        try:
+            step(*args)
+        except BaseException as e:
+            errors.append(e)
+            self._abort.set()
+
+    def _extract(self, blocks: queue.Queue):
+        with closing(self.data_ingestion.iter_extracted_blocks(self.config.member, self.config.block_size)) as extracted:
+            for block in extracted:
+                if not self._put(blocks, block):
+                    return
+        self._put(blocks, _END)
+
+    def _validate(self, blocks: queue.Queue, chunks: queue.Queue, counts: dict):
+        seen = RowHashSet(self.data_transformation.config.hash_partitions)
+        columns = None
+        while (block := self._get(blocks)) is not _END:
+            if columns is None:
+                chunk = pd.read_csv(io.BytesIO(block))
+                columns = list(chunk.columns)
+            else:
+                chunk = pd.read_csv(io.BytesIO(block), header=None, names=columns)
+
+            chunk, mismatches = self.data_validation.validate_chunk(chunk)
+            if mismatches:
+                for mismatch in mismatches:
+                    logging.info(mismatch)
+                raise SchemaValidationError(f"The chunk starting at row {counts['rows']} does not match "
+                                            f"the schema: {mismatches[0]}")
+            if chunk.empty:
+                # A block_size below the header plus one row gives a first block with only the
+                # header; its columns are kept and the rows follow in the next block.
+                continue
+
+            is_new = seen.add(row_hashes(chunk))
+            counts["rows"] += len(chunk)
+            counts["duplicate_rows"] += int(len(chunk) - is_new.sum())
+            if not self._put(chunks, (chunk, is_new)):
+                return
+        self._put(chunks, _END)
+
+    def _split(self, chunks: queue.Queue, tmp_paths: dict) -> dict:
+        config = self.data_transformation.config
+        written = {}
+        while (item := self._get(chunks)) is not _END:
+            chunk, is_new = item
+            if config.deduplicate:
+                chunk = chunk[is_new]
+            if config.dtypes:
+                chunk = chunk.astype(config.dtypes)
+
+            for name, part in zip(("train", "test"), self.data_transformation.split_chunk(chunk)):
+                # The first chunk creates the file with the header; later ones are appended.
+                part.to_csv(tmp_paths[name], mode="a" if name in written else "w", header=name not in written,
+                            index=False)
+                written[name] = written.get(name, 0) + len(part)
+
+        if not self._abort.is_set():
+            # A split that received no rows (e.g. from a file with only a header) still gets the header.
+            for name in ("train", "test"):
+                if name not in written:
+                    pd.DataFrame(columns=list(self.data_validation.config.all_schema)).to_csv(tmp_paths[name], index=False)
+                    written[name] = 0
+        return written
+
+    def run(self) -> bool:
+        """
+        Streams the data file from the archive through validation into train.csv and test.csv.
+
+        Raises:
+            Exception: Any error of one of the steps, after all of them have stopped.
+
+        Returns:
+            bool: The validation status. False means the splits were left unchanged.
+        """
+        root_dir = self.data_transformation.config.root_dir
+        final_paths = {name: os.path.join(root_dir, f"{name}.csv") for name in ("train", "test")}
+        tmp_paths = {name: f"{path}.{os.getpid()}.tmp" for name, path in final_paths.items()}
+
+        blocks = queue.Queue(maxsize=self.config.queue_size)
+        chunks = queue.Queue(maxsize=self.config.queue_size)
+        counts = {"rows": 0, "duplicate_rows": 0}
+        errors = []
+        steps = [
+            threading.Thread(target=self._run_step, args=(self._extract, errors, blocks), name="streaming-extract"),
+            threading.Thread(target=self._run_step, args=(self._validate, errors, blocks, chunks, counts),
+                             name="streaming-validate"),
+        ]
+
+        started = time.perf_counter()
+        self._abort.clear()
+        for step in steps:
+            step.start()
+        written = {}
+        # The split runs in this thread.
+        self._run_step(lambda: written.update(self._split(chunks, tmp_paths)), errors)
+        for step in steps:
+            step.join()
+
+        if errors:
+            for path in tmp_paths.values():
+                Path(path).unlink(missing_ok=True)
+            if isinstance(errors[0], SchemaValidationError):
+                logging.info(f"Streaming run aborted after {counts['rows']} rows: {errors[0]}")
+                self.data_validation.write_validation_status(False, counts["rows"], counts["duplicate_rows"])
+                return False
+            raise errors[0]
+
+        for name in ("train", "test"):
+            os.replace(tmp_paths[name], final_paths[name])
+        logging.info("All columns and data types match the expected schema successfully.")
+        self.data_validation.write_validation_status(True, counts["rows"], counts["duplicate_rows"])
+        logging.info(f"Streamed {counts['rows']} rows into {written['train']} train and {written['test']} test rows "
+                     f"({counts['duplicate_rows']} duplicates) in {time.perf_counter() - started:.2f}s")
+        return True
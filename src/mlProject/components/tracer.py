@@ -0,0 +1,284 @@
+import os
+import time
+import queue
+import random
+import atexit
+import logging
+import threading
+from bisect import bisect_left
+from pathlib import Path
+from mlProject.entity.config_entity import TracingConfig
+from mlProject.utils.common import save_jsonl
+
+
+# Upper bounds (milliseconds) of the latency histogram buckets; the last bucket is open-ended.
+HISTOGRAM_BUCKETS_MS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+
+def _attribute(key: str, value) -> dict:
+    """Encodes one span attribute the way OTLP/JSON does."""
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        # OTLP/JSON encodes 64-bit integers as strings.
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+class _NullSpan:
+    """Context manager of an unsampled request: every operation is a no-op."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set_attribute(self, key: str, value):
+        pass
+
+
+class _NullTrace:
+    __slots__ = ()
+    sampled = False
+    trace_id = None
+
+    def span(self, name: str, **attributes):
+        return _NULL_SPAN
+
+    def end(self, **attributes):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+NULL_TRACE = _NullTrace()
+
+
+class _Span:
+    __slots__ = ("trace", "name", "span_id", "parent_span_id", "kind", "attributes", "start_ns", "end_ns", "error")
+
+    def __init__(self, trace, name: str, parent_span_id: str, kind: str, attributes: dict):
+        self.trace = trace
+        self.name = name
+        self.span_id = os.urandom(8).hex()
+        self.parent_span_id = parent_span_id
+        self.kind = kind
+        self.attributes = attributes
+        self.start_ns = self.end_ns = None
+        self.error = None
+
+    def __enter__(self):
+        self.trace._stack.append(self.span_id)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end_ns = time.perf_counter_ns()
+        self.trace._stack.pop()
+        if exc is not None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        self.trace._spans.append(self)
+        return False
+
+    def set_attribute(self, key: str, value):
+        self.attributes[key] = value
+
+
+class Trace:
+    """
+    The spans of one sampled request. Spans opened with `span()` nest under the span
+    that is open at the time, and under the root span otherwise.
+
+    A trace belongs to the thread handling its request and is not thread-safe.
+    """
+
+    sampled = True
+
+    def __init__(self, tracer, name: str, trace_id: str = None, parent_span_id: str = None, **attributes):
+        self.tracer = tracer
+        self.trace_id = trace_id or os.urandom(16).hex()
+        # Wall-clock anchor; span times are measured with perf_counter_ns and offset from it.
+        self._wall_start_ns = time.time_ns()
+        self._perf_start_ns = time.perf_counter_ns()
+        self._spans = []
+        self._stack = []
+        self._root = _Span(self, name, parent_span_id, "SPAN_KIND_SERVER", attributes)
+        self._root.__enter__()
+
+    def span(self, name: str, **attributes) -> _Span:
+        return _Span(self, name, self._stack[-1], "SPAN_KIND_INTERNAL", attributes)
+
+    def end(self, **attributes):
+        """Closes the root span and hands the trace to the tracer for export."""
+        self._root.attributes.update(attributes)
+        self._root.__exit__(None, None, None)
+        self.tracer._finish(self)
+
+    def _to_otlp(self, span: _Span) -> dict:
+        otlp = {
+            "traceId": self.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": span.kind,
+            "startTimeUnixNano": str(self._wall_start_ns + span.start_ns - self._perf_start_ns),
+            "endTimeUnixNano": str(self._wall_start_ns + span.end_ns - self._perf_start_ns),
+            "attributes": [_attribute(key, value) for key, value in span.attributes.items()],
+            "status": {"code": "STATUS_CODE_ERROR", "message": span.error} if span.error else {"code": "STATUS_CODE_OK"},
+        }
+        if span.parent_span_id:
+            otlp["parentSpanId"] = span.parent_span_id
+        return otlp
+
+
+class Tracer:
+    """
+    A class that records request-level tracing spans in the serving path.
+
+    Requests are sampled at `sample_rate`. An unsampled request gets `NULL_TRACE`, whose
+    spans do nothing, so tracing costs one random draw per request when sampling is off.
+
+    For sampled requests:
+    1. Every span's duration is added to a per-span-name latency histogram (`histogram()`).
+    2. The finished trace is queued and a background thread appends it to `export_path`
+       as one line of OTLP/JSON (`resourceSpans` -> `scopeSpans` -> `spans`), the format
+       of the OpenTelemetry collector's file exporter.
+
+    Attributes:
+        config (TracingConfig): Sample rate, export file and service name.
+    """
+
+    def __init__(self, config: TracingConfig):
+        """
+        Initializes the Tracer.
+
+        Args:
+            config (TracingConfig): Sample rate, export file and service name.
+        """
+        self.config = config
+        self._resource = {"attributes": [_attribute("service.name", config.service_name)]}
+        self._histograms = {}
+        self._histograms_lock = threading.Lock()
+        self._export_queue = queue.SimpleQueue()
+        self._exporter = None
+        self._exporter_lock = threading.Lock()
+
+    def start_trace(self, name: str, traceparent: str = None, **attributes):
+        """
+        Starts the trace of one request, or returns `NULL_TRACE` if the request is not sampled.
+
+        Args:
+            name (str): Name of the root span, e.g. "POST /predict".
+            traceparent (str, optional): W3C `traceparent` header of the request. A caller that
+                sampled the request forces sampling here too, and its trace ID is kept.
+            **attributes: Attributes of the root span.
+
+        Returns:
+            Trace: The trace, to be closed with `end()`.
+        """
+        trace_id = parent_span_id = None
+        if traceparent:
+            parts = traceparent.split("-")
+            if len(parts) == 4 and len(parts[1]) == 32 and len(parts[2]) == 16 \
+                    and len(parts[3]) == 2 and parts[3][-1] in "13579bdf":
+                trace_id, parent_span_id = parts[1], parts[2]
+
+        if trace_id is None and (self.config.sample_rate <= 0 or random.random() >= self.config.sample_rate):
+            return NULL_TRACE
+        return Trace(self, name, trace_id=trace_id, parent_span_id=parent_span_id, **attributes)
+
+    def _finish(self, trace: Trace):
+        with self._histograms_lock:
+            for span in trace._spans:
+                histogram = self._histograms.get(span.name)
+                if histogram is None:
+                    histogram = self._histograms[span.name] = {
+                        "count": 0, "sum_ms": 0.0, "max_ms": 0.0, "buckets": [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+                    }
+                duration_ms = (span.end_ns - span.start_ns) / 1e6
+                histogram["count"] += 1
+                histogram["sum_ms"] += duration_ms
+                histogram["max_ms"] = max(histogram["max_ms"], duration_ms)
+                histogram["buckets"][bisect_left(HISTOGRAM_BUCKETS_MS, duration_ms)] += 1
+
+        self._export_queue.put(trace)
+        if self._exporter is None:
+            self._start_exporter()
+
+    def _start_exporter(self):
+        with self._exporter_lock:
+            if self._exporter is None:
+                Path(self.config.export_path).parent.mkdir(parents=True, exist_ok=True)
+                self._exporter = threading.Thread(target=self._export_loop, name="trace-exporter", daemon=True)
+                self._exporter.start()
+                atexit.register(self.flush)
+
+    def _export_loop(self):
+        # Traces stay queued until written, so the exit-time flush also catches the last batch.
+        while True:
+            time.sleep(self.config.flush_interval)
+            self.flush()
+
+    def flush(self):
+        """Writes the queued traces to the export file."""
+        traces = []
+        while True:
+            try:
+                traces.append(self._export_queue.get_nowait())
+            except queue.Empty:
+                break
+        if not traces:
+            return
+
+        lines = [{
+            "resourceSpans": [{
+                "resource": self._resource,
+                "scopeSpans": [{"scope": {"name": "mlProject.serving"},
+                                "spans": [trace._to_otlp(span) for span in trace._spans]}],
+            }]
+        } for trace in traces]
+        try:
+            with self._exporter_lock:
+                save_jsonl(Path(self.config.export_path), lines, append=True)
+        except OSError as e:
+            logging.error(f"Could not export {len(lines)} traces to {self.config.export_path}: {e}")
+
+    def histogram(self) -> dict:
+        """
+        Returns the latency histogram of every span name seen in sampled requests.
+
+        Returns:
+            dict: Span name -> count, mean/max latency, approximate p50/p95/p99 (the upper
+                bound of the bucket holding the percentile) and the cumulative bucket counts
+                keyed by upper bound in milliseconds, as in a Prometheus histogram.
+        """
+        with self._histograms_lock:
+            snapshot = {name: {**histogram, "buckets": list(histogram["buckets"])}
+                        for name, histogram in self._histograms.items()}
+
+        bounds = [str(bound) for bound in HISTOGRAM_BUCKETS_MS] + ["+Inf"]
+        report = {}
+        for name, histogram in snapshot.items():
+            cumulative, running = [], 0
+            for count in histogram["buckets"]:
+                running += count
+                cumulative.append(running)
+
+            def percentile(q: float):
+                rank = q * histogram["count"]
+                index = next(i for i, count in enumerate(cumulative) if count >= rank)
+                return HISTOGRAM_BUCKETS_MS[index] if index < len(HISTOGRAM_BUCKETS_MS) else histogram["max_ms"]
+
+            report[name] = {
+                "count": histogram["count"],
+                "mean_ms": histogram["sum_ms"] / histogram["count"],
+                "max_ms": histogram["max_ms"],
+                "p50_ms": percentile(0.50),
+                "p95_ms": percentile(0.95),
+                "p99_ms": percentile(0.99),
+                "buckets": dict(zip(bounds, cumulative)),
+            }
+        return report
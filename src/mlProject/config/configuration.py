@@ -1,9 +1,29 @@
 from mlProject.constant import *
-from mlProject.utils.common import load_yaml, create_directories
+import os
+from mlProject.utils.common import load_yaml_cached, create_directories, get_compact_dtypes
 from mlProject.entity.config_entity import (DataIngestionConfig, 
+                                            IncrementalIngestionConfig,
                                             DataValidationConfig,
                                             DataTransformationConfig, 
-                                            ModelTrainerConfig)
+                                            StreamingConfig,
+                                            ModelTrainerConfig,
+                                            ModelServingConfig,
+                                            ModelPoolConfig,
+                                            PredictionCacheConfig,
+                                            TracingConfig,
+                                            LoadTestConfig,
+                                            BatchScoringConfig,
+                                            MultiDatasetConfig,
+                                            HyperparameterSweepConfig,
+                                            CrossValidationConfig,
+                                            ModelEvaluationConfig)
+
+
+def _create_missing_directories(paths: list):
+    """Creates only the directories that do not exist yet, so repeated calls are a cheap stat."""
+    missing = [path for path in paths if not os.path.isdir(path)]
+    if missing:
+        create_directories(missing)
 
 
 class ConfigurationManager:
@@ -12,15 +32,20 @@ class ConfigurationManager:
     It loads configuration files (YAML) and returns stage-specific configuration 
     objects with all necessary parameters.
 
+    The YAML files are parsed once per process and shared between instances
+    (see `load_yaml_cached`); they are re-parsed only when a file changes on disk,
+    so constructing a ConfigurationManager repeatedly is cheap.
+
     Attributes:
-        config (dict): Loaded configuration from the main config YAML file.
-        params (dict): Loaded parameters from the params YAML file.
-        schema (dict): Loaded schema definitions from the schema YAML file.
+        config (FrozenConfig): Loaded configuration from the main config YAML file.
+        params (FrozenConfig): Loaded parameters from the params YAML file.
+        schema (FrozenConfig): Loaded schema definitions from the schema YAML file.
     """
 
     def __init__(self, config_filepath=CONFIG_FILE_PATH, 
                  params_filepath=PARAMS_FILE_PATH,
-                 schema_filepath=SCHEMA_FILE_PATH):
+                 schema_filepath=SCHEMA_FILE_PATH,
+                 dataset=None):
         """
         Initializes the ConfigurationManager by loading the configuration, parameters, 
         and schema files. Also ensures that the main artifacts directory exists.
@@ -29,13 +54,49 @@ class ConfigurationManager:
             config_filepath (str): Path to the main configuration YAML file.
             params_filepath (str): Path to the parameters YAML file.
             schema_filepath (str): Path to the schema YAML file.
+            dataset (str, optional): Name of a dataset listed under `datasets` in the config.
+                When given, the validation, transformation and training configs read that
+                dataset's file and use its own artifact subtree (e.g. artifacts/datasets/red/...).
+
+        Raises:
+            ValueError: If `dataset` is not listed in the configuration.
         """
-        self.config = load_yaml(config_filepath)
-        self.params = load_yaml(params_filepath)
-        self.schema = load_yaml(schema_filepath)
+        self.config = load_yaml_cached(config_filepath)
+        self.params = load_yaml_cached(params_filepath)
+        self.schema = load_yaml_cached(schema_filepath)
+
+        self.dataset = None
+        if dataset is not None:
+            datasets = {item.name: item for item in self.config.datasets.sources}
+            if dataset not in datasets:
+                raise ValueError(f"Unknown dataset '{dataset}'. Configured datasets: {list(datasets)}")
+            self.dataset = datasets[dataset]
 
         # Create the main artifacts directory
-        create_directories([self.config.artifacts_root])
+        _create_missing_directories([self.config.artifacts_root])
+
+    def _dataset_artifact_path(self, path: str) -> str:
+        """Moves an artifacts path into the selected dataset's subtree (unchanged when no dataset is selected)."""
+        if self.dataset is None:
+            return path
+        relative_path = os.path.relpath(path, self.config.artifacts_root)
+        return os.path.join(self.config.datasets.root_dir, self.dataset.name, relative_path)
+
+    def _get_compact_dtypes(self):
+        """Returns the compact read dtypes when `compact_dtypes.enabled` is set, else None."""
+        if not self.config.compact_dtypes.enabled:
+            return None
+        return get_compact_dtypes(dict(self.schema.COLUMNS), self.schema.TARGET_COLUMN.name)
+
+    def _total_cores(self):
+        """Returns the `resources.total_cores` budget, or None (0 in the config) for all available cores."""
+        return self.config.resources.total_cores or None
+
+    def _dataset_source_file(self, path: str) -> str:
+        """Returns the selected dataset's extracted file (or `path` when no dataset is selected)."""
+        if self.dataset is None:
+            return path
+        return os.path.join(self.config.data_ingestion.unzip_dir, self.dataset.file)
 
     def get_data_ingestion_config(self) -> DataIngestionConfig:
         """
@@ -54,7 +115,7 @@ class ConfigurationManager:
                 - unzip_dir (str): Directory where the data will be extracted.
         """
         config = self.config.data_ingestion
-        create_directories([config.root_dir])
+        _create_missing_directories([config.root_dir])
 
         data_ingestion_config = DataIngestionConfig(
             root_dir=config.root_dir,
@@ -65,6 +126,38 @@ class ConfigurationManager:
 
         return data_ingestion_config
 
+    def _incremental(self) -> bool:
+        """Incremental ingestion applies to the default dataset only, not to named `datasets`."""
+        return self.dataset is None and self.config.incremental_ingestion.enabled
+
+    def get_incremental_ingestion_config(self) -> IncrementalIngestionConfig:
+        """
+        Retrieves the configuration of incremental ingestion.
+
+        Returns:
+            IncrementalIngestionConfig: An object containing:
+                - enabled (bool): Whether ingestion is incremental.
+                - landing_dir (str): Directory new data files arrive in.
+                - pattern (str): Glob pattern of the data files.
+                - watermark_file (str): File recording the processed offset of each data file.
+                - delta_path (str): File holding the current batch.
+                - store_path (str): Append-only file of every validated batch.
+                - all_schema (dict): Expected columns and dtypes of the new rows.
+        """
+        config = self.config.incremental_ingestion
+
+        incremental_ingestion_config = IncrementalIngestionConfig(
+            enabled=self._incremental(),
+            landing_dir=config.landing_dir,
+            pattern=config.pattern,
+            watermark_file=config.watermark_file,
+            delta_path=config.delta_path,
+            store_path=config.store_path,
+            all_schema=dict(self.schema.COLUMNS)
+        )
+
+        return incremental_ingestion_config
+
     def get_data_validation_config(self) -> DataValidationConfig:
         """
         Retrieves the configuration required for the data validation stage.
@@ -84,47 +177,371 @@ class ConfigurationManager:
         """
         config = self.config.data_validation
         schema = self.schema.COLUMNS
+        root_dir = self._dataset_artifact_path(config.root_dir)
 
-        create_directories([config.root_dir])
+        _create_missing_directories([root_dir])
 
         data_validation_config = DataValidationConfig(
-            root_dir=config.root_dir,
-            STATUS_FILE=config.STATUS_FILE,
-            unzip_data_dir=config.unzip_data_dir,
+            root_dir=root_dir,
+            STATUS_FILE=self._dataset_artifact_path(config.STATUS_FILE),
+            unzip_data_dir=(self.config.incremental_ingestion.delta_path if self._incremental()
+                            else self._dataset_source_file(config.unzip_data_dir)),
             all_schema=schema
         )
         return data_validation_config
     
     def get_data_transformation_config(self) -> DataTransformationConfig:
         config = self.config.data_transformation
+        root_dir = self._dataset_artifact_path(config.root_dir)
 
-        create_directories([config.root_dir])
+        _create_missing_directories([root_dir])
 
         data_transformation_config = DataTransformationConfig(
-            root_dir=config.root_dir,
-            data_path=config.data_path,
+            root_dir=root_dir,
+            data_path=(self.config.incremental_ingestion.delta_path if self._incremental()
+                       else self._dataset_source_file(config.data_path)),
+            dtypes=self._get_compact_dtypes(),
+            incremental=self._incremental(),
+            store_path=self.config.incremental_ingestion.store_path,
+            deduplicate=self.config.deduplication.enabled,
+            hash_partitions=self.config.deduplication.hash_partitions,
+            all_schema=dict(self.schema.COLUMNS)
         )
 
         return data_transformation_config
 
 
+    def get_streaming_config(self) -> StreamingConfig:
+        """
+        Retrieves the configuration for running ingestion, validation and the split as one pipelined pass.
+
+        Returns:
+            StreamingConfig: An object containing:
+                - member (str): The validated data file's name inside the archive.
+                - block_size (int): Bytes of the data file per block.
+                - queue_size (int): Blocks buffered between two steps.
+        """
+        config = self.config.streaming
+        member = os.path.relpath(self.config.data_validation.unzip_data_dir, self.config.data_ingestion.unzip_dir)
+
+        streaming_config = StreamingConfig(
+            member=member.replace(os.sep, "/"),
+            block_size=config.block_size,
+            queue_size=config.queue_size
+        )
+
+        return streaming_config
+
     def get_model_trainer_config(self) -> ModelTrainerConfig:
         config = self.config.model_trainer
         params = self.params.ElasticNet
+        estimator = config.get("estimator", "ElasticNet")
         schema =  self.schema.TARGET_COLUMN
+        root_dir = self._dataset_artifact_path(config.root_dir)
 
-        create_directories([config.root_dir])
+        _create_missing_directories([root_dir])
 
         model_trainer_config = ModelTrainerConfig(
-            root_dir=config.root_dir,
-            train_data_path = config.train_data_path,
-            test_data_path = config.test_data_path,
+            root_dir=root_dir,
+            train_data_path = self._dataset_artifact_path(config.train_data_path),
+            test_data_path = self._dataset_artifact_path(config.test_data_path),
             model_name = config.model_name,
             alpha = params.alpha,
             l1_ratio = params.l1_ratio,
-            target_column = schema.name
-            
+            target_column = schema.name,
+            compression_codec = config.compression_codec,
+            compression_level = config.compression_level,
+            dtypes = self._get_compact_dtypes(),
+            precision_report = self.config.compact_dtypes.precision_report,
+            warm_start = config.warm_start,
+            total_cores = self._total_cores(),
+            estimator = estimator,
+            estimator_params = dict(self.params.get(estimator, {}))
         )
 
         return model_trainer_config
-    
\ No newline at end of file
+
+    def get_model_serving_config(self) -> ModelServingConfig:
+        """
+        Retrieves the configuration required to serve the trained model.
+
+        Returns:
+            ModelServingConfig: An object containing:
+                - model_path (str): Path to the trained model file.
+                - feature_columns (list): Schema columns without the target, in schema order.
+                - mmap_mode (str): Memory-map mode used when loading the model.
+                - poll_interval (float): Seconds between checks for a newer model file.
+                - warmup (bool): Whether to warm up a model before swapping it in.
+                - feature_dtype (str): dtype of the features passed to the model.
+        """
+        config = self.config.model_serving
+        target_column = self.schema.TARGET_COLUMN.name
+        feature_columns = [column for column in self.schema.COLUMNS.keys() if column != target_column]
+
+        model_serving_config = ModelServingConfig(
+            model_path=config.model_path,
+            feature_columns=feature_columns,
+            mmap_mode=config.mmap_mode,
+            poll_interval=config.poll_interval,
+            warmup=config.warmup,
+            feature_dtype="float32" if self.config.compact_dtypes.enabled else "float64"
+        )
+
+        return model_serving_config
+
+    def get_model_pool_config(self) -> ModelPoolConfig:
+        """
+        Retrieves the configuration for serving named models from a lazily loaded pool.
+
+        Returns:
+            ModelPoolConfig: An object containing:
+                - model_root (str): Directory with one subdirectory per model name.
+                - model_file (str): Model file path inside a model's subdirectory.
+                - max_models (int): Maximum number of loaded models.
+                - max_memory_mb (float): Maximum total size of the loaded model files.
+                - feature_columns (list): Schema columns without the target, in schema order.
+                - mmap_mode (str): Memory-map mode used when loading a model.
+                - poll_interval (float): Seconds between checks of a model file for a newer version.
+                - warmup (bool): Whether to warm up a model before it serves.
+                - feature_dtype (str): dtype of the features passed to the models.
+        """
+        config = self.config.model_pool
+        serving_config = self.get_model_serving_config()
+
+        model_pool_config = ModelPoolConfig(
+            model_root=config.model_root,
+            model_file=config.model_file,
+            max_models=config.max_models,
+            max_memory_mb=config.max_memory_mb,
+            feature_columns=serving_config.feature_columns,
+            mmap_mode=serving_config.mmap_mode,
+            poll_interval=serving_config.poll_interval,
+            warmup=serving_config.warmup,
+            feature_dtype=serving_config.feature_dtype
+        )
+
+        return model_pool_config
+
+    def get_prediction_cache_config(self) -> PredictionCacheConfig:
+        """
+        Retrieves the configuration of the prediction cache used by the serving path.
+
+        Returns:
+            PredictionCacheConfig: An object containing:
+                - enabled (bool): Whether the cache is used.
+                - max_size (int): Maximum number of cached entries.
+                - ttl_seconds (float): Entry lifetime in seconds (0 means no expiry).
+                - precision (int): Rounding applied to feature values before hashing.
+        """
+        config = self.config.prediction_cache
+
+        prediction_cache_config = PredictionCacheConfig(
+            enabled=config.enabled,
+            max_size=config.max_size,
+            ttl_seconds=config.ttl_seconds,
+            precision=config.precision
+        )
+
+        return prediction_cache_config
+
+    def get_tracing_config(self) -> TracingConfig:
+        """
+        Retrieves the configuration of request tracing in the serving path.
+
+        Returns:
+            TracingConfig: An object containing:
+                - sample_rate (float): Fraction of requests traced.
+                - export_path (str): JSON-lines file the traces are written to.
+                - service_name (str): Service name attached to the spans.
+                - flush_interval (float): Seconds between exporter writes.
+        """
+        config = self.config.tracing
+
+        tracing_config = TracingConfig(
+            sample_rate=config.sample_rate,
+            export_path=config.export_path,
+            service_name=config.service_name,
+            flush_interval=config.flush_interval
+        )
+
+        return tracing_config
+
+    def get_load_test_config(self) -> LoadTestConfig:
+        """
+        Retrieves the configuration for load testing the prediction service.
+
+        Returns:
+            LoadTestConfig: An object containing the report directory, the source of
+                request rows, the target URL and the concurrency, rate, duration and
+                batch size of the run.
+        """
+        config = self.config.load_test
+        schema = self.schema.TARGET_COLUMN
+
+        _create_missing_directories([config.root_dir])
+
+        load_test_config = LoadTestConfig(
+            root_dir=config.root_dir,
+            data_path=config.data_path,
+            target_column=schema.name,
+            target_url=config.target_url,
+            concurrency=config.concurrency,
+            rate=config.rate,
+            duration=config.duration,
+            batch_size=config.batch_size
+        )
+
+        return load_test_config
+
+    def get_batch_scoring_config(self) -> BatchScoringConfig:
+        """
+        Retrieves the configuration for scoring large offline files.
+
+        Returns:
+            BatchScoringConfig: An object containing the report directory, the model path,
+                the schema feature columns and dtype, and the chunk size, parallelism,
+                read-ahead and progress settings of the run.
+        """
+        config = self.config.batch_scoring
+        target_column = self.schema.TARGET_COLUMN.name
+
+        _create_missing_directories([config.root_dir])
+
+        batch_scoring_config = BatchScoringConfig(
+            root_dir=config.root_dir,
+            model_path=config.model_path,
+            feature_columns=[column for column in self.schema.COLUMNS.keys() if column != target_column],
+            feature_dtype="float32" if self.config.compact_dtypes.enabled else "float64",
+            chunk_size=config.chunk_size,
+            max_workers=config.max_workers,
+            max_pending_chunks=config.max_pending_chunks,
+            passthrough_columns=list(config.passthrough_columns),
+            report_interval=config.report_interval,
+            total_cores=self._total_cores()
+        )
+
+        return batch_scoring_config
+
+    def get_multi_dataset_config(self) -> MultiDatasetConfig:
+        """
+        Retrieves the configuration for running the pipeline over several named datasets.
+
+        Returns:
+            MultiDatasetConfig: An object containing:
+                - root_dir (str): Parent directory of the per-dataset artifact subtrees.
+                - max_workers (int): Size of the shared process pool.
+                - datasets (dict): Dataset name -> file name in the data ingestion unzip directory.
+        """
+        config = self.config.datasets
+
+        _create_missing_directories([config.root_dir])
+
+        multi_dataset_config = MultiDatasetConfig(
+            root_dir=config.root_dir,
+            max_workers=config.max_workers,
+            datasets={item.name: item.file for item in config.sources},
+            total_cores=self._total_cores()
+        )
+
+        return multi_dataset_config
+
+    def get_hyperparameter_sweep_config(self) -> HyperparameterSweepConfig:
+        """
+        Retrieves the configuration for the successive-halving hyperparameter sweep.
+
+        Returns:
+            HyperparameterSweepConfig: Paths and pool size from config.yaml, and the
+                halving schedule, fixed estimator parameters and search space from params.yaml.
+        """
+        config = self.config.hyperparameter_sweep
+        params = self.params.Sweep
+        schema = self.schema.TARGET_COLUMN
+        root_dir = self._dataset_artifact_path(config.root_dir)
+
+        _create_missing_directories([root_dir])
+
+        hyperparameter_sweep_config = HyperparameterSweepConfig(
+            root_dir=root_dir,
+            train_data_path=self._dataset_artifact_path(config.train_data_path),
+            target_column=schema.name,
+            max_workers=config.max_workers,
+            n_candidates=params.n_candidates,
+            eta=params.eta,
+            min_resource_fraction=params.min_resource_fraction,
+            validation_fraction=params.validation_fraction,
+            random_state=params.random_state,
+            base_params={name: dict(self.params.get(name, {})) for name in params.search_space},
+            search_space=params.search_space,
+            total_cores=self._total_cores()
+        )
+
+        return hyperparameter_sweep_config
+
+    def get_cross_validation_config(self) -> CrossValidationConfig:
+        """
+        Retrieves the configuration for k-fold cross-validation of the ElasticNet model.
+
+        Returns:
+            CrossValidationConfig: Paths, fold count and parallelism from config.yaml and
+                the ElasticNet hyperparameters from params.yaml.
+        """
+        config = self.config.cross_validation
+        params = self.params.ElasticNet
+        schema = self.schema.TARGET_COLUMN
+        root_dir = self._dataset_artifact_path(config.root_dir)
+
+        _create_missing_directories([root_dir])
+
+        cross_validation_config = CrossValidationConfig(
+            root_dir=root_dir,
+            train_data_path=self._dataset_artifact_path(config.train_data_path),
+            target_column=schema.name,
+            n_splits=config.n_splits,
+            max_workers=config.max_workers,
+            random_state=config.random_state,
+            alpha=params.alpha,
+            l1_ratio=params.l1_ratio,
+            total_cores=self._total_cores()
+        )
+
+        return cross_validation_config
+
+    def get_model_evaluation_config(self) -> ModelEvaluationConfig:
+        """
+        Retrieves the configuration for evaluating the trained model on the test split.
+
+        Returns:
+            ModelEvaluationConfig: An object containing:
+                - root_dir (str): Directory for the evaluation artifacts.
+                - test_data_path (str): Path to the test split.
+                - model_path (str): Path to the trained model file.
+                - metric_file_name (str): Path of the test metrics file.
+                - importance_file_name (str): Path of the permutation importance file.
+                - target_column (str): Name of the target column.
+                - n_repeats (int): Shuffles per feature.
+                - max_workers (int): Worker processes for the permutations.
+                - random_state (int): Seed of the permutations.
+                - dtypes (dict): Compact read dtypes, or None.
+                - total_cores (int): Core budget, or None for all available cores.
+        """
+        config = self.config.model_evaluation
+        schema = self.schema.TARGET_COLUMN
+        root_dir = self._dataset_artifact_path(config.root_dir)
+
+        _create_missing_directories([root_dir])
+
+        model_evaluation_config = ModelEvaluationConfig(
+            root_dir=root_dir,
+            test_data_path=self._dataset_artifact_path(config.test_data_path),
+            model_path=self._dataset_artifact_path(config.model_path),
+            metric_file_name=self._dataset_artifact_path(config.metric_file_name),
+            importance_file_name=self._dataset_artifact_path(config.importance_file_name),
+            target_column=schema.name,
+            n_repeats=config.n_repeats,
+            max_workers=config.max_workers,
+            random_state=config.random_state,
+            dtypes=self._get_compact_dtypes(),
+            total_cores=self._total_cores()
+        )
+
+        return model_evaluation_config
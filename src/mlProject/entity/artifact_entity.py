@@ -0,0 +1,91 @@
+import os
+import logging
+from dataclasses import dataclass, field
+
+
+def _fingerprint(path) -> tuple:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+@dataclass
+class ArtifactContext:
+    """
+    In-memory handoff of artifacts between the stages of one pipeline run.
+
+    Every artifact is still written to disk, so a run stays reproducible and any stage
+    can run on its own. When the stages run in one interpreter, a stage that writes (or
+    reads) a CSV keeps the DataFrame here and the next stage takes it instead of parsing
+    the file again. A cached frame is only used while the file on disk is unchanged
+    (same modification time and size), so a file rewritten outside the run is re-read.
+
+    Frames handed out are shared: callers must not modify them in place.
+
+    Attributes:
+        frames (dict): Absolute CSV path -> (file fingerprint, DataFrame).
+        validation_status (dict): Absolute status file path -> validation status.
+    """
+    frames: dict = field(default_factory=dict)
+    validation_status: dict = field(default_factory=dict)
+
+    def load_csv(self, path, dtype: dict = None):
+        """
+        Returns the DataFrame of a CSV file, from memory if this run already holds it.
+
+        Args:
+            path (Path): The CSV file.
+            dtype (dict, optional): Column dtypes, as for `pd.read_csv`. A cached frame is cast to them.
+
+        Returns:
+            pd.DataFrame: The file's data.
+        """
+        import pandas as pd
+
+        key = os.path.abspath(path)
+        cached = self.frames.get(key)
+        if cached is not None and cached[0] == _fingerprint(path):
+            logging.info(f"Using in-memory artifact for {path}")
+            frame = cached[1]
+            if dtype:
+                casts = {column: dtype for column, dtype in dtype.items()
+                         if column in frame.columns and str(frame[column].dtype) != str(dtype)}
+                if casts:
+                    frame = frame.astype(casts)
+            return frame
+
+        frame = pd.read_csv(path, dtype=dtype)
+        self.frames[key] = (_fingerprint(path), frame)
+        return frame
+
+    def save_csv(self, frame, path):
+        """
+        Writes a DataFrame to CSV and keeps it for the following stages.
+
+        The index is not written, so the kept frame gets a fresh RangeIndex, as if read back.
+
+        Args:
+            frame (pd.DataFrame): The data to write.
+            path (Path): The CSV file.
+        """
+        frame = frame.reset_index(drop=True)
+        frame.to_csv(path, index=False)
+        self.frames[os.path.abspath(path)] = (_fingerprint(path), frame)
+
+    def set_validation_status(self, status_file, status: bool):
+        self.validation_status[os.path.abspath(status_file)] = status
+
+    def get_validation_status(self, status_file) -> bool:
+        """
+        Returns the validation status recorded in this run, or else the one in the status file.
+
+        Args:
+            status_file (Path): The status file written by data validation.
+
+        Returns:
+            bool: The validation status.
+        """
+        status = self.validation_status.get(os.path.abspath(status_file))
+        if status is None:
+            with open(status_file, "r") as f:
+                status = f.read().split(" ")[-1] == "True"
+        return status
@@ -43,13 +43,57 @@ class DataValidationConfig:
     unzip_data_dir: Path
     all_schema: dict
 
+@dataclass(frozen=True)
+class IncrementalIngestionConfig:
+    """
+    Configuration class for incremental ingestion.
+
+    Attributes:
+        enabled (bool): Whether ingestion runs incrementally instead of extracting the full archive.
+        landing_dir (Path): Directory new data files are dropped into, or appended to.
+        pattern (str): Glob pattern of the data files in `landing_dir`.
+        watermark_file (Path): JSON file recording how far each landing file has been processed.
+        delta_path (Path): CSV file holding the rows of the current batch.
+        store_path (Path): Append-only CSV file accumulating every validated batch.
+        all_schema (dict): Expected columns and dtypes; new rows are cast to them when they match.
+    """
+    enabled: bool
+    landing_dir: Path
+    pattern: str
+    watermark_file: Path
+    delta_path: Path
+    store_path: Path
+    all_schema: dict = None
+
+
 @dataclass(frozen=True)
 class DataTransformationConfig:
     root_dir: Path
     data_path: Path
+    dtypes: dict = None
+    incremental: bool = False
+    store_path: Path = None
+    deduplicate: bool = False
+    hash_partitions: int = 16
+    all_schema: dict = None
 
 
 
+@dataclass(frozen=True)
+class StreamingConfig:
+    """
+    Configuration class for the streaming (pipelined) ingestion, validation and split.
+
+    Attributes:
+        member (str): Name of the data file inside the downloaded archive.
+        block_size (int): Bytes of the data file per block.
+        queue_size (int): Blocks buffered between two consecutive steps.
+    """
+    member: str
+    block_size: int
+    queue_size: int
+
+
 @dataclass(frozen=True)
 class ModelTrainerConfig:
     root_dir: Path
@@ -58,4 +102,263 @@ class ModelTrainerConfig:
     model_name: str
     alpha: float
     l1_ratio: float
-    target_column: str
\ No newline at end of file
+    target_column: str
+    compression_codec: str
+    compression_level: int
+    dtypes: dict = None
+    precision_report: bool = False
+    warm_start: bool = False
+    total_cores: int = None
+    estimator: str = "ElasticNet"
+    estimator_params: dict = None
+
+
+@dataclass(frozen=True)
+class ModelServingConfig:
+    """
+    Configuration class for serving the trained model.
+
+    Attributes:
+        model_path (Path): Path to the model file produced by the model trainer.
+        feature_columns (list): Feature names, in schema order, expected by the model.
+        mmap_mode (str): `mmap_mode` passed to `joblib.load` (e.g. "r"), or None to load into memory.
+        poll_interval (float): Seconds between checks of the model file for a newer version.
+        warmup (bool): Whether to run a warm-up prediction before a loaded model goes live.
+        feature_dtype (str): dtype features are cast to before predicting ("float32" in compact mode).
+    """
+    model_path: Path
+    feature_columns: list
+    mmap_mode: str
+    poll_interval: float
+    warmup: bool
+    feature_dtype: str = "float64"
+
+
+@dataclass(frozen=True)
+class ModelPoolConfig:
+    """
+    Configuration class for serving many named models from one process.
+
+    Attributes:
+        model_root (Path): Directory holding one subdirectory per model name.
+        model_file (str): Path of a model file inside its model's subdirectory.
+        max_models (int): Maximum number of models loaded at once.
+        max_memory_mb (float): Maximum total size, in MB, of the loaded models' files.
+        feature_columns (list): Feature names, in schema order, expected by the models.
+        mmap_mode (str): `mmap_mode` passed to `joblib.load` (e.g. "r"), or None to load into memory.
+        poll_interval (float): Seconds after which a model file is checked again for a newer version.
+        warmup (bool): Whether to run a warm-up prediction before a loaded model takes requests.
+        feature_dtype (str): dtype features are cast to before predicting ("float32" in compact mode).
+    """
+    model_root: Path
+    model_file: str
+    max_models: int
+    max_memory_mb: float
+    feature_columns: list
+    mmap_mode: str
+    poll_interval: float
+    warmup: bool
+    feature_dtype: str = "float64"
+
+
+
+@dataclass(frozen=True)
+class PredictionCacheConfig:
+    """
+    Configuration class for the in-process prediction cache.
+
+    Attributes:
+        enabled (bool): Whether predictions are cached at all.
+        max_size (int): Maximum number of cached feature vectors; least recently used entries are evicted.
+        ttl_seconds (float): Seconds an entry stays valid. 0 disables expiry.
+        precision (int): Decimal places feature values are rounded to before hashing.
+    """
+    enabled: bool
+    max_size: int
+    ttl_seconds: float
+    precision: int
+
+
+
+@dataclass(frozen=True)
+class TracingConfig:
+    """
+    Configuration class for request tracing in the serving path.
+
+    Attributes:
+        sample_rate (float): Fraction of requests traced, between 0 and 1.
+        export_path (Path): JSON-lines file the traces are appended to.
+        service_name (str): `service.name` resource attribute of the exported spans.
+        flush_interval (float): Seconds the exporter batches traces before writing them.
+    """
+    sample_rate: float
+    export_path: Path
+    service_name: str
+    flush_interval: float
+
+
+
+@dataclass(frozen=True)
+class LoadTestConfig:
+    """
+    Configuration class for load testing the prediction service.
+
+    Attributes:
+        root_dir (Path): Directory where load test reports are written.
+        data_path (Path): CSV file the request rows are drawn from.
+        target_column (str): Column dropped from the rows before they are sent.
+        target_url (str): URL of the `/predict` endpoint. Ignored when the app is driven in-process.
+        concurrency (int): Number of concurrent workers sending requests.
+        rate (float): Requests per second for an open-loop run. 0 runs closed-loop at `concurrency`.
+        duration (float): Length of the run in seconds.
+        batch_size (int): Rows sent per request.
+    """
+    root_dir: Path
+    data_path: Path
+    target_column: str
+    target_url: str
+    concurrency: int
+    rate: float
+    duration: float
+    batch_size: int
+
+
+
+@dataclass(frozen=True)
+class BatchScoringConfig:
+    """
+    Configuration class for scoring large offline files with the trained model.
+
+    Attributes:
+        root_dir (Path): Directory where scoring reports are written.
+        model_path (Path): Path to the trained model file.
+        feature_columns (list): Schema columns without the target, in schema order.
+        feature_dtype (str): dtype of the features passed to the model.
+        chunk_size (int): Rows read and scored per chunk.
+        max_workers (int): Number of worker processes scoring chunks.
+        max_pending_chunks (int): Chunks in flight between the reader and the writer.
+        passthrough_columns (list): Input columns copied to the output next to the prediction.
+        report_interval (float): Seconds between progress log lines.
+        total_cores (int): Core budget shared by the workers and their native threads (None: all available cores).
+    """
+    root_dir: Path
+    model_path: Path
+    feature_columns: list
+    feature_dtype: str
+    chunk_size: int
+    max_workers: int
+    max_pending_chunks: int
+    passthrough_columns: list
+    report_interval: float
+    total_cores: int = None
+
+
+
+@dataclass(frozen=True)
+class MultiDatasetConfig:
+    """
+    Configuration class for running the pipeline over several named datasets.
+
+    Attributes:
+        root_dir (Path): Directory under which each dataset gets its own artifact subtree.
+        max_workers (int): Size of the process pool shared by all datasets.
+        datasets (dict): Dataset name -> file name inside the data ingestion unzip directory.
+        total_cores (int): Core budget shared by the workers and their native threads (None: all available cores).
+    """
+    root_dir: Path
+    max_workers: int
+    datasets: dict
+    total_cores: int = None
+
+
+
+@dataclass(frozen=True)
+class HyperparameterSweepConfig:
+    """
+    Configuration class for the successive-halving hyperparameter sweep.
+
+    Attributes:
+        root_dir (Path): Directory where the trial log and the best configuration are written.
+        train_data_path (Path): Training split; a validation fraction of it scores the candidates.
+        target_column (str): Name of the target column.
+        max_workers (int): Number of worker processes evaluating candidates.
+        n_candidates (int): Number of configurations drawn for the first rung.
+        eta (int): Halving rate: each rung keeps the best 1/eta and gives them eta times more data.
+        min_resource_fraction (float): Fraction of the training rows used in the first rung.
+        validation_fraction (float): Fraction of the training split held out for scoring.
+        random_state (int): Seed for sampling candidates and splitting the data.
+        base_params (dict): Estimator name -> fixed parameters from params.yaml.
+        search_space (dict): Estimator name -> {parameter: {low, high, log, int}} ranges to sample.
+        total_cores (int): Core budget shared by the workers and their native threads (None: all available cores).
+    """
+    root_dir: Path
+    train_data_path: Path
+    target_column: str
+    max_workers: int
+    n_candidates: int
+    eta: int
+    min_resource_fraction: float
+    validation_fraction: float
+    random_state: int
+    base_params: dict
+    search_space: dict
+    total_cores: int = None
+
+
+
+@dataclass(frozen=True)
+class CrossValidationConfig:
+    """
+    Configuration class for k-fold cross-validation of the ElasticNet model.
+
+    Attributes:
+        root_dir (Path): Directory where the cross-validation metrics are written.
+        train_data_path (Path): Training split to cross-validate on.
+        target_column (str): Name of the target column.
+        n_splits (int): Number of folds.
+        max_workers (int): Number of folds fitted concurrently.
+        random_state (int): Seed for shuffling rows into folds.
+        alpha (float): ElasticNet regularization strength.
+        l1_ratio (float): ElasticNet L1/L2 mixing parameter.
+        total_cores (int): Core budget shared by the workers and their native threads (None: all available cores).
+    """
+    root_dir: Path
+    train_data_path: Path
+    target_column: str
+    n_splits: int
+    max_workers: int
+    random_state: int
+    alpha: float
+    l1_ratio: float
+    total_cores: int = None
+
+
+@dataclass(frozen=True)
+class ModelEvaluationConfig:
+    """
+    Configuration class for evaluating the trained model on the test split.
+
+    Attributes:
+        root_dir (Path): Directory where the evaluation artifacts are written.
+        test_data_path (Path): Test split to evaluate on.
+        model_path (Path): Path to the trained model file.
+        metric_file_name (Path): JSON file for the test metrics.
+        importance_file_name (Path): JSON file for the permutation feature importances.
+        target_column (str): Name of the target column.
+        n_repeats (int): Number of shuffles per feature.
+        max_workers (int): Number of worker processes scoring the permutations.
+        random_state (int): Seed of the permutations.
+        dtypes (dict): Compact read dtypes when `compact_dtypes` is enabled, else None.
+        total_cores (int): Core budget shared by the workers and their native threads (None: all available cores).
+    """
+    root_dir: Path
+    test_data_path: Path
+    model_path: Path
+    metric_file_name: Path
+    importance_file_name: Path
+    target_column: str
+    n_repeats: int
+    max_workers: int
+    random_state: int
+    dtypes: dict = None
+    total_cores: int = None
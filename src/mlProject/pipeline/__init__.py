@@ -0,0 +1,34 @@
+"""
+Pipeline classes are exported lazily (PEP 562): `import mlProject.pipeline` is cheap,
+and a stage's module (and its pandas/sklearn imports) is only loaded when the stage
+class is first accessed.
+"""
+import importlib
+
+_LAZY_EXPORTS = {
+    "DataIngestionTrainingPipeline": "mlProject.pipeline.stage_01_ingestion",
+    "DataValidationTrainingPipeline": "mlProject.pipeline.stage_02_data_validation",
+    "DataTransformationTrainingPipeline": "mlProject.pipeline.stage_03_data_transformation",
+    "StreamingTrainingPipeline": "mlProject.pipeline.streaming",
+    "ModelTrainerTrainingPipeline": "mlProject.pipeline.stage_04_model_trainer",
+    "ModelEvaluationTrainingPipeline": "mlProject.pipeline.stage_05_model_evaluation",
+    "CrossValidationTrainingPipeline": "mlProject.pipeline.cross_validation",
+    "HyperparameterSweepTrainingPipeline": "mlProject.pipeline.hyperparameter_sweep",
+    "MultiDatasetTrainingPipeline": "mlProject.pipeline.multi_dataset",
+    "PredictionPipeline": "mlProject.pipeline.prediction",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
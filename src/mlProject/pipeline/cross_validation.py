@@ -0,0 +1,20 @@
+from mlProject.config.configuration import ConfigurationManager
+from mlProject.entity.artifact_entity import ArtifactContext
+import logging
+from mlProject.utils.logging_utils import setup_logging
+
+
+STAGE_NAME = "Cross Validation stage"
+
+class CrossValidationTrainingPipeline:
+    def __init__(self, dataset: str = None, context: ArtifactContext = None):
+        self.dataset = dataset
+        self.context = context
+
+    def main(self) -> dict:
+        from mlProject.components.cross_validation import GramCrossValidator
+
+        config = ConfigurationManager(dataset=self.dataset)
+        cross_validation_config = config.get_cross_validation_config()
+        cross_validation = GramCrossValidator(config=cross_validation_config, context=self.context)
+        return cross_validation.run()
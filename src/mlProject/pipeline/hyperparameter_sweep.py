@@ -0,0 +1,20 @@
+from mlProject.config.configuration import ConfigurationManager
+from mlProject.entity.artifact_entity import ArtifactContext
+import logging
+from mlProject.utils.logging_utils import setup_logging
+
+
+STAGE_NAME = "Hyperparameter Sweep stage"
+
+class HyperparameterSweepTrainingPipeline:
+    def __init__(self, dataset: str = None, context: ArtifactContext = None):
+        self.dataset = dataset
+        self.context = context
+
+    def main(self) -> dict:
+        from mlProject.components.hyperparameter_sweep import SuccessiveHalvingSweep
+
+        config = ConfigurationManager(dataset=self.dataset)
+        hyperparameter_sweep_config = config.get_hyperparameter_sweep_config()
+        hyperparameter_sweep = SuccessiveHalvingSweep(config=hyperparameter_sweep_config, context=self.context)
+        return hyperparameter_sweep.run()
@@ -0,0 +1,147 @@
+import os
+import time
+import logging
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from mlProject.config.configuration import ConfigurationManager
+from mlProject.entity.artifact_entity import ArtifactContext
+from mlProject.utils.common import save_json
+from mlProject.utils.logging_utils import get_worker_log_queue, setup_worker_logging, get_run_id
+from mlProject.utils.resources import allocate_cores, init_worker_threads
+
+
+STAGE_NAME = "Multi-Dataset Training stage"
+
+
+def _init_worker(log_queue, run_id: str, threads: int):
+    setup_worker_logging(log_queue, STAGE_NAME, run_id)
+    init_worker_threads(threads)
+
+
+def run_dataset_pipeline(dataset: str) -> dict:
+    """
+    Runs validation, train/test split and training for one dataset. Executed in a worker process.
+
+    Args:
+        dataset (str): Name of a dataset listed under `datasets` in the config.
+
+    Returns:
+        dict: Summary of the run: validation status, split sizes, test metrics, timings and any error.
+    """
+    from mlProject.pipeline.stage_02_data_validation import DataValidationTrainingPipeline
+    from mlProject.pipeline.stage_03_data_transformation import DataTransformationTrainingPipeline
+    from mlProject.pipeline.stage_04_model_trainer import ModelTrainerTrainingPipeline
+
+    summary = {"dataset": dataset, "pid": os.getpid()}
+    context = ArtifactContext()
+    started = time.perf_counter()
+    try:
+        logging.info(f"[{dataset}] validation started")
+        summary["validation_status"] = DataValidationTrainingPipeline(dataset=dataset, context=context).main()
+        if not summary["validation_status"]:
+            raise ValueError(f"Data schema of dataset '{dataset}' is not valid.")
+
+        logging.info(f"[{dataset}] transformation started")
+        DataTransformationTrainingPipeline(dataset=dataset, context=context).main()
+
+        logging.info(f"[{dataset}] training started")
+        ModelTrainerTrainingPipeline(dataset=dataset, context=context).main()
+
+        summary.update(_evaluate(dataset, context))
+        summary["status"] = "success"
+    except Exception as e:
+        logging.exception(f"[{dataset}] failed: {e}")
+        summary["status"] = "failed"
+        summary["error"] = str(e)
+
+    summary["duration_seconds"] = time.perf_counter() - started
+    logging.info(f"[{dataset}] finished with status {summary['status']} in {summary['duration_seconds']:.1f}s")
+    return summary
+
+
+def _evaluate(dataset: str, context: ArtifactContext) -> dict:
+    """Scores the freshly trained model of a dataset on its test split."""
+    from mlProject.utils.common import load_joblib
+    from mlProject.utils.metrics import model_metrics, task_type
+
+    config = ConfigurationManager(dataset=dataset).get_model_trainer_config()
+    train_rows = len(context.load_csv(config.train_data_path))
+    test_data = context.load_csv(config.test_data_path)
+    model_path = os.path.join(config.root_dir, config.model_name)
+    model = load_joblib(Path(model_path))
+
+    test_y = test_data[config.target_column]
+    predictions = model.predict(test_data.drop(columns=[config.target_column]))
+    return {
+        "train_rows": train_rows,
+        "test_rows": len(test_data),
+        "model_path": model_path,
+        # Datasets trained with a classifier report accuracy instead of rmse/mae/r2.
+        "task": task_type(model),
+        **model_metrics(model, test_y, predictions),
+    }
+
+
+class MultiDatasetTrainingPipeline:
+    """
+    A pipeline class that runs validation, splitting and training for several named
+    datasets concurrently over one bounded process pool, then writes a summary across
+    datasets to `<datasets.root_dir>/summary.json`.
+
+    Data ingestion is shared (one archive holds every dataset) and must run first.
+    """
+
+    def __init__(self, datasets: list = None, max_workers: int = None):
+        """
+        Initializes the MultiDatasetTrainingPipeline.
+
+        Args:
+            datasets (list, optional): Names of the datasets to run. Defaults to all configured datasets.
+            max_workers (int, optional): Size of the process pool. Defaults to `datasets.max_workers`.
+        """
+        self.datasets = datasets
+        self.max_workers = max_workers
+
+    def main(self) -> list:
+        """
+        Executes the per-dataset pipelines in parallel.
+
+        Raises:
+            ValueError: If an unknown dataset is requested.
+            RuntimeError: If any dataset failed; the summary is still written first.
+
+        Returns:
+            list: One summary dict per dataset, in the requested order.
+        """
+        config = ConfigurationManager().get_multi_dataset_config()
+        datasets = self.datasets or list(config.datasets)
+        unknown = [dataset for dataset in datasets if dataset not in config.datasets]
+        if unknown:
+            raise ValueError(f"Unknown datasets {unknown}. Configured datasets: {list(config.datasets)}")
+
+        allocation = allocate_cores(STAGE_NAME, self.max_workers or config.max_workers, n_tasks=len(datasets),
+                                    total_cores=config.total_cores)
+        logging.info(f"Running {len(datasets)} datasets {datasets} over {allocation.workers} worker processes.")
+
+        summaries = {}
+        with ProcessPoolExecutor(max_workers=allocation.workers,
+                                 initializer=_init_worker,
+                                 initargs=(get_worker_log_queue(), get_run_id(),
+                                           allocation.threads_per_worker)) as executor:
+            futures = {executor.submit(run_dataset_pipeline, dataset): dataset for dataset in datasets}
+            for future in as_completed(futures):
+                summary = future.result()
+                summaries[summary["dataset"]] = summary
+
+        ordered = [summaries[dataset] for dataset in datasets]
+        save_json(Path(os.path.join(config.root_dir, "summary.json")), {"run_id": get_run_id(), "datasets": ordered})
+
+        for summary in ordered:
+            metrics = (" ".join(f"{name}={summary[name]:.4f}" for name in ("rmse", "mae", "r2", "accuracy") if name in summary)
+                       if summary["status"] == "success" else summary.get("error"))
+            logging.info(f"{summary['dataset']:>10} | {summary['status']:>7} | {summary['duration_seconds']:7.1f}s | {metrics}")
+
+        failed = [summary["dataset"] for summary in ordered if summary["status"] != "success"]
+        if failed:
+            raise RuntimeError(f"Pipeline failed for datasets: {failed}")
+        return ordered
@@ -0,0 +1,117 @@
+from mlProject.config.configuration import ConfigurationManager
+from mlProject.components.model_server import ModelServer
+from mlProject.components.model_pool import ModelPool
+from mlProject.components.prediction_cache import PredictionCache
+from mlProject.components.tracer import Tracer, NULL_TRACE
+import numpy as np
+import pandas as pd
+
+
+class PredictionPipeline:
+    """
+    A pipeline class that serves predictions from the trained model.
+
+    The model is held by a ModelServer, which hot-reloads it in the background
+    whenever the trainer writes a new model file. Predictions can optionally be
+    answered from a PredictionCache for repeated feature vectors. A Tracer samples
+    requests and records where their latency goes.
+
+    Requests naming a model are served from a ModelPool instead, which loads named
+    models (e.g. one per dataset) on first use and evicts the least recently used.
+    """
+
+    def __init__(self, model_server: ModelServer = None, prediction_cache: PredictionCache = None,
+                 tracer: Tracer = None, model_pool: ModelPool = None):
+        """
+        Initializes the PredictionPipeline.
+
+        Args:
+            model_server (ModelServer, optional): An existing model server. If not provided,
+                one is built from the serving configuration, loaded, and set to watch for new models.
+            prediction_cache (PredictionCache, optional): An existing cache. If not provided,
+                one is built when `prediction_cache.enabled` is set in the configuration.
+            tracer (Tracer, optional): An existing tracer. If not provided, one is built from
+                the tracing configuration.
+            model_pool (ModelPool, optional): An existing pool of named models. If not provided,
+                an empty one is built from the model pool configuration.
+        """
+        if model_server is None or prediction_cache is None or tracer is None or model_pool is None:
+            config = ConfigurationManager()
+
+            if model_server is None:
+                model_server = ModelServer(config=config.get_model_serving_config())
+                model_server.reload_if_changed()
+                model_server.start_watching()
+
+            if prediction_cache is None:
+                prediction_cache_config = config.get_prediction_cache_config()
+                if prediction_cache_config.enabled:
+                    prediction_cache = PredictionCache(config=prediction_cache_config)
+
+            if tracer is None:
+                tracer = Tracer(config=config.get_tracing_config())
+
+            if model_pool is None:
+                model_pool = ModelPool(config=config.get_model_pool_config())
+
+        self.model_server = model_server
+        self.model_pool = model_pool
+        self.prediction_cache = prediction_cache
+        self.tracer = tracer
+        self.feature_columns = model_server.config.feature_columns
+        self.feature_dtype = model_server.config.feature_dtype
+
+    def predict(self, data: pd.DataFrame, trace=NULL_TRACE, model_name: str = None) -> tuple:
+        """
+        Predicts on the given feature rows.
+
+        Args:
+            data (pd.DataFrame): Feature rows containing every schema feature column.
+            trace (Trace, optional): Trace of the request, from `tracer.start_trace`.
+            model_name (str, optional): A model of the model pool; the default model if not given.
+
+        Raises:
+            RuntimeError: If no model has been loaded yet.
+            UnknownModelError: If `model_name` is invalid or has no model file.
+            KeyError: If any feature column is missing from the data.
+
+        Returns:
+            tuple: (predictions, model_version), where predictions is a numpy array.
+        """
+        if model_name is not None:
+            with trace.span("model_pool_get", model_name=model_name):
+                served = self.model_pool.get(model_name)
+        else:
+            served = self.model_server.current
+        if served.model is None:
+            raise RuntimeError("No model is loaded. Train a model first.")
+
+        with trace.span("schema_validation", rows=len(data)):
+            missing_columns = [column for column in self.feature_columns if column not in data.columns]
+            if missing_columns:
+                raise KeyError(missing_columns)
+
+        with trace.span("feature_ordering"):
+            features = data[self.feature_columns]
+            if self.feature_dtype != "float64":
+                features = features.astype(self.feature_dtype)
+
+        # The cache holds one model version at a time, so it only serves the default model.
+        if self.prediction_cache is None or model_name is not None:
+            with trace.span("model_predict", model_version=served.version):
+                return served.model.predict(features), served.version
+
+        with trace.span("cache_lookup") as span:
+            keys = self.prediction_cache.make_keys(features.to_numpy(dtype=np.float64))
+            predictions = self.prediction_cache.get_many(keys, served.version)
+            missing = [i for i, prediction in enumerate(predictions) if prediction is None]
+            span.set_attribute("misses", len(missing))
+
+        if missing:
+            with trace.span("model_predict", model_version=served.version, rows=len(missing)):
+                computed = served.model.predict(features.iloc[missing])
+            self.prediction_cache.put_many([keys[i] for i in missing], computed, served.version)
+            for i, prediction in zip(missing, computed):
+                predictions[i] = prediction
+
+        return np.asarray(predictions), served.version
@@ -1,5 +1,4 @@
 from mlProject.config.configuration import ConfigurationManager
-from mlProject.components.data_ingestion import DataIngestion
 from mlProject.utils.logging_utils import setup_logging
 import logging
 
@@ -34,12 +33,24 @@ class DataIngestionTrainingPipeline:
             3. Downloads the data file if it does not already exist locally.
             4. Extracts the downloaded file to the specified directory.
 
+        With `incremental_ingestion.enabled`, steps 2-4 are replaced by collecting only
+        the rows that arrived since the last run (see IncrementalIngestion).
+
         Raises:
             Exception: Propagates any exception that occurs during data ingestion.
         """
+        from mlProject.components.data_ingestion import DataIngestion
+
         try:
             # Load configurations
             config = ConfigurationManager()
+            incremental_ingestion_config = config.get_incremental_ingestion_config()
+            if incremental_ingestion_config.enabled:
+                from mlProject.components.incremental_ingestion import IncrementalIngestion
+
+                IncrementalIngestion(config=incremental_ingestion_config).collect_new_batches()
+                return
+
             data_ingestion_config = config.get_data_ingestion_config()
 
             # Perform data ingestion steps
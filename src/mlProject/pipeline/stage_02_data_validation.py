@@ -1,5 +1,5 @@
 from mlProject.config.configuration import ConfigurationManager
-from mlProject.components.data_validation import DataValidation
+from mlProject.entity.artifact_entity import ArtifactContext
 import logging
 from mlProject.utils.logging_utils import setup_logging
 
@@ -13,14 +13,18 @@ class DataValidationTrainingPipeline:
     to subsequent stages in the pipeline.
     """
 
-    def __init__(self):
+    def __init__(self, dataset: str = None, context: ArtifactContext = None):
         """
         Initializes the DataValidationTrainingPipeline instance.
 
-        Currently, there are no attributes set during initialization as all operations 
-        are handled in the `main` method.
+        Args:
+            dataset (str, optional): Name of a configured dataset to validate. Defaults to
+                                     the single dataset of the `data_validation` config section.
+            context (ArtifactContext, optional): Keeps the loaded data and the validation status
+                                                 in memory for the following stages of the run.
         """
-        pass    
+        self.dataset = dataset
+        self.context = context
 
     def main(self):
         """
@@ -31,18 +35,23 @@ class DataValidationTrainingPipeline:
             2. Retrieves the data validation configuration.
             3. Instantiates the DataValidation component with the configuration.
             4. Calls the `validate_data` method to perform validation.
-        
+
+        Returns:
+            bool: The validation status.
+
         Raises:
             Exception: If any error occurs during the validation process, it is raised for handling upstream.
         """
+        from mlProject.components.data_validation import DataValidation
+
         try:
             # Load configurations
-            config = ConfigurationManager()
+            config = ConfigurationManager(dataset=self.dataset)
             data_validation_config = config.get_data_validation_config()
 
             # Perform data validation
-            data_validation = DataValidation(config=data_validation_config)
-            data_validation.validate_data()
+            data_validation = DataValidation(config=data_validation_config, context=self.context)
+            return data_validation.validate_data()
 
         except Exception as e:
             raise e
@@ -1,5 +1,5 @@
 from mlProject.config.configuration import ConfigurationManager
-from mlProject.components.data_transformation import DataTransformation
+from mlProject.entity.artifact_entity import ArtifactContext
 from mlProject.utils.logging_utils import setup_logging
 import logging
 from pathlib import Path
@@ -10,26 +10,36 @@ from pathlib import Path
 STAGE_NAME = "Data Transformation stage"
 
 class DataTransformationTrainingPipeline:
-    def __init__(self):
-        pass
+    def __init__(self, dataset: str = None, context: ArtifactContext = None):
+        self.dataset = dataset
+        self.context = context
 
 
     def main(self):
+        from mlProject.components.data_transformation import DataTransformation
+
         try:
-            with open(Path("artifacts/data_validation/status.txt"), "r") as f:
-                status = f.read().split(" ")[-1]
+            config = ConfigurationManager(dataset=self.dataset)
+            data_transformation_config = config.get_data_transformation_config()
+            data_transformation = DataTransformation(config=data_transformation_config, context=self.context)
+            status = data_transformation.context.get_validation_status(Path(config.get_data_validation_config().STATUS_FILE))
+
+            if status:
+                if data_transformation_config.incremental:
+                    from mlProject.components.incremental_ingestion import IncrementalIngestion
 
-            if status == "True":
-                config = ConfigurationManager()
-                data_transformation_config = config.get_data_transformation_config()
-                data_transformation = DataTransformation(config=data_transformation_config)
-                data_transformation.train_test_spliting()
+                    # Commits the watermark once the batch is stored; a failure leaves it to be read again next run.
+                    data_transformation.append_batch(IncrementalIngestion(config=config.get_incremental_ingestion_config()))
+                else:
+                    data_transformation.train_test_spliting()
 
             else:
                 raise Exception("You data schema is not valid")
 
         except Exception as e:
-            print(e)
+            # Re-raised, so a failed split is not followed by training on the previous one.
+            logging.error(f"Data transformation failed: {e}")
+            raise e
 
 
 
@@ -1,5 +1,5 @@
 from mlProject.config.configuration import ConfigurationManager
-from mlProject.components.model_trainer import ModelTrainer
+from mlProject.entity.artifact_entity import ArtifactContext
 import logging 
 from mlProject.utils.logging_utils import setup_logging
 
@@ -8,13 +8,16 @@ from mlProject.utils.logging_utils import setup_logging
 STAGE_NAME = "Model Trainer stage"
 
 class ModelTrainerTrainingPipeline:
-    def __init__(self):
-        pass
+    def __init__(self, dataset: str = None, context: ArtifactContext = None):
+        self.dataset = dataset
+        self.context = context
 
     def main(self):
-        config = ConfigurationManager()
+        from mlProject.components.model_trainer import ModelTrainer
+
+        config = ConfigurationManager(dataset=self.dataset)
         model_trainer_config = config.get_model_trainer_config()
-        model_trainer_config = ModelTrainer(config=model_trainer_config)
+        model_trainer_config = ModelTrainer(config=model_trainer_config, context=self.context)
         model_trainer_config.train()
 
 
@@ -0,0 +1,18 @@
+from mlProject.config.configuration import ConfigurationManager
+from mlProject.entity.artifact_entity import ArtifactContext
+
+
+STAGE_NAME = "Model Evaluation stage"
+
+class ModelEvaluationTrainingPipeline:
+    def __init__(self, dataset: str = None, context: ArtifactContext = None):
+        self.dataset = dataset
+        self.context = context
+
+    def main(self) -> dict:
+        from mlProject.components.model_evaluation import ModelEvaluation
+
+        config = ConfigurationManager(dataset=self.dataset)
+        model_evaluation_config = config.get_model_evaluation_config()
+        model_evaluation = ModelEvaluation(config=model_evaluation_config, context=self.context)
+        return model_evaluation.evaluate()
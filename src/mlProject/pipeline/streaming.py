@@ -0,0 +1,36 @@
+from mlProject.config.configuration import ConfigurationManager
+from mlProject.entity.artifact_entity import ArtifactContext
+
+
+STAGE_NAME = "Streaming Ingestion Stage"
+
+class StreamingTrainingPipeline:
+    """
+    Downloads the dataset, then extracts, validates and splits it in one pipelined pass
+    (see StreamingPipeline). Replaces the ingestion, validation and transformation stages.
+    """
+
+    def __init__(self, context: ArtifactContext = None):
+        self.context = context or ArtifactContext()
+
+    def main(self):
+        from mlProject.components.data_ingestion import DataIngestion
+        from mlProject.components.data_validation import DataValidation
+        from mlProject.components.data_transformation import DataTransformation
+        from mlProject.components.streaming_pipeline import StreamingPipeline
+
+        config = ConfigurationManager()
+        if config.get_incremental_ingestion_config().enabled:
+            raise ValueError("Streaming mode re-reads the whole archive; disable incremental_ingestion to use it.")
+
+        data_ingestion = DataIngestion(config=config.get_data_ingestion_config())
+        data_ingestion.download_file()
+
+        streaming_pipeline = StreamingPipeline(
+            config=config.get_streaming_config(),
+            data_ingestion=data_ingestion,
+            data_validation=DataValidation(config=config.get_data_validation_config(), context=self.context),
+            data_transformation=DataTransformation(config=config.get_data_transformation_config(), context=self.context),
+        )
+        if not streaming_pipeline.run():
+            raise Exception("You data schema is not valid")
@@ -2,14 +2,20 @@ import os
 import sys
 import yaml
 import json
-import joblib
-from typing import List, Dict, Any, Union
-from ensure import ensure_annotations
+import hashlib
+from typing import List, Dict, Any, Union, Optional, Iterable, Iterator
+from collections import OrderedDict
+from mlProject.utils.type_checking import ensure_annotations
 from box import ConfigBox
 from pathlib import Path
 from box.exceptions import BoxValueError, BoxKeyError
-from jsonschema import validate, ValidationError
 import logging
+import threading
+
+try:
+    import orjson
+except ImportError:  # optional fast JSON backend
+    orjson = None
 
 @ensure_annotations
 def load_yaml(path_to_yaml: Path) -> ConfigBox:
@@ -50,56 +56,250 @@ def load_yaml(path_to_yaml: Path) -> ConfigBox:
         raise ValueError(f"An unexpected error occurred: {e}")
     
     
+class FrozenConfig(dict):
+    """
+    A read-only dict with attribute access, used for cached configuration.
+
+    Lookups (`config.data_ingestion.root_dir`) are plain dict lookups, which is much
+    cheaper than ConfigBox attribute access. Any attempt to modify it raises TypeError,
+    so one instance can be shared safely across threads and callers.
+    """
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is read-only.")
+
+    __setattr__ = __delattr__ = __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (FrozenConfig, (dict(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Recursively converts dicts to FrozenConfig and lists to tuples."""
+    if isinstance(value, dict):
+        return FrozenConfig({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+_yaml_cache = {}
+_yaml_cache_lock = threading.Lock()
+
+
+def load_yaml_cached(path_to_yaml: Path) -> FrozenConfig:
+    """
+    Load a YAML file once per process and share the parsed, frozen result.
+
+    The file is re-parsed only when its modification time or size changes, so
+    repeated calls cost one `os.stat`. Safe to call from multiple threads.
+
+    Args:
+        path_to_yaml (Path): The path to the YAML file.
+
+    Raises:
+        ValueError: If the YAML file is not found, empty, or has an invalid structure.
+
+    Returns:
+        FrozenConfig: The loaded YAML data as a read-only, attribute-accessible mapping.
+    """
+    try:
+        stat = os.stat(path_to_yaml)
+    except FileNotFoundError:
+        raise ValueError(f"YAML file {path_to_yaml} not found.")
+
+    key = os.path.abspath(path_to_yaml)
+    fingerprint = (stat.st_mtime_ns, stat.st_size)
+    cached = _yaml_cache.get(key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    with _yaml_cache_lock:
+        cached = _yaml_cache.get(key)
+        if cached is None or cached[0] != fingerprint:
+            cached = (fingerprint, freeze(load_yaml(Path(path_to_yaml)).to_dict()))
+            _yaml_cache[key] = cached
+        return cached[1]
+
+
+def _json_default(value: Any) -> Any:
+    """Converts numpy scalars and arrays, which the JSON encoders do not handle natively."""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _json_dumps(data: Any, indent: Optional[int] = None) -> bytes:
+    """Serializes to UTF-8 JSON bytes, using orjson when it is installed and supports the indent."""
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option, default=_json_default)
+    return json.dumps(data, indent=indent, default=_json_default).encode("utf-8")
+
+
+def _json_loads(content: bytes) -> Any:
+    return orjson.loads(content) if orjson is not None else json.loads(content)
+
+
 @ensure_annotations
-def save_json(path: Path, data: dict):
+def save_json(path: Path, data: dict, indent: Optional[int] = 4):
     """Save JSON data after ensuring the directory exists.
 
     Args:
         path (Path): path to json file
         data (dict): data to be saved in json file
+        indent (int, optional): indentation for pretty-printing. Defaults to 4;
+            pass None for compact output (or 2), which uses the fast orjson backend when installed.
     """
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4)
+    with open(path, "wb") as f:
+        f.write(_json_dumps(data, indent=indent))
     logging.info(f"JSON file saved at: {path}")
-    
+
+
+@ensure_annotations
+def save_jsonl(path: Path, records: Iterable, append: bool = False) -> int:
+    """Stream records to a JSON-lines file, one compact JSON object per line.
+
+    Records are consumed lazily and written in batches, so arbitrarily large
+    iterables (e.g. per-row predictions) never have to fit in memory.
+
+    Args:
+        path (Path): path to the .jsonl file
+        records (Iterable): records to write (typically dicts)
+        append (bool, optional): append to an existing file instead of overwriting it. Defaults to False.
+
+    Returns:
+        int: number of records written
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    buffer = []
+    with open(path, "ab" if append else "wb") as f:
+        for record in records:
+            buffer.append(_json_dumps(record))
+            if len(buffer) >= 1000:
+                f.write(b"\n".join(buffer) + b"\n")
+                count += len(buffer)
+                buffer.clear()
+        if buffer:
+            f.write(b"\n".join(buffer) + b"\n")
+            count += len(buffer)
+    logging.info(f"{count} records written to JSON-lines file: {path}")
+    return count
+
+
+@ensure_annotations
+def load_jsonl(path: Path) -> Iterator:
+    """Lazily read a JSON-lines file, yielding one record per non-empty line.
+
+    Args:
+        path (Path): path to the .jsonl file
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If a line is not valid JSON.
+
+    Returns:
+        Iterator: the decoded records, one at a time
+    """
+    if not path.exists():
+        logging.error(f"JSON-lines file {path} not found.")
+        raise FileNotFoundError(f"JSON-lines file {path} not found.")
+
+    def records():
+        with open(path, "rb") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield _json_loads(line)
+                except json.JSONDecodeError as jde:
+                    raise ValueError(f"Error decoding line {line_number} of {path}: {jde}")
+
+    return records()
+
+
+_validator_cache = OrderedDict()
+_validator_cache_lock = threading.Lock()
+
+
+def _get_validator(schema: dict):
+    """Returns a compiled validator for `schema`, building it only the first time the schema object is seen."""
+    # jsonschema is imported on first use to keep `import mlProject` fast.
+    from jsonschema.validators import validator_for
+
+    cached = _validator_cache.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+    validator = validator_class(schema)
+    with _validator_cache_lock:
+        # Keep the schema referenced so its id() cannot be reused by another object.
+        _validator_cache[id(schema)] = (schema, validator)
+        while len(_validator_cache) > 128:
+            _validator_cache.popitem(last=False)
+    return validator
+
+
 # validate Json schema before loading it
 def validate_json_schema(data: dict, schema: dict):
+    """Validate data against a JSON schema.
+
+    The compiled validator is cached per schema object, so validating many payloads
+    against the same schema only builds it once. Do not mutate a schema after use.
+    """
+    from jsonschema import ValidationError
+
     try:
-        validate(instance=data, schema=schema)
+        _get_validator(schema).validate(data)
         logging.info("JSON schema validation successful.")
     except ValidationError as e:
         logging.error(f"JSON schema validation failed: {e}")
         raise
 
 @ensure_annotations
-def load_json(path: Path) -> ConfigBox:
+def load_json(path: Path, as_box: bool = True) -> Union[ConfigBox, dict, list]:
     """Load JSON file data.
 
     Args:
         path (Path): Path to the JSON file.
+        as_box (bool, optional): Wrap the data in a ConfigBox. Pass False to get the
+            plain decoded data, which skips the Box conversion for large files. Defaults to True.
 
     Raises:
         FileNotFoundError: If the JSON file does not exist.
         ValueError: If the JSON file is empty or invalid.
 
     Returns:
-        ConfigBox: Data as class attributes instead of a dict.
+        ConfigBox: Data as class attributes instead of a dict (or the plain data if `as_box` is False).
     """
     try:
         if not path.exists():
             logging.error(f"JSON file {path} not found.")
             raise FileNotFoundError(f"JSON file {path} not found.")
 
-        with open(path, "r", encoding="utf-8") as f:
-            content = json.load(f)
+        with open(path, "rb") as f:
+            content = _json_loads(f.read())
 
         if not content:
             logging.error(f"JSON file {path} is empty.")
             raise ValueError(f"JSON file {path} is empty.")
 
         logging.info(f"JSON file loaded successfully from: {path}")
-        return ConfigBox(content)
+        return ConfigBox(content) if as_box else content
 
     except json.JSONDecodeError as jde:
         logging.exception(f"Error decoding JSON from {path}: {jde}")
@@ -109,31 +309,141 @@ def load_json(path: Path) -> ConfigBox:
         logging.exception(f"An unexpected error occurred: {e}")
         raise ValueError(f"An unexpected error occurred: {e}")
     
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _checksum_path(path: Path) -> Path:
+    return path.with_name(path.name + ".sha256")
+
+
+def _atomic_write_text(path: Path, text: str):
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def get_joblib_compression(codec: str, level: int) -> Union[int, tuple]:
+    """Translate a codec name and level from config.yaml into joblib's `compress` argument.
+
+    Args:
+        codec (str): "none" (no compression, allows memory-mapped loading) or a joblib codec
+            such as "zlib", "gzip", "bz2", "lzma", "xz" or "lz4".
+        level (int): compression level, 1-9.
+
+    Returns:
+        Union[int, tuple]: 0 for no compression, otherwise (codec, level).
+    """
+    if not codec or str(codec).lower() == "none":
+        return 0
+    return (str(codec).lower(), int(level))
+
+
 @ensure_annotations
-def save_joblib(path: Path, data: Any):
-    """Save data using joblib
-    
+def save_joblib(path: Path, data: Any, compress: Any = 0, checksum: bool = True):
+    """Save data using joblib, atomically.
+
+    The data is written to a temporary file in the same directory, flushed to disk
+    and moved over `path` with `os.replace`, so readers only ever see the old or the
+    complete new file, never a truncated one. A SHA-256 checksum is written next to
+    it as `<path>.sha256`. The sidecar lists the new digest, and the old one, before
+    the file is replaced, so a crash at any point leaves a sidecar that matches the file.
+
     Args:
         data (Any): data to be saved as binary
         path (Path): path to binary file
+        compress (Any, optional): joblib `compress` argument, e.g. 0, 3 or ("lz4", 3).
+            Uncompressed files (the default) can be memory-mapped on load.
+        checksum (bool, optional): write the `.sha256` sidecar file. Defaults to True.
     """
-    joblib.dump(value=data, filename=path)
+    import joblib
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Unique per process/thread; created by joblib itself, so the usual umask permissions apply.
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        joblib.dump(value=data, filename=tmp_path, compress=compress)
+        with open(tmp_path, "rb") as f:
+            os.fsync(f.fileno())
+        digest = _file_sha256(tmp_path) if checksum else None
+        if digest is not None:
+            checksum_file = _checksum_path(path)
+            old_lines = checksum_file.read_text(encoding="utf-8").splitlines() if checksum_file.exists() else []
+            _atomic_write_text(checksum_file, "".join(f"{line}\n" for line in [f"{digest}  {path.name}"] + old_lines[:1]))
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    if digest is not None:
+        # The old file is gone; only the new digest is valid now.
+        _atomic_write_text(_checksum_path(path), f"{digest}  {path.name}\n")
     logging.info(f"Binary file saved at: {path}")
 
 @ensure_annotations
-def load_joblib(path: Path) -> Any:
+def load_joblib(path: Path, mmap_mode: Optional[str] = None, verify_checksum: bool = False) -> Any:
     """load binary data
 
     Args:
         path (Path): path to binary file
+        mmap_mode (str, optional): e.g. "r" to memory-map the numpy arrays of an uncompressed
+            file instead of reading them into memory. Ignored (by joblib) for compressed files.
+        verify_checksum (bool, optional): compare the file with its `.sha256` sidecar, if one
+            exists, before loading it; any digest listed in the sidecar matches. Defaults to False.
+
+    Raises:
+        ValueError: If `verify_checksum` is set and the checksum does not match.
 
     Returns:
         Any: object stored in the file
     """
-    data = joblib.load(path)
+    import joblib
+
+    if verify_checksum:
+        checksum_file = _checksum_path(path)
+        if checksum_file.exists():
+            # During a save the sidecar lists both the new and the old digest.
+            expected = [line.split()[0] for line in checksum_file.read_text(encoding="utf-8").splitlines() if line.strip()]
+            actual = _file_sha256(path)
+            if actual not in expected:
+                raise ValueError(f"Checksum mismatch for {path}: expected {' or '.join(expected)}, got {actual}.")
+
+    data = joblib.load(path, mmap_mode=mmap_mode)
     logging.info(f"binary file loaded from: {path}")
     return data
 
+@ensure_annotations
+def get_compact_dtypes(columns: dict, target_column: str) -> dict:
+    """Map schema dtypes to compact ones for reading data with `pd.read_csv(dtype=...)`.
+
+    float64 features become float32, the integer target becomes int8, other int64
+    columns become int32 and text (object) columns become categorical.
+
+    Args:
+        columns (dict): schema column name -> dtype, as in schema.yaml
+        target_column (str): name of the target column
+
+    Returns:
+        dict: column name -> compact dtype
+    """
+    compact = {}
+    for column, dtype in columns.items():
+        if dtype == "float64":
+            compact[column] = "float32"
+        elif dtype == "int64":
+            compact[column] = "int8" if column == target_column else "int32"
+        elif dtype == "object":
+            compact[column] = "category"
+        else:
+            compact[column] = dtype
+    return compact
+
+
 @ensure_annotations
 def create_directories(paths: list, verbose: bool = True):
     """Create directories from a list of paths.
@@ -0,0 +1,180 @@
+import os
+import glob
+import json
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+
+def row_hashes(data: pd.DataFrame, dtypes: dict = None) -> np.ndarray:
+    """
+    Hash every row of a DataFrame to 64 bits in one vectorized pass.
+
+    Rows with equal values hash equally regardless of the index. The hash depends on the
+    dtype (7 and 7.0 hash differently), so rows parsed separately, e.g. in different
+    batches, must be cast to the same `dtypes` first. With 64-bit hashes a collision (two
+    different rows treated as duplicates) only becomes likely around 2**32 (about 4
+    billion) distinct rows.
+
+    Args:
+        data (pd.DataFrame): The rows to hash.
+        dtypes (dict, optional): Column name -> dtype the rows are cast to before hashing,
+            e.g. the schema dtypes.
+
+    Returns:
+        np.ndarray: One uint64 hash per row.
+    """
+    if dtypes:
+        casts = {column: dtype for column, dtype in dtypes.items()
+                 if column in data.columns and str(data[column].dtype) != str(dtype)}
+        if casts:
+            data = data.astype(casts)
+    return pd.util.hash_pandas_object(data, index=False).to_numpy()
+
+
+class RowHashSet:
+    """
+    A compact set of row hashes: 8 bytes per row instead of a Python set's ~70.
+
+    Hashes are spread over `n_partitions` sorted uint64 arrays. Membership is a binary
+    search, and adding a batch only re-sorts the partitions it touches. Each partition is
+    saved to its own `.npy` file, so a set far larger than one batch is kept on disk
+    between runs. A set loaded from a directory reads a partition only when a batch has a
+    hash in it, and `save` writes back only the partitions that changed.
+
+    The partition count is saved with the set; loading it with another count is refused,
+    since the stored hashes would be looked up in the wrong partitions.
+    """
+
+    META_FILE = "meta.json"
+
+    def __init__(self, n_partitions: int = 16, directory: Path = None):
+        self.n_partitions = n_partitions
+        self.directory = directory
+        # Partition id -> sorted hashes, for the partitions in memory.
+        self.partitions = {}
+        self._changed = set()
+
+    @staticmethod
+    def partition_path(directory: Path, partition_id: int) -> str:
+        return os.path.join(directory, f"part-{partition_id:03d}.npy")
+
+    def _partition(self, partition_id: int) -> np.ndarray:
+        partition = self.partitions.get(partition_id)
+        if partition is None:
+            path = self.partition_path(self.directory, partition_id) if self.directory is not None else None
+            if path is not None and os.path.exists(path):
+                partition = np.load(path)
+            else:
+                partition = np.empty(0, dtype=np.uint64)
+            self.partitions[partition_id] = partition
+        return partition
+
+    def __len__(self) -> int:
+        total = 0
+        for partition_id in range(self.n_partitions):
+            if partition_id in self.partitions:
+                total += len(self.partitions[partition_id])
+            elif self.directory is not None and os.path.exists(self.partition_path(self.directory, partition_id)):
+                # Only the header is read.
+                total += len(np.load(self.partition_path(self.directory, partition_id), mmap_mode="r"))
+        return total
+
+    def add(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Adds a batch of hashes.
+
+        Args:
+            hashes (np.ndarray): uint64 row hashes, e.g. from `row_hashes`.
+
+        Returns:
+            np.ndarray: Boolean mask, True for the first occurrence of a hash that was not in the set before.
+        """
+        is_new = np.zeros(len(hashes), dtype=bool)
+        _, first_index = np.unique(hashes, return_index=True)
+        first_index.sort()
+
+        partition_ids = hashes[first_index] % np.uint64(self.n_partitions)
+        for partition_id in np.unique(partition_ids).tolist():
+            index = first_index[partition_ids == partition_id]
+            existing = self._partition(partition_id)
+            positions = np.minimum(np.searchsorted(existing, hashes[index]), max(len(existing) - 1, 0))
+            seen = existing[positions] == hashes[index] if len(existing) else np.zeros(len(index), dtype=bool)
+            fresh = index[~seen]
+            if not len(fresh):
+                continue
+            is_new[fresh] = True
+            # Merge into the sorted partition in linear time instead of re-sorting all of it.
+            fresh_hashes = np.sort(hashes[fresh])
+            self.partitions[partition_id] = np.insert(existing, np.searchsorted(existing, fresh_hashes), fresh_hashes)
+            self._changed.add(partition_id)
+        return is_new
+
+    def changed_partitions(self) -> list:
+        """Returns the ids of the partitions changed since the set was loaded or saved."""
+        return sorted(self._changed)
+
+    def save(self, directory: Path = None):
+        """
+        Writes the set into `directory` (by default the one it was loaded from): one
+        `part-NNN.npy` file per partition and the partition count. Into the directory it
+        was loaded from, only the changed partitions are written.
+        """
+        directory = self.directory if directory is None else directory
+        os.makedirs(directory, exist_ok=True)
+        if directory == self.directory:
+            partition_ids = self.changed_partitions()
+        else:
+            partition_ids = range(self.n_partitions)
+        for partition_id in partition_ids:
+            path = self.partition_path(directory, partition_id)
+            tmp_path = f"{path}.{os.getpid()}.tmp.npy"
+            np.save(tmp_path, self._partition(partition_id))
+            os.replace(tmp_path, path)
+        with open(os.path.join(directory, self.META_FILE), "w", encoding="utf-8") as f:
+            json.dump({"n_partitions": self.n_partitions}, f)
+        self.directory = directory
+        self._changed.clear()
+
+    @classmethod
+    def load(cls, directory: Path, n_partitions: int = 16) -> "RowHashSet":
+        """
+        Opens a set saved with `save`; partitions are read when a batch needs them. A
+        missing directory gives an empty set.
+
+        Raises:
+            ValueError: If the set was saved with a different number of partitions.
+        """
+        meta_path = os.path.join(directory, cls.META_FILE)
+        if os.path.exists(meta_path):
+            with open(meta_path, encoding="utf-8") as f:
+                saved_partitions = json.load(f)["n_partitions"]
+        else:
+            # Saved before the partition count was recorded: every partition was written.
+            saved_partitions = len(glob.glob(os.path.join(directory, "part-[0-9][0-9][0-9].npy"))) or n_partitions
+        if saved_partitions != n_partitions:
+            raise ValueError(f"The row hashes in {directory} were saved with {saved_partitions} partitions, "
+                             f"not {n_partitions}. Set deduplication.hash_partitions back to {saved_partitions}, "
+                             f"or delete the directory (the rows stored so far are then not deduplicated against).")
+        return cls(n_partitions, directory=directory)
+
+
+def drop_duplicate_rows(data: pd.DataFrame, seen: RowHashSet = None, dtypes: dict = None) -> tuple:
+    """
+    Drop exact duplicate rows, keeping the first occurrence.
+
+    Args:
+        data (pd.DataFrame): The rows to deduplicate.
+        seen (RowHashSet, optional): Rows of earlier chunks or batches. Rows already in it are
+            dropped too, and the kept rows are added to it.
+        dtypes (dict, optional): Column dtypes the rows are hashed in (see `row_hashes`).
+
+    Returns:
+        tuple: (deduplicated DataFrame, number of dropped rows).
+    """
+    hashes = row_hashes(data, dtypes)
+    if seen is None:
+        keep = ~pd.Series(hashes).duplicated().to_numpy()
+    else:
+        keep = seen.add(hashes)
+    return data[keep], int(len(data) - keep.sum())
@@ -1,33 +1,280 @@
 import os
-import logging
 import sys
+import copy
+import json
+import gzip
+import uuid
+import queue
+import atexit
+import shutil
+import logging
+import logging.handlers
+import multiprocessing
+from typing import Optional
+
+
+LOG_FORMAT = "%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s"
+
+# Defaults can be overridden per process through the environment.
+LOG_FORMAT_ENV_VAR = "MLPROJECT_LOG_FORMAT"            # "text" (default) or "json"
+LOG_MAX_BYTES_ENV_VAR = "MLPROJECT_LOG_MAX_BYTES"      # size-based rotation threshold
+LOG_BACKUP_COUNT_ENV_VAR = "MLPROJECT_LOG_BACKUP_COUNT"
+LOG_ROTATE_WHEN_ENV_VAR = "MLPROJECT_LOG_ROTATE_WHEN"  # e.g. "midnight"; enables time-based rotation
+RUN_ID_ENV_VAR = "MLPROJECT_RUN_ID"
+
+_state = {
+    "queue": queue.SimpleQueue(),
+    "listener": None,
+    "worker_queue": None,
+    "worker_listener": None,
+    "handlers": [],
+    "settings": None,
+    "run_id": None,
+}
+
+
+class ContextFilter(logging.Filter):
+    """Attaches the stage name and run ID to every record, in the process that emits it."""
+
+    def __init__(self, stage: str, run_id: str):
+        super().__init__()
+        self.stage = stage
+        self.run_id = run_id
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.stage = self.stage
+        record.run_id = self.run_id
+        return True
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats each record as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "stage": getattr(record, "stage", None),
+            "run_id": getattr(record, "run_id", None),
+            "process": record.processName,
+            "file": record.filename,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            # Records that went through a _ContextQueueHandler carry the formatted traceback.
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class _ContextQueueHandler(logging.handlers.QueueHandler):
+    """
+    A QueueHandler that keeps the traceback of a record.
 
-def setup_logging(log_filename: str) -> None:
+    The stock `prepare` formats the traceback into the message and drops it, so a
+    formatter on the listener side cannot tell it apart. Here the message is only
+    merged with its arguments, and the traceback is kept as `exc_text` (a string, so
+    the record can still be pickled onto a multiprocessing queue).
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _gzip_rotator(source: str, dest: str):
+    with open(source, "rb") as f_in, gzip.open(dest, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+
+def get_run_id() -> str:
+    """Returns the run ID of this process: $MLPROJECT_RUN_ID, or one generated on first use."""
+    if _state["run_id"] is None:
+        _state["run_id"] = os.environ.get(RUN_ID_ENV_VAR) or uuid.uuid4().hex[:12]
+    return _state["run_id"]
+
+
+def _install_queue_handler(log_queue, stage: str, run_id: str):
+    """Makes a QueueHandler the only handler on the root logger, so emitting is just an enqueue."""
+    queue_handler = _ContextQueueHandler(log_queue)
+    queue_handler.addFilter(ContextFilter(stage=stage, run_id=run_id))
+
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(queue_handler)
+    root_logger.setLevel(logging.INFO)
+
+
+def _stop_listeners():
+    for key in ("listener", "worker_listener"):
+        listener = _state[key]
+        if listener is not None:
+            # stop() drains the queue, so nothing emitted so far is lost.
+            listener.stop()
+            _state[key] = None
+
+
+def _start_listeners():
+    _state["listener"] = logging.handlers.QueueListener(_state["queue"], *_state["handlers"], respect_handler_level=True)
+    _state["listener"].start()
+    if _state["worker_queue"] is not None:
+        _state["worker_listener"] = logging.handlers.QueueListener(
+            _state["worker_queue"], *_state["handlers"], respect_handler_level=True
+        )
+        _state["worker_listener"].start()
+
+
+def setup_logging(log_filename: str,
+                  json_format: Optional[bool] = None,
+                  max_bytes: Optional[int] = None,
+                  backup_count: Optional[int] = None,
+                  when: Optional[str] = None,
+                  compress: bool = True,
+                  stage: Optional[str] = None) -> str:
     """
     Set up a global logging configuration for the entire pipeline stage.
 
+    Log calls only enqueue the record; a QueueListener thread writes it to
+    `logs/<log_filename>` and to stdout. Calling this again for the next stage
+    re-tags the records with the new stage; the listener and its file and console
+    handlers are only stopped and rebuilt when the file or format settings change.
+
     Args:
         log_filename (str): The name of the log file (e.g., "data_ingestion.log").
+        json_format (bool, optional): Write JSON lines instead of text. Defaults to $MLPROJECT_LOG_FORMAT == "json".
+        max_bytes (int, optional): Rotate the file once it reaches this size. Defaults to
+                                   $MLPROJECT_LOG_MAX_BYTES or 10 MB.
+        backup_count (int, optional): Rotated files to keep. Defaults to $MLPROJECT_LOG_BACKUP_COUNT or 5.
+        when (str, optional): Rotate on time instead of size (e.g. "midnight"), as in
+                              TimedRotatingFileHandler. Defaults to $MLPROJECT_LOG_ROTATE_WHEN.
+        compress (bool, optional): Gzip rotated files. Defaults to True.
+        stage (str, optional): Stage name attached to every record. Defaults to the log file name without extension.
+
+    Returns:
+        str: The full path of the log file.
     """
+    if json_format is None:
+        json_format = os.environ.get(LOG_FORMAT_ENV_VAR, "text").lower() == "json"
+    if max_bytes is None:
+        max_bytes = int(os.environ.get(LOG_MAX_BYTES_ENV_VAR, 10 * 1024 * 1024))
+    if backup_count is None:
+        backup_count = int(os.environ.get(LOG_BACKUP_COUNT_ENV_VAR, 5))
+    if when is None:
+        when = os.environ.get(LOG_ROTATE_WHEN_ENV_VAR) or None
+    if stage is None:
+        stage = os.path.splitext(log_filename)[0]
+
     # Get the main project directory
-    project_root = os.getcwd()  
+    project_root = os.getcwd()
     log_dir = os.path.join(project_root, "logs")
     os.makedirs(log_dir, exist_ok=True)
 
     # Full path for the log file
     log_file_path = os.path.join(log_dir, log_filename)
 
-    # Clear existing logging handlers (avoid duplicates across multiple calls)
+    run_id = get_run_id()
+    _install_queue_handler(_state["queue"], stage=stage, run_id=run_id)
+
+    settings = (log_file_path, json_format, max_bytes, backup_count, when, compress)
+    if settings == _state["settings"] and _state["listener"] is not None:
+        return log_file_path
+
+    _stop_listeners()
+    for handler in _state["handlers"]:
+        handler.close()
+
+    if when:
+        file_handler = logging.handlers.TimedRotatingFileHandler(log_file_path, when=when, backupCount=backup_count)
+    else:
+        file_handler = logging.handlers.RotatingFileHandler(log_file_path, maxBytes=max_bytes, backupCount=backup_count)
+    if compress:
+        file_handler.namer = lambda name: name + ".gz"
+        file_handler.rotator = _gzip_rotator
+
+    formatter = JsonLinesFormatter() if json_format else logging.Formatter(LOG_FORMAT)
+    file_handler.setFormatter(formatter)
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
+
+    _state["handlers"] = [file_handler, console_handler]
+    _state["settings"] = settings
+    _start_listeners()
+
+    return log_file_path
+
+
+def get_worker_log_queue():
+    """
+    Returns a multiprocessing queue whose records are written by this process's
+    listener, i.e. to the same log file and console. Pass it to worker processes and
+    call `setup_worker_logging` there (e.g. as a process pool `initializer`).
+
+    Must be called after `setup_logging`.
+    """
+    if _state["worker_queue"] is None:
+        _state["worker_queue"] = multiprocessing.Queue(-1)
+        if _state["listener"] is not None:
+            _state["worker_listener"] = logging.handlers.QueueListener(
+                _state["worker_queue"], *_state["handlers"], respect_handler_level=True
+            )
+            _state["worker_listener"].start()
+    return _state["worker_queue"]
+
+
+def setup_worker_logging(log_queue, stage: Optional[str] = None, run_id: Optional[str] = None):
+    """
+    Configures logging in a worker process to forward every record to the parent's listener.
+
+    Args:
+        log_queue: The queue returned by `get_worker_log_queue` in the parent process.
+        stage (str, optional): Stage name attached to the worker's records.
+        run_id (str, optional): Run ID attached to the worker's records; pass the parent's `get_run_id()`.
+    """
+    if run_id is not None:
+        _state["run_id"] = run_id
+    _install_queue_handler(log_queue, stage=stage or multiprocessing.current_process().name, run_id=get_run_id())
+
+
+def _reset_after_fork():
+    """
+    Re-points logging in a forked child. The child inherits the parent's root QueueHandler,
+    but not the listener thread draining its queue, so its records would be lost.
+
+    Records go to the worker queue when the parent created one (the parent's listener
+    writes them), otherwise straight to stdout. `setup_worker_logging` still overrides this.
+    """
     root_logger = logging.getLogger()
-    if root_logger.hasHandlers():
-        root_logger.handlers.clear()
-
-    # Configure global logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s",
-        handlers=[
-            logging.FileHandler(log_file_path),  # Log to file
-            logging.StreamHandler(sys.stdout)    # Also log to console
-        ]
-    )
+    inherited = [handler for handler in root_logger.handlers if isinstance(handler, _ContextQueueHandler)
+                 and handler.queue is _state["queue"]]
+    if not inherited:
+        return
+
+    filters = [f for f in inherited[0].filters if isinstance(f, ContextFilter)]
+    stage = filters[0].stage if filters else multiprocessing.current_process().name
+    formatter = _state["handlers"][-1].formatter if _state["handlers"] else logging.Formatter(LOG_FORMAT)
+    # The listener threads and the parent's file handlers belong to the parent.
+    _state.update(queue=queue.SimpleQueue(), listener=None, worker_listener=None, handlers=[], settings=None)
+
+    if _state["worker_queue"] is not None:
+        _install_queue_handler(_state["worker_queue"], stage=stage, run_id=get_run_id())
+    else:
+        for handler in list(root_logger.handlers):
+            root_logger.removeHandler(handler)
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(formatter)
+        console_handler.addFilter(ContextFilter(stage=stage, run_id=get_run_id()))
+        root_logger.addHandler(console_handler)
+
+
+atexit.register(_stop_listeners)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,59 @@
+"""
+Test-set metrics, computed the same way wherever predictions are scored: the evaluation
+stage, cross-validation, the hyperparameter sweep, the compact-mode precision report and
+the multi-dataset summary.
+"""
+import numpy as np
+
+
+def regression_metrics(y_true, y_pred) -> dict:
+    """Compute RMSE, MAE and R2 of predictions, in float64.
+
+    Args:
+        y_true (array-like): True target values.
+        y_pred (array-like): Predicted values, one per target value.
+
+    Returns:
+        dict: `rmse`, `mae` and `r2`.
+    """
+    y_true = np.asarray(y_true, dtype=np.float64).ravel()
+    residuals = y_true - np.asarray(y_pred, dtype=np.float64).ravel()
+    squared_error = np.sum(residuals ** 2)
+    return {
+        "rmse": float(np.sqrt(squared_error / len(y_true))),
+        "mae": float(np.mean(np.abs(residuals))),
+        "r2": float(1 - squared_error / np.sum((y_true - y_true.mean()) ** 2)),
+    }
+
+
+def classification_metrics(y_true, y_pred) -> dict:
+    """Compute the accuracy of predicted class labels.
+
+    Args:
+        y_true (array-like): True labels.
+        y_pred (array-like): Predicted labels, one per true label.
+
+    Returns:
+        dict: `accuracy`.
+    """
+    return {"accuracy": float(np.mean(np.asarray(y_pred).ravel() == np.asarray(y_true).ravel()))}
+
+
+def task_type(model) -> str:
+    """Return "classification" for a classifier and "regression" otherwise.
+
+    Reports record it next to their metrics: a classifier is scored by accuracy, so its
+    runs cannot be compared with regressor runs.
+    """
+    from sklearn.base import is_classifier
+
+    return "classification" if is_classifier(model) else "regression"
+
+
+def model_metrics(model, y_true, y_pred) -> dict:
+    """Compute `classification_metrics` for a classifier and `regression_metrics` otherwise."""
+    from sklearn.base import is_classifier
+
+    if is_classifier(model):
+        return classification_metrics(y_true, y_pred)
+    return regression_metrics(y_true, y_pred)
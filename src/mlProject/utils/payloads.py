@@ -0,0 +1,133 @@
+"""
+Binary columnar payloads for batch prediction requests.
+
+Two formats are accepted next to JSON, both carrying the schema feature columns:
+- `.npy` (application/x-npy): a 2-D float32 or float64 matrix whose columns are in the
+  order of schema.yaml. It is wrapped around the request body without copying it.
+- Arrow IPC stream (application/vnd.apache.arrow.stream): a table with one float column
+  per feature, in any order. Requires pyarrow, imported only when such a payload is used.
+"""
+import io
+import numpy as np
+import pandas as pd
+
+
+NPY_CONTENT_TYPE = "application/x-npy"
+ARROW_CONTENT_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError("Arrow payloads require pyarrow: pip install pyarrow") from e
+    return pa
+
+
+def arrow_available() -> bool:
+    """Whether pyarrow can be imported, i.e. whether Arrow payloads can be decoded and encoded."""
+    try:
+        _import_pyarrow()
+    except ImportError:
+        return False
+    return True
+
+
+def decode_npy(body: bytes, feature_columns: list) -> pd.DataFrame:
+    """Decode an `.npy` matrix into a DataFrame that shares the request body's memory.
+
+    Args:
+        body (bytes): The request body, an `.npy` file.
+        feature_columns (list): The schema feature columns, in schema order.
+
+    Raises:
+        ValueError: If the payload is not a non-empty 2-D float32/float64 matrix with one column
+            per feature.
+
+    Returns:
+        pd.DataFrame: The rows, with the feature columns as column names.
+    """
+    stream = io.BytesIO(body)
+    try:
+        version = np.lib.format.read_magic(stream)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(stream)
+        elif version == (2, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(stream)
+        else:
+            raise ValueError(f"unsupported .npy format version {version}")
+    except ValueError as e:
+        raise ValueError(f"Invalid .npy payload: {e}") from e
+
+    if len(shape) == 1:
+        # A single row.
+        shape = (1, shape[0])
+    if len(shape) != 2 or shape[1] != len(feature_columns):
+        raise ValueError(f"Expected a matrix of shape (rows, {len(feature_columns)}), got {shape}.")
+    if shape[0] == 0:
+        raise ValueError("The matrix has no rows.")
+    if dtype not in (np.dtype("<f4"), np.dtype("<f8")):
+        raise ValueError(f"Expected a little-endian float32 or float64 matrix, got {dtype}.")
+
+    count = shape[0] * shape[1]
+    if len(body) - stream.tell() < count * dtype.itemsize:
+        raise ValueError("Truncated .npy payload.")
+    matrix = np.frombuffer(body, dtype=dtype, count=count, offset=stream.tell())
+    matrix = matrix.reshape(shape, order="F" if fortran_order else "C")
+    if not np.isfinite(matrix).all():
+        raise ValueError("The matrix contains NaN or infinite values.")
+    return pd.DataFrame(matrix, columns=feature_columns, copy=False)
+
+
+def encode_npy(predictions: np.ndarray) -> bytes:
+    """Encode predictions as an `.npy` vector."""
+    buffer = io.BytesIO()
+    np.save(buffer, np.ascontiguousarray(predictions).ravel(), allow_pickle=False)
+    return buffer.getvalue()
+
+
+def decode_arrow(body: bytes, feature_columns: list) -> pd.DataFrame:
+    """Decode an Arrow IPC stream into a DataFrame of the feature columns.
+
+    Args:
+        body (bytes): The request body, an Arrow IPC stream.
+        feature_columns (list): The schema feature columns.
+
+    Raises:
+        ValueError: If the stream is invalid or has no rows, a feature column is missing, or one
+            is not a float column without nulls, NaN or infinite values.
+
+    Returns:
+        pd.DataFrame: The rows, with the feature columns in schema order.
+    """
+    pa = _import_pyarrow()
+    try:
+        table = pa.ipc.open_stream(pa.py_buffer(body)).read_all()
+    except pa.ArrowInvalid as e:
+        raise ValueError(f"Invalid Arrow payload: {e}") from e
+    if table.num_rows == 0:
+        raise ValueError("The table has no rows.")
+
+    missing = [column for column in feature_columns if column not in table.column_names]
+    if missing:
+        raise ValueError(f"Missing feature columns: {missing}")
+
+    table = table.select(feature_columns)
+    for field, column in zip(table.schema, table.columns):
+        if not pa.types.is_floating(field.type) or column.null_count:
+            raise ValueError(f"Column {field.name!r} must be float32 or float64 without nulls, got {field.type}.")
+    data = table.to_pandas()
+    if not np.isfinite(data.to_numpy()).all():
+        raise ValueError("The table contains NaN or infinite values.")
+    return data
+
+
+def encode_arrow(predictions: np.ndarray, model_version) -> bytes:
+    """Encode predictions as an Arrow IPC stream with one `prediction` column."""
+    pa = _import_pyarrow()
+    table = pa.table({"prediction": np.ascontiguousarray(predictions).ravel()},
+                     metadata={"model_version": str(model_version)})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
@@ -0,0 +1,93 @@
+import os
+import logging
+from typing import NamedTuple, Optional
+
+
+# Set in worker processes to their thread budget, so that anything running inside a worker
+# (e.g. a stage of the multi-dataset pool) divides that budget instead of the whole machine.
+CORE_BUDGET_ENV = "MLPROJECT_CORE_BUDGET"
+
+# Thread-count variables read by OpenMP, OpenBLAS, MKL and numexpr when they are first loaded.
+_THREAD_ENV_VARS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "NUMEXPR_NUM_THREADS")
+
+# Keeps the threadpoolctl limit of a worker process alive for the worker's lifetime.
+_worker_limits = []
+
+
+class CoreAllocation(NamedTuple):
+    """Worker processes (or threads) of a stage and the BLAS/OpenMP/n_jobs threads each may use."""
+    workers: int
+    threads_per_worker: int
+    total_cores: int
+
+
+def available_cores() -> int:
+    """
+    Returns the number of cores this process may use: its core budget when it runs as a
+    worker, otherwise the cores of its CPU affinity mask (cgroup/taskset aware on Linux).
+    """
+    budget = os.environ.get(CORE_BUDGET_ENV)
+    if budget:
+        return max(1, int(budget))
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def allocate_cores(stage: str, max_workers: int, n_tasks: Optional[int] = None,
+                   total_cores: Optional[int] = None) -> CoreAllocation:
+    """
+    Splits the core budget between the workers of a stage and logs the allocation.
+
+    Workers are capped by the core budget and the number of tasks; the cores are then
+    divided evenly, so that workers x threads_per_worker never exceeds the budget.
+
+    Args:
+        stage (str): Stage name, for the log line.
+        max_workers (int): Workers the stage is configured for.
+        n_tasks (int, optional): Units of work, e.g. folds or datasets; no more workers than tasks.
+        total_cores (int, optional): Cores for the stage (`resources.total_cores`). Defaults to,
+            and is capped by, `available_cores()`.
+
+    Returns:
+        CoreAllocation: The effective number of workers and threads per worker.
+    """
+    cores = available_cores()
+    total = min(total_cores, cores) if total_cores else cores
+    workers = max(1, min(max_workers or 1, total, n_tasks or total))
+    allocation = CoreAllocation(workers=workers, threads_per_worker=max(1, total // workers), total_cores=total)
+    logging.info(f"{stage}: {allocation.workers} workers x {allocation.threads_per_worker} threads "
+                 f"on a budget of {allocation.total_cores} cores")
+    return allocation
+
+
+def limit_threads(threads: int):
+    """
+    Caps the BLAS and OpenMP thread pools of this process, e.g. `with limit_threads(4): model.fit(...)`.
+
+    Args:
+        threads (int): Maximum threads per native thread pool.
+
+    Returns:
+        threadpoolctl.threadpool_limits: Restores the previous limits when used as a context manager.
+    """
+    from threadpoolctl import threadpool_limits
+
+    return threadpool_limits(limits=threads)
+
+
+def init_worker_threads(threads: int):
+    """
+    Applies a thread budget to the whole of a worker process. Use as (or call from) a pool initializer.
+
+    Native pools already loaded (forked workers inherit numpy's) are capped with threadpoolctl;
+    the environment variables cover libraries loaded later, and `available_cores()` in the
+    worker returns the budget.
+
+    Args:
+        threads (int): Threads the worker may use.
+    """
+    os.environ[CORE_BUDGET_ENV] = str(threads)
+    for name in _THREAD_ENV_VARS:
+        os.environ[name] = str(threads)
+    _worker_limits.append(limit_threads(threads))
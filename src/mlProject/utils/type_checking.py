@@ -0,0 +1,177 @@
+import os
+import types
+import inspect
+from functools import wraps
+from typing import Any, Callable, Optional, Union, get_args, get_origin, get_type_hints
+
+
+DISABLE_ENV_VAR = "MLPROJECT_DISABLE_TYPE_CHECKS"
+
+
+def _type_name(expected: Any) -> str:
+    return getattr(expected, "__name__", None) or str(expected)
+
+
+def _build_checker(expected: Any) -> Optional[Callable[[str, Any], None]]:
+    """
+    Compiles a type annotation into a checker function once, at decoration time.
+
+    Supports plain classes, Any, Union/Optional (including `X | Y`), List[...],
+    Dict[...] and Tuple[...]. Returns None when nothing needs to be checked.
+    """
+    if expected is Any or expected is inspect.Parameter.empty:
+        return None
+    if expected is None or expected is type(None):
+        expected = type(None)
+
+    origin = get_origin(expected)
+    args = get_args(expected)
+
+    if origin is Union or (hasattr(types, "UnionType") and origin is types.UnionType):
+        checkers = [_build_checker(arg) for arg in args]
+        if any(checker is None for checker in checkers):
+            return None
+
+        # Fast path: Optional[Path], Union[int, str] ... reduce to one isinstance call.
+        if all(get_origin(arg) is None for arg in args):
+            classes = tuple(type(None) if arg is None else arg for arg in args)
+
+            def check_union(name, value):
+                if not isinstance(value, classes):
+                    raise TypeError(f"Argument '{name}' must be one of {[_type_name(c) for c in classes]}, "
+                                    f"but got {type(value).__name__}.")
+            return check_union
+
+        def check_union(name, value):
+            for checker in checkers:
+                try:
+                    checker(name, value)
+                    return
+                except TypeError:
+                    continue
+            raise TypeError(f"Argument '{name}' must be one of {[_type_name(arg) for arg in args]}, "
+                            f"but got {type(value).__name__}.")
+        return check_union
+
+    if origin in (list, set, frozenset):
+        item_checker = _build_checker(args[0]) if args else None
+
+        def check_collection(name, value):
+            if not isinstance(value, origin):
+                raise TypeError(f"Argument '{name}' must be {origin.__name__}, but got {type(value).__name__}.")
+            if item_checker is not None:
+                for i, item in enumerate(value):
+                    item_checker(f"{name}[{i}]", item)
+        return check_collection
+
+    if origin is dict:
+        key_checker = _build_checker(args[0]) if args else None
+        value_checker = _build_checker(args[1]) if args else None
+
+        def check_dict(name, value):
+            if not isinstance(value, dict):
+                raise TypeError(f"Argument '{name}' must be dict, but got {type(value).__name__}.")
+            if key_checker is not None or value_checker is not None:
+                for key, item in value.items():
+                    if key_checker is not None:
+                        key_checker(f"{name} key", key)
+                    if value_checker is not None:
+                        value_checker(f"{name}[{key!r}]", item)
+        return check_dict
+
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            item_checkers = None
+            repeated_checker = _build_checker(args[0])
+        else:
+            item_checkers = [_build_checker(arg) for arg in args]
+            repeated_checker = None
+
+        def check_tuple(name, value):
+            if not isinstance(value, tuple):
+                raise TypeError(f"Argument '{name}' must be tuple, but got {type(value).__name__}.")
+            if repeated_checker is not None:
+                for i, item in enumerate(value):
+                    repeated_checker(f"{name}[{i}]", item)
+            elif item_checkers:
+                if len(value) != len(item_checkers):
+                    raise TypeError(f"Argument '{name}' must have {len(item_checkers)} items, but got {len(value)}.")
+                for i, (item, checker) in enumerate(zip(value, item_checkers)):
+                    if checker is not None:
+                        checker(f"{name}[{i}]", item)
+        return check_tuple
+
+    if origin is not None:
+        # Other generics (Iterable[...], Callable[...], ...): only check the container type.
+        expected = origin
+    if not isinstance(expected, type):
+        return None
+
+    def check_instance(name, value):
+        if not isinstance(value, expected):
+            raise TypeError(f"Argument '{name}' must be {expected.__name__}, but got {type(value).__name__}.")
+    return check_instance
+
+
+def ensure_annotations(func: Callable) -> Callable:
+    """
+    Decorator that enforces a function's type annotations at runtime.
+
+    The signature and the type hints are resolved once, when the function is
+    decorated, and compiled into one checker per annotated parameter, so a call
+    only runs the isinstance checks. Setting the environment variable
+    `MLPROJECT_DISABLE_TYPE_CHECKS=1` before import returns the original function
+    untouched, for zero overhead.
+
+    Raises:
+        TypeError: At call time, if an argument or the return value does not match its annotation.
+    """
+    if os.environ.get(DISABLE_ENV_VAR, "").lower() in ("1", "true", "yes"):
+        return func
+
+    signature = inspect.signature(func)
+    parameters = list(signature.parameters.values())
+    positional_names = [
+        p.name for p in parameters
+        if p.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    ]
+    compiled = {}
+
+    def compile_checkers():
+        type_hints = get_type_hints(func)
+        checkers = {}
+        for name, hint in type_hints.items():
+            checker = _build_checker(hint)
+            if checker is not None:
+                checkers[name] = checker
+        return checkers
+
+    try:
+        compiled.update(checkers=compile_checkers())
+    except NameError:
+        # Forward references that are not defined yet are resolved on the first call.
+        pass
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        checkers = compiled.get("checkers")
+        if checkers is None:
+            checkers = compiled.setdefault("checkers", compile_checkers())
+
+        for name, value in zip(positional_names, args):
+            checker = checkers.get(name)
+            if checker is not None:
+                checker(name, value)
+        for name, value in kwargs.items():
+            checker = checkers.get(name)
+            if checker is not None:
+                checker(name, value)
+
+        result = func(*args, **kwargs)
+
+        return_checker = checkers.get("return")
+        if return_checker is not None:
+            return_checker("return", result)
+        return result
+
+    return wrapper
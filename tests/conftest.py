@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Lets the tests run from a checkout without `pip install -e .`.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
@@ -0,0 +1,63 @@
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
+from mlProject.components.batch_scorer import BatchScorer
+from mlProject.entity.config_entity import BatchScoringConfig
+from mlProject.utils.common import save_joblib
+
+
+FEATURES = ["a", "b"]
+
+
+@pytest.fixture
+def scorer(tmp_path):
+    train = pd.DataFrame({"a": [0.0, 1.0, 2.0, 3.0], "b": [1.0, 0.0, 1.0, 0.0]})
+    model = LinearRegression().fit(train, train["a"] * 2 + train["b"])
+    model_path = tmp_path / "model.joblib"
+    save_joblib(model_path, model)
+    config = BatchScoringConfig(root_dir=tmp_path / "reports", model_path=model_path, feature_columns=FEATURES,
+                                feature_dtype="float64", chunk_size=3, max_workers=1, max_pending_chunks=2,
+                                passthrough_columns=["id"], report_interval=60.0, total_cores=1)
+    return BatchScorer(config)
+
+
+def _write_input(path: Path, n_rows: int = 10) -> pd.DataFrame:
+    data = pd.DataFrame({"id": range(n_rows), "a": np.arange(n_rows, dtype=float), "b": np.ones(n_rows)})
+    data.to_csv(path, index=False)
+    return data
+
+
+def test_scores_csv_in_input_order(scorer, tmp_path):
+    data = _write_input(tmp_path / "input.csv")
+
+    report = scorer.run(tmp_path / "input.csv", tmp_path / "preds.csv")
+
+    output = pd.read_csv(tmp_path / "preds.csv")
+    assert report["rows"] == len(data)
+    assert output["id"].tolist() == data["id"].tolist()
+    np.testing.assert_allclose(output["prediction"], data["a"] * 2 + data["b"])
+
+
+def test_scores_to_parquet(scorer, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    data = _write_input(tmp_path / "input.csv")
+
+    scorer.run(tmp_path / "input.csv", tmp_path / "preds.parquet")
+
+    # Read back as Parquet: the format follows the output path, not the temporary file.
+    output = pq.read_table(tmp_path / "preds.parquet").to_pandas()
+    assert output.columns.tolist() == ["id", "prediction"]
+    np.testing.assert_allclose(output["prediction"], data["a"] * 2 + data["b"])
+
+
+def test_non_numeric_feature_names_the_rows(scorer, tmp_path):
+    data = _write_input(tmp_path / "input.csv")
+    data["a"] = data["a"].astype(object)
+    data.loc[7, "a"] = "abc"
+    data.to_csv(tmp_path / "input.csv", index=False)
+
+    with pytest.raises(ValueError, match="rows 6-8"):
+        scorer.run(tmp_path / "input.csv", tmp_path / "preds.csv")
+    assert not (tmp_path / "preds.csv").exists()
@@ -0,0 +1,27 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import ElasticNet
+from mlProject.components.cross_validation import GramCrossValidator
+from mlProject.entity.config_entity import CrossValidationConfig
+from mlProject.utils.metrics import regression_metrics
+
+
+def test_folds_match_elasticnet_with_intercept(tmp_path):
+    rng = np.random.default_rng(0)
+    X = rng.normal(loc=3.0, size=(300, 4))
+    y = X @ np.array([0.5, -1.0, 0.0, 2.0]) + 5 + rng.normal(scale=0.3, size=300)
+    data = pd.DataFrame(X, columns=["a", "b", "c", "d"]).assign(target=y)
+    data.to_csv(tmp_path / "train.csv", index=False)
+    config = CrossValidationConfig(root_dir=tmp_path, train_data_path=tmp_path / "train.csv", target_column="target",
+                                   n_splits=3, max_workers=2, random_state=7, alpha=0.05, l1_ratio=0.3, total_cores=1)
+
+    report = GramCrossValidator(config).run()
+
+    fold_ids = np.random.default_rng(7).permutation(np.arange(300) % 3)
+    for fold in report["folds"]:
+        train = fold_ids != fold["fold"]
+        reference = ElasticNet(alpha=0.05, l1_ratio=0.3, random_state=42, tol=1e-10, max_iter=100_000).fit(X[train], y[train])
+        expected = regression_metrics(y[~train], reference.predict(X[~train]))
+        assert fold["rmse"] == pytest.approx(expected["rmse"], rel=1e-4)
+        assert fold["r2"] == pytest.approx(expected["r2"], rel=1e-4)
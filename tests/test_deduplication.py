@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+from mlProject.components.data_transformation import DataTransformation
+from mlProject.components.incremental_ingestion import IncrementalIngestion
+from mlProject.entity.config_entity import DataTransformationConfig, IncrementalIngestionConfig
+from mlProject.utils.deduplication import RowHashSet, drop_duplicate_rows, row_hashes
+
+
+SCHEMA = {"x": "float64", "y": "int64"}
+
+
+def test_row_hashes_in_schema_dtypes():
+    whole = pd.DataFrame({"x": [7, 8], "y": [1, 2]})
+    decimal = pd.DataFrame({"x": [7.0, 8.0], "y": [1, 2]})
+
+    assert not np.array_equal(row_hashes(whole), row_hashes(decimal))
+    assert np.array_equal(row_hashes(whole, SCHEMA), row_hashes(decimal, SCHEMA))
+
+
+def test_loads_only_the_partitions_a_batch_touches(tmp_path):
+    stored = RowHashSet(16)
+    stored.add(np.arange(1000, dtype=np.uint64))
+    stored.save(tmp_path)
+
+    reloaded = RowHashSet.load(tmp_path, 16)
+    is_new = reloaded.add(np.array([3, 19, 5000], dtype=np.uint64))
+
+    assert is_new.tolist() == [False, False, True]
+    # 3 and 19 share partition 3; 5000 falls into partition 8.
+    assert sorted(reloaded.partitions) == [3, 8]
+    assert reloaded.changed_partitions() == [8]
+    assert len(reloaded) == 1001
+
+
+def test_refuses_another_partition_count(tmp_path):
+    RowHashSet(16).save(tmp_path)
+
+    with pytest.raises(ValueError, match="16 partitions"):
+        RowHashSet.load(tmp_path, 8)
+
+
+def test_cross_batch_dedup_with_mixed_dtypes(tmp_path):
+    delta = tmp_path / "delta.csv"
+    ingestion = IncrementalIngestion(IncrementalIngestionConfig(
+        enabled=True, landing_dir=tmp_path / "landing", pattern="*.csv", watermark_file=tmp_path / "watermark.json",
+        delta_path=delta, store_path=tmp_path / "store.csv"))
+    transformation = DataTransformation(DataTransformationConfig(
+        root_dir=tmp_path, data_path=delta, incremental=True, store_path=tmp_path / "store.csv",
+        deduplicate=True, hash_partitions=4, all_schema=SCHEMA))
+
+    # The first batch holds only whole numbers in the float column, so it parses as int64.
+    for rows in ({"x": [7, 8, 9], "y": [1, 2, 3]}, {"x": [7.0, 8.5], "y": [1, 2]}):
+        ingestion.collect_new_batches()
+        pd.DataFrame(rows).to_csv(delta, index=False)
+        transformation.append_batch(ingestion)
+
+    store = pd.read_csv(tmp_path / "store.csv")
+    assert store["x"].tolist() == [7, 8, 9, 8.5]
+
+
+def test_drop_duplicate_rows_within_a_batch():
+    data = pd.DataFrame({"x": [1.0, 1.0, 2.0], "y": [1, 1, 1]})
+
+    deduplicated, dropped = drop_duplicate_rows(data, dtypes=SCHEMA)
+
+    assert dropped == 1
+    assert deduplicated["x"].tolist() == [1.0, 2.0]
@@ -0,0 +1,130 @@
+import os
+import pandas as pd
+import pytest
+from mlProject.components.data_transformation import DataTransformation
+from mlProject.components.data_validation import DataValidation
+from mlProject.components.incremental_ingestion import IncrementalIngestion
+from mlProject.entity.config_entity import (DataTransformationConfig, DataValidationConfig,
+                                            IncrementalIngestionConfig)
+
+
+SCHEMA = {"x": "float64", "y": "int64"}
+
+
+@pytest.fixture
+def stages(tmp_path):
+    (tmp_path / "landing").mkdir()
+    (tmp_path / "splits").mkdir()
+    delta = tmp_path / "delta.csv"
+    ingestion = IncrementalIngestion(IncrementalIngestionConfig(
+        enabled=True, landing_dir=tmp_path / "landing", pattern="*.csv", watermark_file=tmp_path / "watermark.json",
+        delta_path=delta, store_path=tmp_path / "store.csv", all_schema=SCHEMA))
+    validation = DataValidation(DataValidationConfig(root_dir=tmp_path, STATUS_FILE=tmp_path / "status.txt",
+                                                     unzip_data_dir=delta, all_schema=SCHEMA))
+    transformation = DataTransformation(DataTransformationConfig(
+        root_dir=tmp_path / "splits", data_path=delta, incremental=True, store_path=tmp_path / "store.csv",
+        deduplicate=True, hash_partitions=4, all_schema=SCHEMA))
+    return ingestion, validation, transformation
+
+
+def _land(tmp_path, text: str):
+    with open(tmp_path / "landing" / "data.csv", "a", encoding="utf-8") as f:
+        f.write(text)
+
+
+def _split_rows(tmp_path) -> int:
+    return sum(len(pd.read_csv(tmp_path / "splits" / name)) for name in ("train.csv", "test.csv"))
+
+
+def test_integer_only_delta_is_committed(stages, tmp_path):
+    ingestion, validation, transformation = stages
+    # Whole numbers only: without the schema, x would parse as int64.
+    _land(tmp_path, "x,y\n1,1\n2,2\n3,3\n4,4\n")
+
+    assert ingestion.collect_new_batches() == 4
+    assert str(pd.read_csv(tmp_path / "delta.csv")["x"].dtype) == "float64"
+    assert validation.validate_data()
+    transformation.append_batch(ingestion)
+
+    assert ingestion.load_watermark()["files"]["data.csv"]["offset"] == len("x,y\n1,1\n2,2\n3,3\n4,4\n")
+    assert not ingestion.pending_watermark_file.exists()
+    assert _split_rows(tmp_path) == 4
+
+
+def test_retry_after_a_failed_append_stores_the_batch_once(stages, tmp_path, monkeypatch):
+    ingestion, validation, transformation = stages
+    _land(tmp_path, "x,y\n1.5,1\n2.5,2\n")
+    ingestion.collect_new_batches()
+    transformation.append_batch(ingestion)
+    _land(tmp_path, "3.5,3\n4.5,4\n5.5,5\n6.5,6\n")
+    ingestion.collect_new_batches()
+
+    # Fail after the store and train.csv have been appended to, before test.csv.
+    append_csv = DataTransformation._append_csv
+
+    def failing_append(frame, path):
+        if str(path).endswith("test.csv"):
+            raise OSError("disk full")
+        append_csv(frame, path)
+
+    monkeypatch.setattr(DataTransformation, "_append_csv", staticmethod(failing_append))
+    with pytest.raises(OSError):
+        transformation.append_batch(ingestion)
+    monkeypatch.undo()
+    assert len(pd.read_csv(tmp_path / "store.csv")) == 6
+
+    # The next run collects the same rows again and rolls back the partial append first.
+    assert ingestion.collect_new_batches() == 4
+    transformation.append_batch(ingestion)
+
+    store = pd.read_csv(tmp_path / "store.csv")
+    assert store["x"].tolist() == [1.5, 2.5, 3.5, 4.5, 5.5, 6.5]
+    assert _split_rows(tmp_path) == 6
+    assert not (tmp_path / "splits" / "append_journal.json").exists()
+    assert not list((tmp_path / "splits" / "store_hashes").glob("*.bak"))
+
+
+def test_batch_committed_before_the_journal_was_removed(stages, tmp_path):
+    ingestion, validation, transformation = stages
+    _land(tmp_path, "x,y\n1.5,1\n2.5,2\n")
+    ingestion.collect_new_batches()
+    transformation.append_batch(ingestion)
+    # As if the run had stopped right after committing the watermark.
+    (tmp_path / "splits" / "append_journal.json").write_text(
+        '{"batch_id": "%s", "sizes": {}, "hashes_dir": null, "partitions": {}}' % ingestion.committed_batch_id())
+
+    ingestion.collect_new_batches()
+    transformation.append_batch(ingestion)
+
+    assert len(pd.read_csv(tmp_path / "store.csv")) == 2
+    assert not (tmp_path / "splits" / "append_journal.json").exists()
+
+
+def test_rewritten_file_is_ingested_from_the_start(stages, tmp_path):
+    ingestion, _, _ = stages
+    _land(tmp_path, "x,y\n1.5,1\n2.5,2\n")
+    ingestion.collect_new_batches()
+    ingestion.commit_watermark()
+    mtime_ns = ingestion.load_watermark()["files"]["data.csv"]["mtime_ns"]
+
+    path = tmp_path / "landing" / "data.csv"
+    path.write_text("x,y\n7.5,7\n8.5,8\n9.5,9\n", encoding="utf-8")
+    os.utime(path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+
+    assert ingestion.collect_new_batches() == 3
+    assert pd.read_csv(tmp_path / "delta.csv")["y"].tolist() == [7, 8, 9]
+
+
+def test_appended_file_is_read_past_its_watermark(stages, tmp_path):
+    ingestion, _, _ = stages
+    _land(tmp_path, "x,y\n1.5,1\n2.5,2\n")
+    ingestion.collect_new_batches()
+    ingestion.commit_watermark()
+
+    _land(tmp_path, "3.5,3\n")
+    path = tmp_path / "landing" / "data.csv"
+    mtime_ns = path.stat().st_mtime_ns
+    os.utime(path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+
+    assert ingestion.collect_new_batches() == 1
+    assert pd.read_csv(tmp_path / "delta.csv")["y"].tolist() == [3]
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression, LogisticRegression
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+from mlProject.utils.metrics import model_metrics, regression_metrics
+
+
+def test_regression_metrics_match_sklearn():
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(3, 9, size=200)
+    y_pred = y_true + rng.normal(scale=0.5, size=200).astype(np.float32)
+
+    metrics = regression_metrics(y_true, y_pred)
+
+    assert metrics["rmse"] == pytest.approx(np.sqrt(mean_squared_error(y_true, y_pred)))
+    assert metrics["mae"] == pytest.approx(mean_absolute_error(y_true, y_pred))
+    assert metrics["r2"] == pytest.approx(r2_score(y_true, y_pred))
+
+
+def test_model_metrics_follow_the_task():
+    X = np.array([[0.0], [1.0], [2.0], [3.0]])
+    y = np.array([0, 0, 1, 1])
+
+    assert set(model_metrics(LinearRegression(), y, y)) == {"rmse", "mae", "r2"}
+    assert model_metrics(LogisticRegression().fit(X, y), y, [0, 1, 1, 1]) == {"accuracy": 0.75}
@@ -0,0 +1,106 @@
+import os
+import threading
+import time
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
+from mlProject.components import model_pool
+from mlProject.components.model_pool import ModelPool, UnknownModelError
+from mlProject.entity.config_entity import ModelPoolConfig
+from mlProject.utils.common import save_joblib
+
+
+FEATURES = ["a", "b"]
+
+
+def _save_model(root, name: str, slope: float):
+    data = pd.DataFrame({"a": [0.0, 1.0, 2.0], "b": [0.0, 0.0, 1.0]})
+    save_joblib(root / name / "model.joblib", LinearRegression().fit(data, data["a"] * slope))
+
+
+def _pool(root, **overrides) -> ModelPool:
+    settings = dict(model_root=root, model_file="model.joblib", max_models=4, max_memory_mb=64.0,
+                    feature_columns=FEATURES, mmap_mode=None, poll_interval=60.0, warmup=True)
+    settings.update(overrides)
+    return ModelPool(ModelPoolConfig(**settings))
+
+
+def _predict(served) -> float:
+    return float(served.model.predict(pd.DataFrame([[1.0, 0.0]], columns=FEATURES))[0])
+
+
+def test_concurrent_cold_requests_share_one_load(tmp_path, monkeypatch):
+    _save_model(tmp_path, "m1", 2.0)
+    loads = []
+    load_joblib = model_pool.load_joblib
+
+    def slow_load(*args, **kwargs):
+        loads.append(args[0])
+        time.sleep(0.3)
+        return load_joblib(*args, **kwargs)
+
+    monkeypatch.setattr(model_pool, "load_joblib", slow_load)
+    pool = _pool(tmp_path)
+    barrier = threading.Barrier(5)
+    results = []
+
+    def request():
+        barrier.wait()
+        results.append(pool.get("m1"))
+
+    threads = [threading.Thread(target=request) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = pool.stats()["models"]["m1"]
+    assert len(loads) == 1
+    assert stats["loads"] == 1 and stats["coalesced"] + stats["hits"] == 4
+    assert len({id(served.model) for served in results}) == 1
+
+
+def test_evicts_the_least_recently_used_model(tmp_path):
+    for name in ("m1", "m2", "m3"):
+        _save_model(tmp_path, name, 1.0)
+    pool = _pool(tmp_path, max_models=2)
+
+    pool.get("m1")
+    pool.get("m2")
+    pool.get("m1")
+    pool.get("m3")
+
+    stats = pool.stats()
+    assert stats["loaded_models"] == 2
+    assert stats["evictions"] == 1
+    assert not stats["models"]["m2"]["loaded"]
+    # An evicted model is loaded again on its next request, with the same version.
+    assert pool.get("m2").version == 1
+    assert pool.stats()["models"]["m2"]["loads"] == 2
+
+
+def test_reloads_a_changed_model_file(tmp_path):
+    _save_model(tmp_path, "m1", 2.0)
+    pool = _pool(tmp_path, poll_interval=0.0)
+    first = pool.get("m1")
+
+    _save_model(tmp_path, "m1", 3.0)
+    path = tmp_path / "m1" / "model.joblib"
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = pool.get("m1")
+
+    assert (first.version, second.version) == (1, 2)
+    assert _predict(first) == pytest.approx(2.0)
+    assert _predict(second) == pytest.approx(3.0)
+    # Unchanged since: the loaded model is served as it is.
+    assert pool.get("m1") is second
+
+
+def test_unknown_and_invalid_names(tmp_path):
+    pool = _pool(tmp_path)
+
+    with pytest.raises(UnknownModelError):
+        pool.get("missing")
+    with pytest.raises(UnknownModelError):
+        pool.get("../m1")
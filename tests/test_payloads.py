@@ -0,0 +1,32 @@
+import io
+import numpy as np
+import pytest
+from mlProject.utils.payloads import decode_npy
+
+
+FEATURES = ["a", "b", "c"]
+
+
+def _npy(matrix):
+    buffer = io.BytesIO()
+    np.save(buffer, matrix, allow_pickle=False)
+    return buffer.getvalue()
+
+
+def test_decode_npy_shares_the_rows():
+    matrix = np.arange(6, dtype=np.float64).reshape(2, 3)
+
+    data = decode_npy(_npy(matrix), FEATURES)
+
+    assert list(data.columns) == FEATURES
+    np.testing.assert_array_equal(data.to_numpy(), matrix)
+
+
+def test_decode_npy_rejects_an_empty_matrix():
+    with pytest.raises(ValueError, match="no rows"):
+        decode_npy(_npy(np.empty((0, 3), dtype=np.float32)), FEATURES)
+
+
+def test_decode_npy_rejects_non_finite_values():
+    with pytest.raises(ValueError, match="NaN"):
+        decode_npy(_npy(np.array([[1.0, np.nan, 2.0]])), FEATURES)
@@ -0,0 +1,75 @@
+import zipfile
+import pandas as pd
+import pytest
+from mlProject.components.data_ingestion import DataIngestion
+from mlProject.components.data_transformation import DataTransformation
+from mlProject.components.data_validation import DataValidation
+from mlProject.components.streaming_pipeline import StreamingPipeline
+from mlProject.entity.config_entity import (DataIngestionConfig, DataTransformationConfig, DataValidationConfig,
+                                            StreamingConfig)
+
+
+SCHEMA = {"x": "float64", "y": "int64"}
+
+
+def _pipeline(tmp_path, csv_text: str, block_size: int) -> StreamingPipeline:
+    archive = tmp_path / "data.zip"
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        zip_file.writestr("data.csv", csv_text)
+    (tmp_path / "validation").mkdir()
+    (tmp_path / "transformation").mkdir()
+    return StreamingPipeline(
+        config=StreamingConfig(member="data.csv", block_size=block_size, queue_size=2),
+        data_ingestion=DataIngestion(DataIngestionConfig(root_dir=tmp_path, source_url="", local_data_dir=archive,
+                                                         unzip_dir=tmp_path / "extracted")),
+        data_validation=DataValidation(DataValidationConfig(root_dir=tmp_path / "validation",
+                                                            STATUS_FILE=tmp_path / "validation" / "status.txt",
+                                                            unzip_data_dir=tmp_path / "extracted" / "data.csv",
+                                                            all_schema=SCHEMA)),
+        data_transformation=DataTransformation(DataTransformationConfig(root_dir=tmp_path / "transformation",
+                                                                        data_path=tmp_path / "extracted" / "data.csv",
+                                                                        deduplicate=True)),
+    )
+
+
+def _csv(rows: list) -> str:
+    return "x,y\n" + "".join(f"{x},{y}\n" for x, y in rows)
+
+
+def test_splits_every_row_once(tmp_path):
+    # Whole numbers in the float column, and one duplicate row.
+    rows = [(float(i) if i % 2 else i, i % 3) for i in range(200)] + [(1.0, 1)]
+    pipeline = _pipeline(tmp_path, _csv(rows), block_size=64)
+
+    assert pipeline.run()
+
+    train = pd.read_csv(tmp_path / "transformation" / "train.csv")
+    test = pd.read_csv(tmp_path / "transformation" / "test.csv")
+    assert len(train) + len(test) == 200
+    assert sorted(pd.concat([train, test])["x"]) == [float(i) for i in range(200)]
+
+
+def test_block_with_only_the_header(tmp_path):
+    # Smaller than the header line plus one row: the first block holds only the header.
+    pipeline = _pipeline(tmp_path, _csv([(0.5, 1), (1.5, 2), (2.5, 3)]), block_size=4)
+
+    assert pipeline.run()
+
+    rows = len(pd.read_csv(tmp_path / "transformation" / "train.csv")) + \
+        len(pd.read_csv(tmp_path / "transformation" / "test.csv"))
+    assert rows == 3
+
+
+def test_aborts_on_a_bad_chunk_and_keeps_the_splits(tmp_path):
+    rows = [(i + 0.5, i % 3) for i in range(500)]
+    rows[400] = ("abc", 1)
+    pipeline = _pipeline(tmp_path, _csv(rows), block_size=256)
+    previous_train = tmp_path / "transformation" / "train.csv"
+    previous_train.write_text("x,y\n0.5,0\n")
+
+    assert not pipeline.run()
+
+    assert "False" in (tmp_path / "validation" / "status.txt").read_text()
+    assert previous_train.read_text() == "x,y\n0.5,0\n"
+    assert not list((tmp_path / "transformation").glob("*.tmp"))
+    assert not (tmp_path / "transformation" / "test.csv").exists()